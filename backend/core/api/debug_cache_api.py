@@ -1,7 +1,7 @@
 import os
 
 from core.constants import GraphQLCacheKey
-from core.utils.redis_cache import CachePrefix, _generate_cache_key, redis_cache_get
+from core.utils.redis_cache import CachePrefix, _generate_cache_key, get_local_cache_stats, redis_cache_get
 from django.core.cache import caches
 from django.http import JsonResponse
 
@@ -53,4 +53,6 @@ def debug_cache_keys(request):
     except Exception as e:
         debug_info["existing_cache_keys"] = f"ERROR: {e!s}"
 
+    debug_info["l1_cache"] = get_local_cache_stats()
+
     return JsonResponse(debug_info, json_dumps_params={"indent": 2})
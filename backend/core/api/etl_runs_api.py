@@ -0,0 +1,81 @@
+import re
+from collections import defaultdict
+from typing import Any
+
+from core.api.response_utils import ResponseStatus, create_response
+from core.models.etl import EtlRunModel
+from django.http import HttpRequest, JsonResponse
+
+DEFAULT_RUN_LIMIT = 10
+MAX_RUN_LIMIT = 100
+# Run errors are public: query strings may carry API keys (requests puts the full URL in HTTPError messages)
+MAX_ERROR_LENGTH = 500
+URL_QUERY_PATTERN = re.compile(r"(https?://[^\s?#'\"]+)\?[^\s'\"]*")
+
+
+def summarize_stages(run: EtlRunModel) -> dict[str, dict[str, Any]]:
+    """Stage checkpoints grouped by kind ("tracks:pop" -> "tracks"): count, total/max seconds and rows."""
+    summary: defaultdict[str, dict[str, Any]] = defaultdict(
+        lambda: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "rows": 0}
+    )
+    for checkpoint in run.checkpoints.all():
+        stage_summary = summary[checkpoint.stage.split(":", 1)[0]]
+        duration = checkpoint.duration_seconds or 0.0
+        stage_summary["count"] += 1
+        stage_summary["total_seconds"] += duration
+        stage_summary["max_seconds"] = max(stage_summary["max_seconds"], duration)
+        stage_summary["rows"] += checkpoint.row_count or 0
+    return dict(summary)
+
+
+def serialize_etl_run(run: EtlRunModel) -> dict[str, Any]:
+    http_stats = run.http_stats or {}
+    return {
+        "id": run.id,
+        "pipeline": run.pipeline,
+        "status": run.status,
+        "force_refresh": run.force_refresh,
+        "full_rebuild": run.full_rebuild,
+        "error": redact_run_error(run.error),
+        "started_at": run.started_at.isoformat(),
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+        "duration_seconds": run.duration_seconds,
+        "db_query_count": run.db_query_count,
+        "http_requests": sum(host_stats["requests"] for host_stats in http_stats.values()),
+        "http_bytes": sum(host_stats["bytes"] for host_stats in http_stats.values()),
+        "http_stats": http_stats,
+        "external_calls": run.external_calls or {},
+        "stages": summarize_stages(run),
+    }
+
+
+def redact_run_error(error: str) -> str:
+    """Drop URL query strings from a run's error and truncate it for the public API."""
+    redacted = URL_QUERY_PATTERN.sub(r"\1?[redacted]", error)
+    if len(redacted) > MAX_ERROR_LENGTH:
+        return f"{redacted[:MAX_ERROR_LENGTH]}..."
+    return redacted
+
+
+def get_recent_etl_runs(pipeline: str, limit: int = DEFAULT_RUN_LIMIT) -> list[dict[str, Any]]:
+    """The last limit runs of a pipeline, newest first, with their stage summaries."""
+    runs = EtlRunModel.objects.filter(pipeline=pipeline).prefetch_related("checkpoints").order_by("-id")[:limit]
+    return [serialize_etl_run(run) for run in runs]
+
+
+def list_etl_runs(request: HttpRequest) -> JsonResponse:
+    """Recent ETL runs with timings and external call accounting: /api/etl-runs/?pipeline=playlist_etl&limit=10"""
+    pipeline = request.GET.get("pipeline", EtlRunModel.PIPELINE_PLAYLIST_ETL)
+    valid_pipelines = [choice for choice, _label in EtlRunModel.PIPELINE_CHOICES]
+    if pipeline not in valid_pipelines:
+        return create_response(ResponseStatus.ERROR, f"Unknown pipeline, expected one of {valid_pipelines}", None)
+
+    try:
+        limit = min(int(request.GET.get("limit", DEFAULT_RUN_LIMIT)), MAX_RUN_LIMIT)
+    except ValueError:
+        return create_response(ResponseStatus.ERROR, "limit must be an integer", None)
+    if limit < 1:
+        return create_response(ResponseStatus.ERROR, "limit must be at least 1", None)
+
+    runs = get_recent_etl_runs(pipeline, limit)
+    return create_response(ResponseStatus.SUCCESS, f"Last {len(runs)} {pipeline} runs", {"runs": runs})
@@ -3,6 +3,7 @@ import logging
 import requests
 from core.api.response_utils import ResponseStatus, create_response
 from core.utils.cloudflare_cache import CloudflareKVCache
+from core.utils.http_client import http_get
 from django.http import HttpRequest, JsonResponse
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ def get_edm_events(request: HttpRequest) -> JsonResponse:
         return create_response(ResponseStatus.SUCCESS, "EDM events data retrieved from cache", cached_data)
 
     try:
-        response = requests.get(EDM_EVENTS_GITHUB_URL, timeout=30)
+        response = http_get(EDM_EVENTS_GITHUB_URL, timeout=30)
         response.raise_for_status()
         data = response.json()
 
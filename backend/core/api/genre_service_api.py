@@ -1,10 +1,11 @@
 from datetime import datetime
 
-from core.constants import GenreName, ServiceName
+from core.api.play_count import get_track_play_counts_by_isrcs
+from core.constants import RANKED_SERVICES, GenreName, ServiceName
 from core.models import GenreModel, ServiceModel, ServiceTrackModel
 from core.models.playlist import PlaylistModel, RankModel, RawPlaylistDataModel
 from core.models.track import TrackModel
-from domain_types.types import Genre, Rank, RawPlaylistData, Service, Track
+from domain_types.types import Genre, Rank, RawPlaylistData, Service, Track, TrackEnrichmentContext
 
 
 def get_service(name: ServiceName) -> Service | None:
@@ -123,6 +124,35 @@ def get_track_rank_by_track_object(track: Track, genre_name: GenreName, service_
     return playlist_entry.position if playlist_entry else None
 
 
+def get_services_by_names(names: list[str]) -> dict[str, Service]:
+    """Batch fetch service domain objects by name in a single query."""
+    django_services = ServiceModel.objects.filter(name__in=names)
+    return {django_service.name: Service.from_django_model(django_service) for django_service in django_services}
+
+
+def get_track_ranks_by_keys(keys: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], int]:
+    """Batch fetch playlist positions for (isrc, genre, service) keys, one query per genre."""
+    genre_to_keys: dict[str, list[tuple[str, str, str]]] = {}
+    for key in keys:
+        genre_to_keys.setdefault(key[1], []).append(key)
+
+    ranks: dict[tuple[str, str, str], int] = {}
+    for genre_name, genre_keys in genre_to_keys.items():
+        playlist_entries = (
+            PlaylistModel.objects.filter(
+                isrc__in={isrc for isrc, _, _ in genre_keys},
+                genre__name=genre_name,
+                service__name__in={service_name for _, _, service_name in genre_keys},
+            )
+            .order_by("position")
+            .values_list("isrc", "service__name", "position")
+        )
+        for isrc, service_name, position in playlist_entries:
+            ranks.setdefault((isrc, genre_name, service_name), position)
+
+    return ranks
+
+
 def get_playlist_tracks_by_genre_service(genre_name: GenreName, service_name: ServiceName) -> list[tuple[str, int]]:
     """Get list of (isrc, position) tuples for a genre/service playlist."""
     playlist_models = PlaylistModel.objects.filter(
@@ -150,17 +180,52 @@ def get_tracks_by_isrcs(
 ) -> dict[str, Track]:
     """Batch fetch tracks by ISRCs in a single query. Returns dict mapping ISRC -> Track domain object.
 
-    If genre and service are provided, tracks will be enriched with service sources, ranks, and button labels.
-    This enrichment uses static service metadata and does NOT hit the database for service lookups.
+    If genre and service are provided, tracks will be enriched with service sources, ranks, and play counts.
+    Enrichment data is preloaded once for all ISRCs, so the query count does not grow with the playlist size.
     """
     if not isrcs:
         return {}
 
     django_tracks = TrackModel.objects.filter(isrc__in=isrcs).order_by("-id")
+    context = get_track_enrichment_context(isrcs, genre) if genre and service else None
 
     isrc_to_track = {}
     for django_track in django_tracks:
         if django_track.isrc not in isrc_to_track:
-            isrc_to_track[django_track.isrc] = Track.from_django_model(django_track, genre=genre, service=service)
+            isrc_to_track[django_track.isrc] = Track.from_django_model(
+                django_track, genre=genre, service=service, context=context
+            )
 
     return isrc_to_track
+
+
+def get_track_models_by_isrcs(isrcs: list[str]) -> dict[str, TrackModel]:
+    """Batch fetch Django TrackModels by ISRCs in a single query, keeping the most recent one per ISRC."""
+    isrc_to_model: dict[str, TrackModel] = {}
+    for django_track in TrackModel.objects.filter(isrc__in=isrcs).order_by("-id"):
+        isrc_to_model.setdefault(django_track.isrc, django_track)
+    return isrc_to_model
+
+
+def get_track_enrichment_context(isrcs: list[str], genre_name: GenreName) -> TrackEnrichmentContext:
+    """Preload services, per-service ranks and play counts for a batch of ISRCs in a fixed number of queries."""
+    services = {service.name: service for service in get_all_services()}
+
+    ranks: dict[tuple[str, str], int] = {}
+    playlist_entries = (
+        PlaylistModel.objects.filter(
+            isrc__in=isrcs,
+            genre__name=genre_name.value,
+            service__name__in=[service_name.value for service_name in RANKED_SERVICES],
+        )
+        .order_by("position")
+        .values_list("isrc", "service__name", "position")
+    )
+    for isrc, service_name, position in playlist_entries:
+        ranks.setdefault((isrc, service_name), position)
+
+    return TrackEnrichmentContext(
+        services=services,
+        ranks=ranks,
+        play_counts=get_track_play_counts_by_isrcs(isrcs),
+    )
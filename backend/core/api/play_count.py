@@ -1,5 +1,9 @@
-from core.constants import ServiceName
+from typing import Any
+
+from core.constants import GraphQLCacheKey, ServiceName
 from core.models.play_counts import AggregatePlayCountModel
+from core.utils.redis_cache import CachePrefix, redis_cache_get_many, redis_cache_set_many
+from django.db.models import F, Max, Window
 from domain_types.types import ServicePlayCount, TrackPlayCountData
 
 
@@ -12,6 +16,60 @@ def get_track_play_count(isrc: str) -> TrackPlayCountData | None:
 
     latest_play_counts = play_counts.filter(recorded_date=latest_date)
 
+    return _build_track_play_count_data(isrc, latest_play_counts)
+
+
+def get_track_play_counts_by_isrcs(isrcs: list[str]) -> dict[str, TrackPlayCountData]:
+    """Batch fetch the latest play count data for many ISRCs in a single query.
+
+    Returns dict mapping ISRC -> TrackPlayCountData. ISRCs without play counts are omitted.
+    """
+    if not isrcs:
+        return {}
+
+    latest_play_counts = (
+        AggregatePlayCountModel.objects.filter(isrc__in=isrcs)
+        .annotate(latest_recorded_date=Window(Max("recorded_date"), partition_by=[F("isrc")]))
+        .filter(recorded_date=F("latest_recorded_date"))
+        .select_related("service")
+    )
+
+    isrc_to_play_counts: dict[str, list[AggregatePlayCountModel]] = {}
+    for play_count in latest_play_counts:
+        isrc_to_play_counts.setdefault(play_count.isrc, []).append(play_count)
+
+    return {isrc: _build_track_play_count_data(isrc, play_counts) for isrc, play_counts in isrc_to_play_counts.items()}
+
+
+def get_tracks_play_counts(isrcs: list[str]) -> dict[str, dict[str, Any]]:
+    """Get serialized play count data for many ISRCs, served from Redis where possible.
+
+    Uses one MGET for all ISRCs, one query for the misses and one pipelined write-back.
+    Returns dict mapping ISRC -> TrackPlayCountData.to_dict() payload. ISRCs without play counts are omitted.
+    """
+    unique_isrcs = list(dict.fromkeys(isrcs))
+    if not unique_isrcs:
+        return {}
+
+    cache_key_to_isrc = {GraphQLCacheKey.track_play_count(isrc): isrc for isrc in unique_isrcs}
+    hits, _ = redis_cache_get_many(CachePrefix.GQL_PLAY_COUNT, list(cache_key_to_isrc))
+
+    results = {cache_key_to_isrc[cache_key]: data for cache_key, data in hits.items() if data}
+    missing_isrcs = [isrc for isrc in unique_isrcs if isrc not in results]
+    if not missing_isrcs:
+        return results
+
+    fetched = {isrc: data.to_dict() for isrc, data in get_track_play_counts_by_isrcs(missing_isrcs).items()}
+    redis_cache_set_many(
+        CachePrefix.GQL_PLAY_COUNT,
+        {GraphQLCacheKey.track_play_count(isrc): data for isrc, data in fetched.items()},
+    )
+    results.update(fetched)
+    return results
+
+
+def _build_track_play_count_data(isrc: str, latest_play_counts) -> TrackPlayCountData:
+    """Build TrackPlayCountData from the AggregatePlayCountModel rows of a single recorded date."""
     spotify_data = ServicePlayCount(None, None, None)
     apple_music_data = ServicePlayCount(None, None, None)
     youtube_data = ServicePlayCount(None, None, None)
@@ -248,3 +248,11 @@ class GraphQLCacheKey(str, Enum):
     @staticmethod
     def track_play_count(isrc: str) -> str:
         return f"track_play_count:{isrc}"
+
+    @staticmethod
+    def graphql_response(document_hash: str, operation_name: str | None, variables: str) -> str:
+        return f"graphql_response:{document_hash}:operation={operation_name}:variables={variables}"
+
+    @staticmethod
+    def persisted_query(sha256_hash: str) -> str:
+        return f"persisted_query:{sha256_hash}"
@@ -0,0 +1,65 @@
+import time
+from typing import TYPE_CHECKING, Any
+
+from core.models.track import TrackModel
+from core.services.spotify_service import (
+    get_spotify_track_view_count_with_http,
+    get_spotify_track_view_counts_with_webdriver,
+)
+from core.utils.utils import get_logger, process_in_parallel
+from django.core.management.base import BaseCommand
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Compare throughput of the HTTP Spotify play-count extractor against the Selenium webdriver path"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=20, help="Number of tracks with a Spotify URL to sample")
+        parser.add_argument("--skip-webdriver", action="store_true", help="Only benchmark the HTTP extractor")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        track_urls = list(
+            TrackModel.objects.exclude(spotify_url=None)
+            .order_by("isrc")
+            .values_list("spotify_url", flat=True)[: options.get("limit", 20)]
+        )
+        if not track_urls:
+            logger.info("No tracks with a Spotify URL to benchmark")
+            return
+
+        extractors: dict[str, Callable[[list[str]], dict[str, int]]] = {"http": self.extract_with_http}
+        if not options.get("skip_webdriver"):
+            extractors["webdriver"] = get_spotify_track_view_counts_with_webdriver
+
+        logger.info(f"Benchmarking Spotify play-count extraction on {len(track_urls)} tracks")
+        logger.info(f"{'path':<10} {'seconds':>8} {'pages/s':>8} {'parsed':>8}")
+        counts_by_path = {}
+        for path, extract in extractors.items():
+            start_time = time.monotonic()
+            counts_by_path[path] = extract(track_urls)
+            elapsed = time.monotonic() - start_time
+            logger.info(
+                f"{path:<10} {elapsed:>8.1f} {len(track_urls) / elapsed:>8.2f} "
+                f"{len(counts_by_path[path]):>4}/{len(track_urls):<3}"
+            )
+
+        if len(counts_by_path) == 2:
+            http_counts, webdriver_counts = counts_by_path["http"], counts_by_path["webdriver"]
+            both = set(http_counts) & set(webdriver_counts)
+            # Counts keep rising between the two passes, so allow a small drift
+            agreeing = [
+                url for url in both if abs(http_counts[url] - webdriver_counts[url]) <= webdriver_counts[url] * 0.001
+            ]
+            logger.info(f"Play counts agree within 0.1% for {len(agreeing)} of {len(both)} tracks parsed by both paths")
+
+    def extract_with_http(self, track_urls: list[str]) -> dict[str, int]:
+        """HTTP extraction alone, without the webdriver fallback the ETL uses for unparsed pages."""
+        results = process_in_parallel(
+            items=track_urls, process_func=get_spotify_track_view_count_with_http, log_progress=False
+        )
+        return {track_url: view_count for track_url, view_count, exc in results if not exc and view_count is not None}
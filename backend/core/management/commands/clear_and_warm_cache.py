@@ -1,39 +1,84 @@
 import logging
 
-from core.constants import GenreName
-from core.utils.redis_cache import CachePrefix, redis_cache_clear
+from core.constants import GenreName, GraphQLCacheKey, ServiceName
+from core.models.playlist import PlaylistModel
+from core.utils.redis_cache import (
+    VERSIONED_PREFIXES,
+    CachePrefix,
+    get_cache_generation,
+    pinned_cache_generation,
+    redis_cache_copy_generation,
+    redis_cache_swap_generation,
+)
 from core.utils.utils import process_in_parallel
 from django.core.management.base import BaseCommand
 
+from backend.gql.persisted_queries import register_persisted_query
 from backend.gql.schema import schema
+from backend.gql.views import cache_graphql_result
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = "Clear and warm track/playlist GraphQL cache (parallelized with 4 workers)"
+    help = "Warm track/playlist GraphQL cache into a new generation and swap it in (parallelized with 4 workers)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--genre",
+            action="append",
+            dest="genres",
+            help="Only rebuild cache entries for this genre (repeatable); everything else is carried over",
+        )
 
     def handle(self, *args, **options):
-        total_cleared = 0
+        # Warm generation N+1 while N keeps serving, then flip the pointer; N expires by TTL
+        current_generation = get_cache_generation(refresh=True)
+        next_generation = current_generation + 1
+        logger.info(f"Warming cache generation {next_generation} (serving {current_generation})")
+
+        genres = options.get("genres")
+        if genres is not None:
+            self._carry_over_unaffected_entries(current_generation, next_generation, set(genres), options.get("isrcs"))
+
+        with pinned_cache_generation(next_generation):
+            self._warm_track_caches()
+            logger.info("Track/playlist cache warmed")
 
-        # Clear all GraphQL cache prefixes
-        total_cleared += redis_cache_clear(CachePrefix.GQL_PLAYLIST)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_PLAYLIST_METADATA)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_GENRES)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_SERVICE_CONFIGS)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_IFRAME_CONFIGS)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_IFRAME_URL)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_BUTTON_LABELS)
-        total_cleared += redis_cache_clear(CachePrefix.GQL_TRACK)
-        total_cleared += redis_cache_clear(CachePrefix.TRENDING_ISRCS)
+            self._warm_trending_isrcs_cache()
+            logger.info("Trending ISRCs cache warmed")
 
-        logger.info(f"Cleared {total_cleared} cache entries")
+        redis_cache_swap_generation(next_generation)
 
-        self._warm_track_caches()
-        logger.info("Track/playlist cache warmed")
+    def _carry_over_unaffected_entries(
+        self, current_generation: int, next_generation: int, genres: set[str], isrcs: set[str] | None
+    ) -> None:
+        """Copy resolver entries untouched by the changed genres into the next generation.
 
-        self._warm_trending_isrcs_cache()
-        logger.info("Trending ISRCs cache warmed")
+        The warm below then only recomputes the affected genres' playlists and tracks; full GraphQL
+        responses and trending ISRCs are always rebuilt since they span every genre.
+        """
+        affected_isrcs = set(isrcs or set())
+        affected_isrcs.update(PlaylistModel.objects.filter(genre__name__in=genres).values_list("isrc", flat=True))
+        # A changed track also shows up in other genres' playlists that list it
+        affected_genres = genres | set(
+            PlaylistModel.objects.filter(isrc__in=affected_isrcs).values_list("genre__name", flat=True)
+        )
+
+        exclude = {
+            CachePrefix.GQL_PLAYLIST: {
+                GraphQLCacheKey.resolve_playlist(genre, service.value)
+                for genre in affected_genres
+                for service in ServiceName
+            },
+            CachePrefix.GQL_PLAYLIST_METADATA: {GraphQLCacheKey.playlists_by_genre(genre) for genre in genres},
+            CachePrefix.GQL_TRACK: {GraphQLCacheKey.track_by_isrc(isrc) for isrc in affected_isrcs},
+        }
+        prefixes = sorted(VERSIONED_PREFIXES - {CachePrefix.GQL_RESPONSE, CachePrefix.TRENDING_ISRCS})
+        logger.info(
+            f"Rebuilding cache for {sorted(affected_genres)} and {len(affected_isrcs)} ISRCs, carrying over the rest"
+        )
+        redis_cache_copy_generation(current_generation, next_generation, prefixes, exclude)
 
     def _warm_track_caches(self):
         """Execute EXACTLY the same GraphQL queries that frontend makes in parallel."""
@@ -59,7 +104,7 @@ class Command(BaseCommand):
 
         if query_type == "initial_page_data":
             # 1. GetInitialPageData query (frontend query #1) - EXACT MATCH
-            schema.execute_sync(
+            self._execute_and_cache(
                 """
                 query GetInitialPageData($genre: String!) {
                   # 1. Service headers and metadata (FAST)
@@ -150,7 +195,7 @@ class Command(BaseCommand):
 
         elif query_type == "tunemeld_playlist":
             # 2. First GetServicePlaylists query - TuneMeld ONLY (frontend query #2a)
-            schema.execute_sync(
+            self._execute_and_cache(
                 """
                 query GetServicePlaylists($genre: String!) {
                   tuneMeldPlaylist: playlist(genre: $genre, service: "tunemeld") {
@@ -227,7 +272,7 @@ class Command(BaseCommand):
 
         elif query_type == "other_playlists":
             # 3. Second GetServicePlaylists query - Other services ONLY (frontend query #2b)
-            schema.execute_sync(
+            self._execute_and_cache(
                 """
                 query GetServicePlaylists($genre: String!) {
                   spotifyPlaylist: playlist(genre: $genre, service: "spotify") {
@@ -436,6 +481,12 @@ class Command(BaseCommand):
                 variable_values={"genre": genre},
             )
 
+    def _execute_and_cache(self, query: str, variable_values: dict[str, str]) -> None:
+        """Execute a frontend query, register it as a persisted query and store its serialized response."""
+        register_persisted_query(query)
+        result = schema.execute_sync(query, variable_values=variable_values)
+        cache_graphql_result(query, variable_values, result)
+
     def _warm_trending_isrcs_cache(self):
         """Warm the trending ISRCs cache for ReccoBeats integration."""
         from core.api.trending_isrcs_api import _build_trending_isrcs_response
@@ -0,0 +1,68 @@
+from typing import Any
+
+from core.api.etl_runs_api import get_recent_etl_runs
+from core.models.etl import EtlRunModel
+from core.utils.utils import get_logger
+from django.core.management.base import BaseCommand
+
+logger = get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Compare duration, DB queries, HTTP traffic and external calls across the last N ETL runs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pipeline",
+            default=EtlRunModel.PIPELINE_PLAYLIST_ETL,
+            choices=[choice for choice, _label in EtlRunModel.PIPELINE_CHOICES],
+            help="Pipeline whose runs to compare",
+        )
+        parser.add_argument("--last", type=int, default=5, help="Number of most recent runs to compare")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        pipeline = options.get("pipeline", EtlRunModel.PIPELINE_PLAYLIST_ETL)
+        runs = list(reversed(get_recent_etl_runs(pipeline, options.get("last", 5))))
+        if not runs:
+            logger.info(f"No {pipeline} runs recorded yet")
+            return
+
+        logger.info(f"Last {len(runs)} {pipeline} runs (oldest first, change vs the previous run in brackets)")
+        logger.info(
+            f"{'run':>6} {'started':<17} {'status':<10} {'seconds':>16} {'db queries':>18} "
+            f"{'http requests':>18} {'http MB':>16}"
+        )
+        previous = None
+        for run in runs:
+            logger.info(
+                f"{run['id']:>6} {run['started_at'][:16]:<17} {run['status']:<10} "
+                f"{self._with_change(run, previous, 'duration_seconds'):>16} "
+                f"{self._with_change(run, previous, 'db_query_count'):>18} "
+                f"{self._with_change(run, previous, 'http_requests'):>18} "
+                f"{self._with_change(run, previous, 'http_bytes', scale=1 / 1_000_000):>16}"
+            )
+            previous = run
+
+        latest = runs[-1]
+        logger.info(f"\nStages of run {latest['id']}:")
+        for stage, stage_summary in sorted(latest["stages"].items()):
+            logger.info(
+                f"  {stage:<24} {stage_summary['count']:>3} units, {stage_summary['total_seconds']:>8.1f}s total, "
+                f"{stage_summary['max_seconds']:>7.1f}s slowest, {stage_summary['rows']:>6} rows"
+            )
+
+        logger.info(f"\nExternal calls of run {latest['id']}:")
+        for service, outcomes in sorted(latest["external_calls"].items()):
+            outcome_summary = ", ".join(f"{outcome}={count}" for outcome, count in sorted(outcomes.items()))
+            logger.info(f"  {service:<12} {outcome_summary}")
+
+    def _with_change(self, run: dict[str, Any], previous: dict[str, Any] | None, field: str, scale: float = 1.0) -> str:
+        value = run[field]
+        if value is None:
+            return "-"
+
+        formatted = f"{value * scale:.1f}" if isinstance(value, float) or scale != 1.0 else str(value)
+        previous_value = previous[field] if previous else None
+        if not previous_value:
+            return formatted
+        return f"{formatted} ({(value - previous_value) / previous_value * 100:+.0f}%)"
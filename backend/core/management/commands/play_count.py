@@ -7,7 +7,9 @@ from core.management.commands.play_count_modules.b_aggregate_play_count import C
 from core.management.commands.play_count_modules.c_clear_and_warm_play_count_cache import (
     Command as WarmPlayCountCacheCommand,
 )
+from core.models.etl import EtlRunModel
 from core.models.play_counts import HistoricalTrackPlayCountModel
+from core.utils.run_ledger import finish_run, record_stage, start_run_accounting
 from core.utils.utils import get_logger
 from django.core.management.base import BaseCommand
 from django.db import connection, models
@@ -23,14 +25,17 @@ class Command(BaseCommand):
         parser.add_argument("--limit", type=int, help="Limit tracks to process for testing")
 
     def handle(self, *args: Any, **options: Any) -> None:
-        start_time = time.time()
+        start_time = time.monotonic()
         limit = options.get("limit")
+        start_run_accounting()
+        run = EtlRunModel.objects.create(pipeline=EtlRunModel.PIPELINE_PLAY_COUNT)
 
         try:
-            logger.info("Starting Play Count ETL Pipeline")
+            logger.info(f"Starting Play Count ETL Pipeline (run {run.id})")
 
             logger.info("Step 1: Setting up genres and services...")
-            GenreServiceCommand().handle()
+            with record_stage(run, "genre_service"):
+                GenreServiceCommand().handle()
 
             # Close DB connection to prevent SSL timeout errors when Step 2 leaves connection idle
             # for extended periods during external API calls (Spotify/YouTube/SoundCloud scraping).
@@ -38,29 +43,35 @@ class Command(BaseCommand):
             connection.close()
 
             logger.info("Step 2: Running Historical Play Count extraction")
-            historical_command = HistoricalPlayCountCommand()
-            historical_command.handle(limit=limit)
-
-            connection.close()
+            with record_stage(run, "historical_play_count") as stage:
+                historical_command = HistoricalPlayCountCommand()
+                historical_command.handle(limit=limit)
+                # Reconnect before touching the database again after the long extraction
+                connection.close()
+                stage["rows"] = HistoricalTrackPlayCountModel.objects.filter(
+                    recorded_date=timezone.now().date()
+                ).count()
 
             logger.info("Step 3: Computing aggregate play counts with weekly changes")
-            aggregate_command = AggregatePlayCountCommand()
-            aggregate_command.handle()
+            with record_stage(run, "aggregate_play_count"):
+                aggregate_command = AggregatePlayCountCommand()
+                aggregate_command.handle()
 
             connection.close()
 
             logger.info("Step 4: Clearing and warming play count cache...")
-            WarmPlayCountCacheCommand().handle()
+            with record_stage(run, "warm_play_count_cache"):
+                WarmPlayCountCacheCommand().handle()
 
-            duration = time.time() - start_time
-            logger.info(f"Play Count ETL Pipeline completed in {duration:.1f} seconds")
+            finish_run(run, start_time)
+            logger.info(f"Play Count ETL Pipeline completed in {run.duration_seconds:.1f} seconds")
 
             self._print_final_summary()
 
         except Exception as e:
             logger.error(f"Play Count ETL Pipeline failed: {e}")
-            duration = time.time() - start_time
-            logger.info(f"Pipeline failed after {duration:.1f} seconds")
+            finish_run(run, start_time, error=e)
+            logger.info(f"Pipeline failed after {run.duration_seconds:.1f} seconds")
             raise
 
     def _print_final_summary(self):
@@ -8,8 +8,9 @@ from core.models.genre_service import ServiceModel
 from core.models.play_counts import HistoricalTrackPlayCountModel
 from core.models.track import TrackModel
 from core.services.soundcloud_service import get_soundcloud_track_view_count
-from core.services.spotify_service import get_spotify_track_view_count
-from core.services.youtube_service import get_youtube_track_view_count
+from core.services.spotify_service import get_spotify_track_view_counts
+from core.services.youtube_service import get_youtube_track_view_counts
+from core.utils.run_ledger import record_external_call
 from core.utils.utils import get_logger, process_in_parallel
 from django.core.management.base import BaseCommand
 from django.db import models
@@ -17,6 +18,8 @@ from django.utils import timezone
 
 logger = get_logger(__name__)
 
+BULK_WRITE_BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Extract historical play counts for all tracks with parallel processing"
@@ -61,6 +64,18 @@ class Command(BaseCommand):
         error_count = Counter()
         errors = []
 
+        # Spotify pages are scraped across the pooled browsers and YouTube counts fetched 50 per request
+        batched_services: list[tuple[ServiceName, str, Callable[[list[str]], dict[str, int]]]] = [
+            (ServiceName.SPOTIFY, "spotify_url", get_spotify_track_view_counts),
+            (ServiceName.YOUTUBE, "youtube_url", get_youtube_track_view_counts),
+        ]
+        for service_enum, url_field, get_counts_func in batched_services:
+            service_success, service_errors = self.process_batched_service(
+                tracks_list, service_enum.value, url_field, get_counts_func, services[service_enum]
+            )
+            success_count[service_enum.value] += service_success
+            error_count[service_enum.value] += service_errors
+
         results = process_in_parallel(
             items=tracks_list,
             process_func=lambda track: self.process_track(track, services),
@@ -82,6 +97,55 @@ class Command(BaseCommand):
         duration = time.time() - start_time
         self._print_summary(success_count, error_count, errors, duration, len(tracks_list))
 
+    def process_batched_service(
+        self,
+        tracks: list["TrackModel"],
+        service_name: str,
+        url_field: str,
+        get_counts_func: Callable[[list[str]], dict[str, int]],
+        service_obj: "ServiceModel",
+    ) -> tuple[int, int]:
+        """Fetch one service's counts for all tracks in a single batch call and upsert them in bulk.
+
+        Returns (successes, failures).
+        """
+        urls_by_isrc = {track.isrc: getattr(track, url_field) for track in tracks if getattr(track, url_field)}
+        if not urls_by_isrc:
+            return 0, 0
+
+        try:
+            view_counts = get_counts_func(list(urls_by_isrc.values()))
+        except Exception as e:
+            logger.warning(f"{service_name} play counts failed for {len(urls_by_isrc)} tracks: {e}")
+            view_counts = {}
+
+        recorded_date = timezone.now().date()
+        play_counts = []
+        for isrc, url in urls_by_isrc.items():
+            count = view_counts.get(url)
+            if count is None:
+                logger.warning(f"{isrc} {service_name}: no play count")
+                record_external_call(service_name, "play_count_failure")
+                continue
+
+            logger.info(f"{isrc} {service_name}: {count:,}")
+            record_external_call(service_name, "play_count_success")
+            play_counts.append(
+                HistoricalTrackPlayCountModel(
+                    isrc=isrc, service=service_obj, recorded_date=recorded_date, current_play_count=count
+                )
+            )
+
+        HistoricalTrackPlayCountModel.objects.bulk_create(
+            play_counts,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["isrc", "service", "recorded_date"],
+            update_fields=["current_play_count"],
+        )
+
+        return len(play_counts), len(urls_by_isrc) - len(play_counts)
+
     def _process_service(
         self,
         track: "TrackModel",
@@ -100,20 +164,20 @@ class Command(BaseCommand):
                 defaults={"current_play_count": count},
             )
             logger.info(f"{track.isrc} {service_name}: {count:,}")
+            record_external_call(service_name, "play_count_success")
             return (service_name, count)
         except Exception as e:
             logger.warning(f"{track.isrc} {service_name}: {e}")
+            record_external_call(service_name, "play_count_failure")
             return (service_name, None)
 
     def process_track(
         self, track: "TrackModel", services: dict[ServiceName, "ServiceModel"]
     ) -> list[tuple[str, int | None]]:
-        """Process a track and return results for all services."""
+        """Process a track and return results for its per-track services (Spotify and YouTube are batched)."""
         results: list[tuple[str, int | None]] = []
 
         service_configs: list[tuple[ServiceName, str | None, Callable[[str], int]]] = [
-            (ServiceName.SPOTIFY, track.spotify_url, get_spotify_track_view_count),
-            (ServiceName.YOUTUBE, track.youtube_url, get_youtube_track_view_count),
             (ServiceName.SOUNDCLOUD, track.soundcloud_url, get_soundcloud_track_view_count),
         ]
 
@@ -2,13 +2,12 @@ import asyncio
 import logging
 import os
 
+from core.api.play_count import get_tracks_play_counts
 from core.api.playlist import get_playlist_isrcs
 from core.constants import ServiceName
 from core.utils.redis_cache import CachePrefix, redis_cache_clear
 from django.core.management.base import BaseCommand
 
-from backend.gql.schema import schema
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,29 +29,12 @@ class Command(BaseCommand):
         del os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"]
 
     async def _warm_play_count_cache(self):
-        """Execute GraphQL queries to warm play count cache."""
+        """Warm the per-ISRC play count cache read by trackPlayCount and tracksPlayCounts in one batch."""
         playlist_isrcs = get_playlist_isrcs(ServiceName.TUNEMELD)
 
         if playlist_isrcs:
             logger.info(f"Warming play count cache for {len(playlist_isrcs)} playlist ISRCs")
-
-            for isrc in playlist_isrcs:
-                await schema.execute(f"""
-                    query GetTrackPlayCount {{
-                        trackPlayCount(isrc: "{isrc}") {{
-                            isrc
-                            spotifyCurrentPlayCount
-                            spotifyWeeklyChangePercentage
-                            appleMusicCurrentPlayCount
-                            appleMusicWeeklyChangePercentage
-                            youtubeCurrentPlayCount
-                            youtubeWeeklyChangePercentage
-                            soundcloudCurrentPlayCount
-                            soundcloudWeeklyChangePercentage
-                            totalCurrentPlayCount
-                            totalWeeklyChangePercentage
-                        }}
-                    }}
-                """)
+            warmed = get_tracks_play_counts(playlist_isrcs)
+            logger.info(f"Warmed play count cache for {len(warmed)} ISRCs with play count data")
         else:
             logger.info("No tracks found in TuneMeld playlists for play count cache warming")
@@ -1,17 +1,34 @@
 import time
+from collections.abc import Mapping
+from functools import partial
 from typing import Any
 
+from core.constants import PLAYLIST_GENRES, GenreName, ServiceName
 from core.management.commands.clear_and_warm_cache import Command as ClearAndWarmCacheCommand
 from core.management.commands.genre_service import Command as GenreServiceCommand
+from core.management.commands.playlist_etl_modules.a_raw_playlist import EXTRACTED_SERVICES
 from core.management.commands.playlist_etl_modules.a_raw_playlist import Command as RawPlaylistCommand
 from core.management.commands.playlist_etl_modules.b_playlist_service_track import Command as ServiceTrackCommand
+from core.management.commands.playlist_etl_modules.b_playlist_service_track import (
+    PlaylistChanges,
+    mark_playlists_processed,
+)
 from core.management.commands.playlist_etl_modules.c_track import Command as TrackCommand
 from core.management.commands.playlist_etl_modules.d_aggregate import Command as AggregateCommand
+from core.models.etl import EtlRunModel, EtlStageCheckpointModel
+from core.models.playlist import PlaylistModel, RawPlaylistDataModel, ServiceTrackModel
+from core.utils.cloudflare_cache import clear_rapidapi_cache
+from core.utils.run_ledger import finish_run, start_run_accounting
+from core.utils.stage_graph import Stage, run_stage_graph
 from core.utils.utils import get_logger
 from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 
 logger = get_logger(__name__)
 
+YOUTUBE_STAGE = "youtube"
+CACHE_STAGE = "cache"
+
 
 class Command(BaseCommand):
     help = "Run the complete playlist ETL pipeline"
@@ -22,35 +39,200 @@ class Command(BaseCommand):
             action="store_true",
             help="Force refresh by skipping RapidAPI cache and pulling fresh data",
         )
+        parser.add_argument(
+            "--full-rebuild",
+            action="store_true",
+            help="Reprocess every playlist, track and cache entry instead of only changed playlists",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the most recent unfinished run, skipping stages it already completed",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
-        force_refresh = options.get("force_refresh", False)
-        start_time = time.time()
+        start_time = time.monotonic()
+        start_run_accounting()
+
+        run = self.get_resumable_run() if options.get("resume") else None
+        if run:
+            completed = dict(
+                run.checkpoints.filter(status=EtlStageCheckpointModel.STATUS_COMPLETED).values_list("stage", "result")
+            )
+            logger.info(f"Resuming ETL run {run.id} with {len(completed)} completed stages")
+            run.status = EtlRunModel.STATUS_RUNNING
+            run.save(update_fields=["status"])
+        else:
+            run = EtlRunModel.objects.create(
+                pipeline=EtlRunModel.PIPELINE_PLAYLIST_ETL,
+                force_refresh=options.get("force_refresh", False),
+                full_rebuild=options.get("full_rebuild", False),
+            )
+            completed = {}
+
+        self.run = run
+        self.stage_start_times: dict[str, float] = {}
 
         try:
-            logger.info("Starting ETL pipeline...")
+            logger.info(f"Starting ETL pipeline (run {run.id})...")
 
-            logger.info("Step 1: Setting up genres and services...")
+            logger.info("Setting up genres and services...")
             GenreServiceCommand().handle()
 
-            logger.info("Step 2: Extracting raw playlist data...")
-            RawPlaylistCommand().handle(force_refresh=force_refresh)
+            if not completed:
+                # Clear RapidAPI cache if this is a scheduled GitHub Actions run
+                clear_rapidapi_cache()
 
-            logger.info("Step 3: Creating service tracks...")
-            ServiceTrackCommand().handle()
+            run_stage_graph(
+                self.build_stages(),
+                completed=completed,
+                on_start=self.checkpoint_started,
+                on_complete=self.checkpoint_completed,
+                on_failure=self.checkpoint_failed,
+            )
 
-            logger.info("Step 4: Creating canonical tracks with YouTube URLs...")
-            TrackCommand().handle()
+            finish_run(run, start_time)
+            logger.info(f"ETL pipeline completed in {run.duration_seconds:.2f} seconds")
 
-            logger.info("Step 5: Aggregating tracks...")
-            AggregateCommand().handle()
+        except Exception as e:
+            finish_run(run, start_time, error=e)
+            logger.error(f"ETL pipeline failed: {e}")
+            raise CommandError(f"ETL pipeline failed (resume with --resume): {e}") from e
 
-            logger.info("Step 6: Clearing and warming track cache...")
-            ClearAndWarmCacheCommand().handle()
+    def get_resumable_run(self) -> EtlRunModel | None:
+        run = EtlRunModel.objects.filter(pipeline=EtlRunModel.PIPELINE_PLAYLIST_ETL).order_by("-id").first()
+        if not run or run.status == EtlRunModel.STATUS_COMPLETED:
+            logger.info("No unfinished ETL run to resume, starting a new one")
+            return None
+        return run
 
-            elapsed_time = time.time() - start_time
-            logger.info(f"ETL pipeline completed in {elapsed_time:.2f} seconds")
+    def build_stages(self) -> list[Stage]:
+        """Stage graph: extract -> normalize per (service, genre), then tracks and aggregate per genre, then
+        the quota-limited YouTube searches and the cache warm.
 
-        except Exception as e:
-            logger.error(f"ETL pipeline failed: {e}")
-            raise CommandError(f"ETL pipeline failed: {e}") from e
+        Each (service, genre) branch advances as soon as its own inputs are ready, so a slow playlist only
+        delays its genre. Tracks wait for every service of the genre to be normalized, so each Track is built
+        from all of its ServiceTracks and linked to them.
+        """
+        stages = []
+        for genre_name in PLAYLIST_GENRES:
+            genre = GenreName(genre_name)
+            for service in EXTRACTED_SERVICES:
+                unit = f"{service.value}:{genre.value}"
+                stages.append(Stage(f"extract:{unit}", partial(self.extract_playlist, service, genre)))
+                stages.append(
+                    Stage(
+                        f"normalize:{unit}",
+                        partial(self.normalize_playlist, unit),
+                        depends_on=(f"extract:{unit}",),
+                    )
+                )
+
+            stages.append(
+                Stage(
+                    f"tracks:{genre.value}",
+                    partial(self.build_tracks, genre),
+                    depends_on=tuple(f"normalize:{service.value}:{genre.value}" for service in EXTRACTED_SERVICES),
+                )
+            )
+            stages.append(
+                Stage(
+                    f"aggregate:{genre.value}",
+                    partial(self.aggregate_genre, genre),
+                    depends_on=(f"tracks:{genre.value}",),
+                )
+            )
+
+        # After the aggregates, so TuneMeld playlist tracks can be searched first
+        stages.append(
+            Stage(
+                YOUTUBE_STAGE,
+                self.resolve_youtube_urls,
+                depends_on=tuple(f"aggregate:{genre_name}" for genre_name in PLAYLIST_GENRES),
+            )
+        )
+        stages.append(Stage(CACHE_STAGE, self.warm_cache, depends_on=(YOUTUBE_STAGE,)))
+        return stages
+
+    def extract_playlist(self, service: ServiceName, genre: GenreName, _results: Mapping[str, Any]) -> dict[str, Any]:
+        raw_data = RawPlaylistCommand().get_and_save_playlist(service, genre, self.run.force_refresh)
+        return {"raw_playlist_id": raw_data.id}
+
+    def normalize_playlist(self, unit: str, results: Mapping[str, Any]) -> dict[str, Any]:
+        raw_data = RawPlaylistDataModel.objects.select_related("genre", "service").get(
+            id=results[f"extract:{unit}"]["raw_playlist_id"]
+        )
+        changes = ServiceTrackCommand().normalize_playlist(raw_data, full=self.run.full_rebuild)
+        rows = ServiceTrackModel.objects.filter(service_id=raw_data.service_id, genre_id=raw_data.genre_id).count()
+        return {**changes.to_dict(), "rows": rows}
+
+    def build_tracks(self, genre: GenreName, results: Mapping[str, Any]) -> dict[str, Any]:
+        isrcs = set()
+        for service in EXTRACTED_SERVICES:
+            isrcs.update(results[f"normalize:{service.value}:{genre.value}"]["isrcs"])
+
+        if isrcs:
+            TrackCommand().handle(isrcs=isrcs, defer_youtube_search=True)
+        return {"isrcs": sorted(isrcs), "rows": len(isrcs)}
+
+    def aggregate_genre(self, genre: GenreName, results: Mapping[str, Any]) -> dict[str, Any]:
+        changed = self.run.full_rebuild or any(
+            results[f"normalize:{service.value}:{genre.value}"]["raw_playlist_hashes"] for service in EXTRACTED_SERVICES
+        )
+        if changed:
+            AggregateCommand().handle(genres={genre.value})
+        else:
+            logger.info(f"No {genre.value} playlist changed, keeping its aggregate playlist")
+        rows = PlaylistModel.objects.filter(service__name=ServiceName.TUNEMELD.value, genre__name=genre.value).count()
+        return {"changed": changed, "rows": rows}
+
+    def resolve_youtube_urls(self, _results: Mapping[str, Any]) -> dict[str, Any]:
+        result = TrackCommand().resolve_deferred_youtube_urls()
+        return {**result, "rows": len(result["isrcs"])}
+
+    def warm_cache(self, results: Mapping[str, Any]) -> dict[str, Any]:
+        changes = PlaylistChanges()
+        for stage_name, result in results.items():
+            if stage_name.startswith("normalize:"):
+                changes.merge(PlaylistChanges.from_dict(result))
+        # Tracks given a YouTube URL by a deferred search may sit in playlists that did not change
+        youtube_isrcs = set(results[YOUTUBE_STAGE]["isrcs"])
+
+        if not changes.has_changes and not youtube_isrcs:
+            logger.info("No raw playlist changed since the last run, keeping the current cache generation")
+            return {"warmed": False}
+
+        full_rebuild = self.run.full_rebuild
+        ClearAndWarmCacheCommand().handle(
+            genres=None if full_rebuild else changes.genres,
+            isrcs=None if full_rebuild else changes.isrcs | youtube_isrcs,
+        )
+
+        # Only marked once every stage succeeded, so a failed run is retried in full next time
+        mark_playlists_processed(changes)
+        return {"warmed": True}
+
+    def checkpoint_started(self, stage_name: str) -> None:
+        self.stage_start_times[stage_name] = time.monotonic()
+        EtlStageCheckpointModel.objects.update_or_create(
+            run=self.run,
+            stage=stage_name,
+            defaults={"status": EtlStageCheckpointModel.STATUS_RUNNING, "error": "", "finished_at": None},
+        )
+
+    def checkpoint_completed(self, stage_name: str, result: Any) -> None:
+        EtlStageCheckpointModel.objects.filter(run=self.run, stage=stage_name).update(
+            status=EtlStageCheckpointModel.STATUS_COMPLETED,
+            result=result,
+            row_count=result.get("rows") if isinstance(result, dict) else None,
+            duration_seconds=time.monotonic() - self.stage_start_times[stage_name],
+            finished_at=timezone.now(),
+        )
+
+    def checkpoint_failed(self, stage_name: str, exc: Exception) -> None:
+        EtlStageCheckpointModel.objects.filter(run=self.run, stage=stage_name).update(
+            status=EtlStageCheckpointModel.STATUS_FAILED,
+            error=str(exc),
+            duration_seconds=time.monotonic() - self.stage_start_times[stage_name],
+            finished_at=timezone.now(),
+        )
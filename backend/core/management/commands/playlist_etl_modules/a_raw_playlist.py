@@ -10,6 +10,9 @@ from django.core.management.base import BaseCommand, CommandError
 
 logger = get_logger(__name__)
 
+# Services whose curated playlists are extracted; TuneMeld is derived and YouTube has no playlists
+EXTRACTED_SERVICES = [ServiceName.APPLE_MUSIC, ServiceName.SOUNDCLOUD, ServiceName.SPOTIFY]
+
 
 class Command(BaseCommand):
     help = "Extract raw playlist data from RapidAPI and save to PostgreSQL"
@@ -19,7 +22,7 @@ class Command(BaseCommand):
         clear_rapidapi_cache()
 
         force_refresh = options.get("force_refresh", False)
-        supported_services = [ServiceName.APPLE_MUSIC.value, ServiceName.SOUNDCLOUD.value, ServiceName.SPOTIFY.value]
+        supported_services = [service.value for service in EXTRACTED_SERVICES]
 
         tasks = []
         for service_name in SERVICE_CONFIGS:
@@ -60,7 +63,7 @@ class Command(BaseCommand):
 
     def get_and_save_playlist(
         self, service_name: ServiceName, genre: GenreName, force_refresh: bool = False
-    ) -> RawPlaylistDataModel | None:
+    ) -> RawPlaylistDataModel:
         logger.info(f"Getting playlist data for {service_name.value}/{genre.value}")
         service = get_service(service_name)
         genre_obj = get_genre(genre)
@@ -91,6 +94,7 @@ class Command(BaseCommand):
                     "playlist_cover_url": metadata["playlist_cover_url"],
                     "playlist_cover_description_text": metadata["playlist_cover_description_text"],
                     "data": playlist_data,
+                    "content_hash": RawPlaylistDataModel.compute_content_hash(playlist_data),
                 },
             )
             return raw_data
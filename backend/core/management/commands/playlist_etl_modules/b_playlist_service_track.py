@@ -1,4 +1,6 @@
 import json
+from dataclasses import dataclass, field
+from typing import Any
 
 from core.constants import ServiceName
 from core.models.playlist import PlaylistModel, RawPlaylistDataModel, ServiceTrackModel
@@ -11,88 +13,176 @@ from domain_types.types import NormalizedTrack
 
 logger = get_logger(__name__)
 
+SERVICE_TRACK_UPSERT_FIELDS = [
+    "track_name",
+    "artist_name",
+    "album_name",
+    "service_url",
+    "isrc",
+    "album_cover_url",
+    "updated_at",
+]
+
+
+@dataclass
+class PlaylistChanges:
+    """Playlists normalized in this run, scoping the downstream stages to what their inputs touched."""
+
+    genres: set[str] = field(default_factory=set)
+    # ISRCs in the previous or new version of a normalized playlist
+    isrcs: set[str] = field(default_factory=set)
+    # RawPlaylistDataModel id -> content_hash that was normalized
+    raw_playlist_hashes: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.raw_playlist_hashes)
+
+    def merge(self, other: "PlaylistChanges") -> None:
+        self.genres |= other.genres
+        self.isrcs |= other.isrcs
+        self.raw_playlist_hashes.update(other.raw_playlist_hashes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, stored in ETL stage checkpoints."""
+        return {
+            "genres": sorted(self.genres),
+            "isrcs": sorted(self.isrcs),
+            "raw_playlist_hashes": {
+                str(raw_id): content_hash for raw_id, content_hash in self.raw_playlist_hashes.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PlaylistChanges":
+        return cls(
+            genres=set(data["genres"]),
+            isrcs=set(data["isrcs"]),
+            raw_playlist_hashes={
+                int(raw_id): content_hash for raw_id, content_hash in data["raw_playlist_hashes"].items()
+            },
+        )
+
+
+def mark_playlists_processed(changes: PlaylistChanges) -> None:
+    """Record that every downstream stage completed for these raw playlists, so unchanged reruns skip them."""
+    RawPlaylistDataModel.objects.bulk_update(
+        [
+            RawPlaylistDataModel(id=raw_playlist_id, processed_hash=content_hash)
+            for raw_playlist_id, content_hash in changes.raw_playlist_hashes.items()
+        ],
+        ["processed_hash"],
+    )
+
 
 class Command(BaseCommand):
     help = "Normalize raw playlist JSON data into Playlist and ServiceTrack tables"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Normalize every playlist, including ones whose raw data has not changed",
+        )
+
     def handle(self, *args: object, **options: object) -> None:
+        self.normalize_playlists(full=bool(options.get("full", False)))
+
+    def normalize_playlists(self, full: bool = False) -> PlaylistChanges:
+        """Normalize raw playlists whose content hash differs from the last completed run (all of them if full)."""
         raw_data_queryset = RawPlaylistDataModel.objects.select_related("genre", "service").all()
         total_raw = raw_data_queryset.count()
+        changes = PlaylistChanges()
 
         if total_raw == 0:
             logger.warning("No raw playlist data found. Run b_raw_extract first.")
-            return
+            return changes
 
         logger.info(f"Processing {total_raw} raw playlist records...")
 
-        total_tracks = 0
-
         for raw_data in raw_data_queryset:
             # Skip TuneMeld service as it's created by the aggregate step
             if raw_data.service.name == ServiceName.TUNEMELD.value:
                 continue
+            changes.merge(self.normalize_playlist(raw_data, full=full))
+
+        logger.info(f"Transformation complete: {len(changes.raw_playlist_hashes)} changed playlists normalized")
+        return changes
+
+    def normalize_playlist(self, raw_data: RawPlaylistDataModel, full: bool = False) -> PlaylistChanges:
+        """Normalize one raw playlist if its content hash changed (always if full)."""
+        changes = PlaylistChanges()
+        if not full and not raw_data.has_pending_changes:
+            logger.info(f"Unchanged {raw_data.service.name}/{raw_data.genre.name}, skipping")
+            return changes
 
-            track_count = self.create_playlists(raw_data)
-            total_tracks += track_count
-            logger.info(f"Created {raw_data.service.name}/{raw_data.genre.name}: {track_count} positions")
+        playlist_tracks = ServiceTrackModel.objects.filter(service=raw_data.service, genre=raw_data.genre)
+        previous_isrcs = set(playlist_tracks.values_list("isrc", flat=True))
 
-        logger.info(f"Transformation complete: {total_tracks} playlist positions created")
+        track_count = self.create_playlists(raw_data)
+        logger.info(f"Created {raw_data.service.name}/{raw_data.genre.name}: {track_count} positions")
+
+        current_isrcs = set(playlist_tracks.values_list("isrc", flat=True))
+        changes.genres.add(raw_data.genre.name)
+        changes.isrcs |= previous_isrcs | current_isrcs
+        changes.raw_playlist_hashes[raw_data.id] = raw_data.content_hash
+        return changes
 
     def create_playlists(self, raw_data: RawPlaylistDataModel) -> int:
+        logger.info(f"Processing tracks for {raw_data.service.name}/{raw_data.genre.name}")
+
+        if raw_data.service.name == ServiceName.SPOTIFY:
+            tracks_data = self.parse_spotify_tracks(raw_data.data.get("tracks", []))
+        elif raw_data.service.name == ServiceName.APPLE_MUSIC:
+            tracks_data = self.parse_apple_music_tracks(raw_data.data.get("tracks", {}))
+        elif raw_data.service.name == ServiceName.SOUNDCLOUD:
+            tracks_data = self.parse_soundcloud_tracks(raw_data.data.get("tracks", {}))
+        else:
+            raise ValueError(f"Unknown service: {raw_data.service.name}")
+
+        service_tracks = [
+            ServiceTrackModel(
+                service=raw_data.service,
+                genre=raw_data.genre,
+                position=position,
+                track_name=track.name,
+                artist_name=track.artist,
+                album_name=track.album,
+                service_url=track.service_url,
+                isrc=track.isrc,
+                album_cover_url=track.album_cover_url,
+            )
+            for position, track in enumerate((track for track in tracks_data if track.isrc), start=1)
+        ]
+
         with transaction.atomic():
-            logger.info(f"Processing tracks for {raw_data.service.name}/{raw_data.genre.name}")
-            PlaylistModel.objects.filter(service=raw_data.service, genre=raw_data.genre).delete()
-
-            if raw_data.service.name == ServiceName.SPOTIFY:
-                tracks_data = self.parse_spotify_tracks(raw_data.data.get("tracks", []))
-            elif raw_data.service.name == ServiceName.APPLE_MUSIC:
-                tracks_data = self.parse_apple_music_tracks(raw_data.data.get("tracks", {}))
-            elif raw_data.service.name == ServiceName.SOUNDCLOUD:
-                tracks_data = self.parse_soundcloud_tracks(raw_data.data.get("tracks", {}))
-            else:
-                raise ValueError(f"Unknown service: {raw_data.service.name}")
+            ServiceTrackModel.objects.bulk_create(
+                service_tracks,
+                update_conflicts=True,
+                unique_fields=["service", "genre", "position"],
+                update_fields=SERVICE_TRACK_UPSERT_FIELDS,
+            )
 
-            position = 1
+            # Upserted rows do not get primary keys back on every backend, so read them in one query
+            playlist_tracks = ServiceTrackModel.objects.filter(service=raw_data.service, genre=raw_data.genre)
 
-            for track in tracks_data:
-                if track.isrc:
-                    service_track, created = ServiceTrackModel.objects.update_or_create(
+            PlaylistModel.objects.bulk_create(
+                [
+                    PlaylistModel(
                         service=raw_data.service,
                         genre=raw_data.genre,
                         position=position,
-                        defaults={
-                            "track_name": track.name,
-                            "artist_name": track.artist,
-                            "album_name": track.album,
-                            "service_url": track.service_url,
-                            "isrc": track.isrc,
-                            "album_cover_url": track.album_cover_url,
-                        },
+                        isrc=isrc,
+                        service_track_id=service_track_id,
                     )
-                    if created:
-                        logger.debug(f"Created new track: {track.name} by {track.artist}")
-                    else:
-                        logger.debug(f"Updated existing track: {track.name} by {track.artist}")
-                    position += 1
-
-            created_tracks = ServiceTrackModel.objects.filter(service=raw_data.service, genre=raw_data.genre).order_by(
-                "position"
+                    for position, isrc, service_track_id in playlist_tracks.values_list("position", "isrc", "id")
+                ],
+                update_conflicts=True,
+                unique_fields=["service", "genre", "position"],
+                update_fields=["isrc", "service_track"],
             )
 
-            playlist_count = 0
-            for service_track in created_tracks:
-                PlaylistModel.objects.update_or_create(
-                    service=raw_data.service,
-                    genre=raw_data.genre,
-                    position=service_track.position,
-                    defaults={
-                        "isrc": service_track.isrc,
-                        "service_track": service_track,
-                    },
-                )
-                playlist_count += 1
-
-            return playlist_count
+        return len(service_tracks)
 
     def parse_spotify_tracks(self, raw_data: dict) -> list[NormalizedTrack]:
         if isinstance(raw_data, str):
@@ -1,15 +1,42 @@
-from collections import Counter
+import threading
+from collections import Counter, defaultdict
+from typing import Any
 
 from core.constants import ServiceName
-from core.models import ServiceTrackModel, TrackModel
+from core.models import DeferredYouTubeLookupModel, PlaylistModel, ServiceTrackModel, TrackModel
 from core.services.apple_music_service import get_apple_music_album_cover_url
 from core.services.soundcloud_service import get_soundcloud_url
 from core.services.youtube_service import YouTubeUrlResult, get_youtube_url
+from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get_many, is_cached_not_found
+from core.utils.run_ledger import record_external_call
 from core.utils.utils import get_logger, process_in_parallel
+from core.utils.youtube_quota import YOUTUBE_SEARCH_UNITS, get_remaining_youtube_quota_units
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, F, Q
 
 logger = get_logger(__name__)
 
+BULK_WRITE_BATCH_SIZE = 500
+
+TRACK_UPSERT_FIELDS = [
+    "track_name",
+    "artist_name",
+    "album_name",
+    "album_cover_url",
+    "spotify_url",
+    "apple_music_url",
+    "soundcloud_url",
+    "youtube_url",
+    "updated_at",
+]
+
+# YouTube URL outcomes besides YouTubeUrlResult: kept from the saved track, or queued for a quota-aware search
+YOUTUBE_URL_EXISTING = "existing"
+YOUTUBE_URL_QUEUED = "queued"
+# Searches that failed without spending a definite answer stay queued for the next pass
+RETRYABLE_YOUTUBE_RESULTS = {YouTubeUrlResult.API_FAILURE_QUOTA, YouTubeUrlResult.API_FAILURE_ERROR}
+
 
 class Command(BaseCommand):
     help = "Create canonical Track records from ServiceTrack records by ISRC"
@@ -17,59 +44,214 @@ class Command(BaseCommand):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def handle(self, *args: object, **options: object) -> None:
-        unique_isrcs = list(self.get_unique_isrcs())
+    def handle(self, *args: object, **options: Any) -> None:
+        # The incremental pipeline passes the ISRCs touched by changed playlists; None processes every ISRC
+        isrcs: set[str] | None = options.get("isrcs")
+        service_tracks_by_isrc = self.get_service_tracks_by_isrc(isrcs)
+        unique_isrcs = sorted(service_tracks_by_isrc)
+
+        if unique_isrcs:
+            self.build_canonical_tracks(unique_isrcs, service_tracks_by_isrc)
 
-        if not unique_isrcs:
-            return
+        # playlist_etl searches the queue once, after every genre is aggregated, so TuneMeld tracks go first
+        if not options.get("defer_youtube_search"):
+            self.resolve_deferred_youtube_urls()
 
+    def build_canonical_tracks(
+        self, unique_isrcs: list[str], service_tracks_by_isrc: dict[str, list[ServiceTrackModel]]
+    ) -> None:
+        """Build and save a Track per ISRC, filling known YouTube URLs and queueing the rest for a search."""
+        # Only the network enrichment runs in the pool; the database is written once below
         results = process_in_parallel(
             items=unique_isrcs,
-            process_func=lambda isrc: self.process_isrc(isrc),
+            process_func=lambda isrc: self.build_canonical_track(isrc, service_tracks_by_isrc[isrc]),
             log_progress=True,
             progress_interval=50,
         )
 
-        youtube_stats: Counter[YouTubeUrlResult] = Counter()
+        track_data_list = []
+        youtube_searches: dict[str, tuple[str, str]] = {}
         for isrc, result, exc in results:
             if exc:
                 logger.error(f"Failed to process ISRC {isrc}: {exc}")
                 raise CommandError(f"Pipeline failed on ISRC {isrc}: {exc}") from exc
 
-            if result and isinstance(result, YouTubeUrlResult):
-                youtube_stats[result] += 1
+            if result is None:
+                continue
 
+            track_data, youtube_search = result
+            track_data_list.append(track_data)
+            youtube_searches[isrc] = youtube_search
+
+        youtube_stats = self.apply_known_youtube_urls(track_data_list, youtube_searches)
+        self.save_canonical_tracks(track_data_list, service_tracks_by_isrc)
         self.log_youtube_summary(len(unique_isrcs), youtube_stats)
 
-    def log_youtube_summary(self, total_tracks: int, stats: Counter) -> None:
+    def log_youtube_summary(self, total_tracks: int, stats: Counter[str]) -> None:
         """Log YouTube URL retrieval summary statistics."""
         logger.info("YouTube URL Retrieval Summary:")
         logger.info(f"- Total tracks processed: {total_tracks}")
 
-        for result_type, count in stats.items():
+        for outcome, count in stats.items():
             percentage = (count / total_tracks * 100) if total_tracks > 0 else 0
-            logger.info(f"- {result_type.value.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
+            logger.info(f"- {outcome.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
+
+    def apply_known_youtube_urls(
+        self, track_data_list: list[dict[str, Any]], youtube_searches: dict[str, tuple[str, str]]
+    ) -> Counter[str]:
+        """Fill youtube_url from the cache or the saved track without spending quota; queue the rest.
+
+        Queued tracks are searched by resolve_deferred_youtube_urls within the day's YouTube quota.
+        """
+        key_data_by_isrc = {
+            isrc: f"{track_name}|{artist_name}" for isrc, (track_name, artist_name) in youtube_searches.items()
+        }
+        cached_urls, _misses = cloudflare_cache_get_many(CachePrefix.YOUTUBE_URL, list(key_data_by_isrc.values()))
+        saved_urls = dict(
+            TrackModel.objects.filter(isrc__in=list(key_data_by_isrc), youtube_url__isnull=False).values_list(
+                "isrc", "youtube_url"
+            )
+        )
+
+        stats: Counter[str] = Counter()
+        queued = []
+        for track_data in track_data_list:
+            isrc = track_data["isrc"]
+            cached_url = cached_urls.get(key_data_by_isrc[isrc])
+            if cached_url and not is_cached_not_found(cached_url):
+                outcome = YouTubeUrlResult.CACHE_HIT.value
+                if cached_url != "https://youtube.com":
+                    track_data["youtube_url"] = str(cached_url)
+            elif saved_urls.get(isrc):
+                outcome = YOUTUBE_URL_EXISTING
+                track_data["youtube_url"] = saved_urls[isrc]
+            elif cached_url:
+                outcome = YouTubeUrlResult.CACHE_HIT_NOT_FOUND.value
+            else:
+                outcome = YOUTUBE_URL_QUEUED
+                track_name, artist_name = youtube_searches[isrc]
+                queued.append(DeferredYouTubeLookupModel(isrc=isrc, track_name=track_name, artist_name=artist_name))
+            stats[outcome] += 1
+            record_external_call(ServiceName.YOUTUBE.value, outcome)
+
+        DeferredYouTubeLookupModel.objects.bulk_create(
+            queued,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["isrc"],
+            update_fields=["track_name", "artist_name", "updated_at"],
+        )
+        return stats
+
+    def resolve_deferred_youtube_urls(self) -> dict[str, Any]:
+        """Spend the YouTube quota left today on queued searches, most valuable first; the rest wait a run.
+
+        Lookups left unserved by an earlier pass go first, then tracks on TuneMeld aggregate playlists, then
+        tracks on the most playlists. Returns the ISRCs whose youtube_url was set.
+        """
+        pending = list(DeferredYouTubeLookupModel.objects.all())
+        if not pending:
+            return {"isrcs": [], "searched": 0, "deferred": 0}
+
+        priorities = self.get_youtube_lookup_priorities({lookup.isrc for lookup in pending})
+        pending.sort(key=lambda lookup: (lookup.deferrals == 0, *priorities.get(lookup.isrc, (True, 0)), lookup.isrc))
+
+        remaining_units = get_remaining_youtube_quota_units()
+        scheduled = pending[: remaining_units // YOUTUBE_SEARCH_UNITS]
+        unserved = pending[len(scheduled) :]
+        logger.info(
+            f"YouTube quota: {remaining_units} units left today, searching {len(scheduled)} of "
+            f"{len(pending)} queued tracks"
+        )
+
+        # Once YouTube reports quotaExceeded the remaining searches are deferred without calling it
+        quota_exceeded = threading.Event()
+
+        def search(lookup: DeferredYouTubeLookupModel) -> tuple[str | None, YouTubeUrlResult] | None:
+            if quota_exceeded.is_set():
+                return None
+            youtube_url, youtube_result = get_youtube_url(lookup.track_name, lookup.artist_name)
+            if youtube_result == YouTubeUrlResult.API_FAILURE_QUOTA:
+                quota_exceeded.set()
+            return youtube_url, youtube_result
+
+        results = process_in_parallel(items=scheduled, process_func=search, log_progress=True, progress_interval=50)
+
+        resolved_urls: dict[str, str] = {}
+        finished_ids = []
+        for lookup, result, exc in results:
+            if exc:
+                logger.warning(f"YouTube search failed for {lookup.isrc}: {exc}")
+            if exc or result is None:
+                unserved.append(lookup)
+                continue
+
+            youtube_url, youtube_result = result
+            record_external_call(ServiceName.YOUTUBE.value, youtube_result.value)
+            if youtube_result in RETRYABLE_YOUTUBE_RESULTS:
+                unserved.append(lookup)
+                continue
+
+            finished_ids.append(lookup.id)
+            if youtube_url and youtube_url != "https://youtube.com":
+                resolved_urls[lookup.isrc] = youtube_url
+
+        with transaction.atomic():
+            tracks = list(TrackModel.objects.filter(isrc__in=list(resolved_urls)))
+            for track in tracks:
+                track.youtube_url = resolved_urls[track.isrc]
+            TrackModel.objects.bulk_update(tracks, ["youtube_url"], batch_size=BULK_WRITE_BATCH_SIZE)
+
+            DeferredYouTubeLookupModel.objects.filter(id__in=finished_ids).delete()
+            DeferredYouTubeLookupModel.objects.filter(id__in=[lookup.id for lookup in unserved]).update(
+                deferrals=F("deferrals") + 1
+            )
+
+        logger.info(
+            f"YouTube lookups: {len(resolved_urls)} URLs found, {len(finished_ids) - len(resolved_urls)} without a "
+            f"video, {len(unserved)} deferred to the next run"
+        )
+        return {
+            "isrcs": sorted(track.isrc for track in tracks),
+            "searched": len(finished_ids),
+            "deferred": len(unserved),
+        }
+
+    def get_youtube_lookup_priorities(self, isrcs: set[str]) -> dict[str, tuple[bool, int]]:
+        """Sort key per ISRC: (not on a TuneMeld aggregate playlist, minus the number of service playlists).
+
+        TuneMeld positions only exist as PlaylistModel rows (pointing at other services' ServiceTracks),
+        so both counts come from playlist positions.
+        """
+        tunemeld = Q(service__name=ServiceName.TUNEMELD.value)
+        rows = (
+            PlaylistModel.objects.filter(isrc__in=list(isrcs))
+            .values("isrc")
+            .annotate(tunemeld_count=Count("id", filter=tunemeld), playlist_count=Count("id", filter=~tunemeld))
+        )
+        return {row["isrc"]: (row["tunemeld_count"] == 0, -row["playlist_count"]) for row in rows}
 
-    def process_isrc(self, isrc: str) -> YouTubeUrlResult | None:
-        """Process a single ISRC and create canonical track."""
-        service_tracks = ServiceTrackModel.objects.filter(isrc=isrc)
-        return self.create_canonical_track(isrc, service_tracks)
+    def get_service_tracks_by_isrc(self, isrcs: set[str] | None = None) -> dict[str, list[ServiceTrackModel]]:
+        """Load ServiceTracks (optionally only for the given ISRCs) with their service in one query, grouped by ISRC."""
+        service_tracks = ServiceTrackModel.objects.select_related("service").order_by("id")
+        if isrcs is not None:
+            service_tracks = service_tracks.filter(isrc__in=list(isrcs))
 
-    def get_unique_isrcs(self) -> list[str]:
-        """Get all ISRCs from current playlists for processing."""
-        playlist_isrcs = set(ServiceTrackModel.objects.values_list("isrc", flat=True).distinct())
+        service_tracks_by_isrc: defaultdict[str, list[ServiceTrackModel]] = defaultdict(list)
+        for service_track in service_tracks:
+            service_tracks_by_isrc[service_track.isrc].append(service_track)
 
-        existing_tracks_count = TrackModel.objects.filter(isrc__in=playlist_isrcs).count()
-        new_tracks_count = len(playlist_isrcs) - existing_tracks_count
+        existing_tracks_count = TrackModel.objects.filter(isrc__in=list(service_tracks_by_isrc)).count()
+        new_tracks_count = len(service_tracks_by_isrc) - existing_tracks_count
 
         logger.info(
-            f"Processing {len(playlist_isrcs)} playlist ISRCs "
+            f"Processing {len(service_tracks_by_isrc)} playlist ISRCs "
             f"({new_tracks_count} new tracks, {existing_tracks_count} existing tracks)"
         )
 
-        return sorted(playlist_isrcs)
+        return dict(service_tracks_by_isrc)
 
-    def choose_primary_service_track(self, service_tracks) -> ServiceTrackModel | None:
+    def choose_primary_service_track(self, service_tracks: list[ServiceTrackModel]) -> ServiceTrackModel | None:
         """Choose the primary ServiceTrack based on service priority."""
         # Priority: Spotify > Apple Music > SoundCloud
 
@@ -79,7 +261,7 @@ class Command(BaseCommand):
                     return track
 
         # Fallback to first track if no priority service found
-        return service_tracks.first() if service_tracks else None
+        return service_tracks[0] if service_tracks else None
 
     def clean_track_name(self, track_name: str, artist_name: str) -> str:
         """Clean track names by removing duplicate artist prefix (common in SoundCloud)."""
@@ -93,8 +275,13 @@ class Command(BaseCommand):
 
         return track_name
 
-    def create_canonical_track(self, isrc: str, service_tracks) -> YouTubeUrlResult | None:
-        """Create a canonical Track record from multiple ServiceTrack records."""
+    def build_canonical_track(
+        self, isrc: str, service_tracks: list[ServiceTrackModel]
+    ) -> tuple[dict[str, Any], tuple[str, str]] | None:
+        """Build canonical Track fields from multiple ServiceTrack records, enriching them over the network.
+
+        Returns the fields and the (track name, artist name) to search YouTube with.
+        """
 
         primary_track = self.choose_primary_service_track(service_tracks)
         if not primary_track:
@@ -131,16 +318,36 @@ class Command(BaseCommand):
             if album_cover_url:
                 track_data["album_cover_url"] = album_cover_url
 
-        youtube_url, youtube_result = get_youtube_url(primary_track.track_name, primary_track.artist_name)
-        if youtube_url and youtube_url != "https://youtube.com":
-            track_data["youtube_url"] = youtube_url
-
         if not track_data["soundcloud_url"]:
-            soundcloud_url, _soundcloud_result = get_soundcloud_url(primary_track.track_name, primary_track.artist_name)
+            soundcloud_url, soundcloud_result = get_soundcloud_url(primary_track.track_name, primary_track.artist_name)
+            record_external_call(ServiceName.SOUNDCLOUD.value, soundcloud_result.value)
             if soundcloud_url:
                 track_data["soundcloud_url"] = soundcloud_url
 
-        track, _created = TrackModel.objects.update_or_create(isrc=isrc, defaults=track_data)
-        service_tracks.update(track=track)
-
-        return youtube_result
+        return track_data, (primary_track.track_name, primary_track.artist_name)
+
+    def save_canonical_tracks(
+        self, track_data_list: list[dict[str, Any]], service_tracks_by_isrc: dict[str, list[ServiceTrackModel]]
+    ) -> None:
+        """Upsert Track rows and link their ServiceTracks in bulk batches."""
+        with transaction.atomic():
+            TrackModel.objects.bulk_create(
+                [TrackModel(**track_data) for track_data in track_data_list],
+                batch_size=BULK_WRITE_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["isrc"],
+                update_fields=TRACK_UPSERT_FIELDS,
+            )
+
+            isrcs = [track_data["isrc"] for track_data in track_data_list]
+            track_ids = dict(TrackModel.objects.filter(isrc__in=isrcs).values_list("isrc", "id"))
+
+            linked_service_tracks = []
+            for isrc in isrcs:
+                for service_track in service_tracks_by_isrc[isrc]:
+                    service_track.track_id = track_ids[isrc]
+                    linked_service_tracks.append(service_track)
+
+            ServiceTrackModel.objects.bulk_update(linked_service_tracks, ["track"], batch_size=BULK_WRITE_BATCH_SIZE)
+
+        logger.info(f"Saved {len(track_data_list)} tracks and linked {len(linked_service_tracks)} service tracks")
@@ -1,7 +1,8 @@
 from collections import defaultdict
 from typing import Any
 
-from core.api.genre_service_api import get_genre_by_id, get_service
+import numpy as np
+from core.api.genre_service_api import get_service
 from core.constants import GENRE_CONFIGS, SERVICE_CONFIGS, ServiceName
 from core.models.genre_service import GenreModel
 from core.models.playlist import PlaylistModel, RawPlaylistDataModel, ServiceTrackModel
@@ -9,126 +10,137 @@ from core.models.track import TrackModel
 from core.utils.utils import get_logger
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from django.db.models import Count
 from django.utils import timezone
 
 logger = get_logger(__name__)
 
+BULK_WRITE_BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Generate cross-service aggregate playlists"
 
     def handle(self, *args: Any, **options: Any) -> None:
-        logger.info("Starting aggregate playlist generation...")
-
-        cross_service_matches = self.find_cross_service_isrcs()
-        self.create_aggregate_playlists(cross_service_matches)
-        self.create_tunemeld_raw_playlist_data()
-
-    def find_cross_service_isrcs(self) -> dict[int, list[dict]]:
-        duplicate_isrcs = (
-            ServiceTrackModel.objects.all()
-            .values("isrc", "genre")
-            .annotate(service_count=Count("service", distinct=True))
-            .filter(service_count__gt=1)
+        # The incremental pipeline passes the genres with changed playlists; None rebuilds every genre
+        genre_names: set[str] | None = options.get("genres")
+        genre_ids = (
+            set(GenreModel.objects.filter(name__in=list(genre_names)).values_list("id", flat=True))
+            if genre_names is not None
+            else None
+        )
+        logger.info(
+            f"Starting aggregate playlist generation for {sorted(genre_names) if genre_names else 'all genres'}..."
         )
 
-        cross_service_matches = defaultdict(list)
-
-        for item in duplicate_isrcs:
-            isrc = item["isrc"]
-            genre_id = item["genre"]
-
-            service_tracks = ServiceTrackModel.objects.filter(isrc=isrc, genre_id=genre_id).select_related("service")
-
-            # Collect service positions
-            service_positions = {}
-            for service_track in service_tracks:
-                service_positions[service_track.service.name] = service_track.position
-
-            # Determine aggregate rank based on service priority
-            aggregate_rank = self.get_aggregate_rank(service_positions)
+        cross_service_matches = self.find_cross_service_isrcs(genre_ids)
+        self.create_aggregate_playlists(cross_service_matches, genre_ids)
+        self.create_tunemeld_raw_playlist_data(genre_ids)
 
-            cross_service_matches[genre_id].append(
-                {
+    def find_cross_service_isrcs(self, genre_ids: set[int] | None = None) -> dict[int, list[dict]]:
+        """Group ServiceTracks by (isrc, genre) from one query, keeping ISRCs seen on more than one service."""
+        service_track_rows = ServiceTrackModel.objects.order_by("id").values_list(
+            "id", "isrc", "genre_id", "service__name", "position", "track_id"
+        )
+        if genre_ids is not None:
+            service_track_rows = service_track_rows.filter(genre_id__in=genre_ids)
+
+        grouped: dict[tuple[str, int], dict[str, Any]] = {}
+        for service_track_id, isrc, genre_id, service_name, position, track_id in service_track_rows.iterator():
+            match = grouped.get((isrc, genre_id))
+            if match is None:
+                # The lowest-id ServiceTrack is the reference row the aggregate playlist points at
+                match = grouped[(isrc, genre_id)] = {
                     "isrc": isrc,
-                    "service_positions": service_positions,
-                    "service_tracks": service_tracks,
-                    "aggregate_rank": aggregate_rank,
+                    "genre_id": genre_id,
+                    "service_positions": {},
+                    "service_track_id": service_track_id,
+                    "track_id": track_id,
                 }
-            )
+            match["service_positions"][service_name] = position
 
-        return cross_service_matches
-
-    def get_aggregate_rank(self, service_positions: dict[str, int]) -> float:
-        # Check if track appears on all three main services
-        has_all_three_services = all(
-            service.value in service_positions
-            for service in [ServiceName.SPOTIFY, ServiceName.APPLE_MUSIC, ServiceName.SOUNDCLOUD]
-        )
+        matches = [match for match in grouped.values() if len(match["service_positions"]) > 1]
+        aggregate_ranks = self.get_aggregate_ranks([match["service_positions"] for match in matches])
 
-        # Sum all the ranks from services the track appears on
-        total_rank = sum(service_positions.values())
+        cross_service_matches = defaultdict(list)
+        for match, aggregate_rank in zip(matches, aggregate_ranks.tolist(), strict=True):
+            match["aggregate_rank"] = aggregate_rank
+            cross_service_matches[match["genre_id"]].append(match)
 
-        # Tracks on all three services get priority (lower range)
-        if has_all_three_services:
-            # Best possible score is 3 (rank 1 on all 3 services)
-            # Worst in this tier would be ~150 (rank 50 on all 3 services)
-            return float(total_rank)
+        return cross_service_matches
 
-        # Tracks on 2 services get secondary priority (higher range)
-        else:
-            # Add penalty to ensure 2-service tracks rank below 3-service tracks
-            # Even the best 2-service track (rank 1+1=2) becomes 1002
-            return 1000.0 + float(total_rank)
+    def get_aggregate_ranks(self, service_positions_list: list[dict[str, int]]) -> np.ndarray:
+        """Aggregate rank for every match at once: the sum of its service positions.
+
+        Tracks on all three main services keep that sum (best possible is 3, rank 1 everywhere).
+        Tracks on fewer services get a 1000 penalty so they always rank below three-service tracks.
+        """
+        main_services = [ServiceName.SPOTIFY.value, ServiceName.APPLE_MUSIC.value, ServiceName.SOUNDCLOUD.value]
+        total_ranks = np.fromiter(
+            (sum(service_positions.values()) for service_positions in service_positions_list),
+            dtype=np.float64,
+            count=len(service_positions_list),
+        )
+        has_all_three_services = np.fromiter(
+            (
+                all(service in service_positions for service in main_services)
+                for service_positions in service_positions_list
+            ),
+            dtype=bool,
+            count=len(service_positions_list),
+        )
+        return np.where(has_all_three_services, total_ranks, 1000.0 + total_ranks)
 
-    def create_aggregate_playlists(self, cross_service_matches: dict[int, list[dict]]) -> None:
+    def create_aggregate_playlists(
+        self, cross_service_matches: dict[int, list[dict]], genre_ids: set[int] | None = None
+    ) -> None:
         aggregate_service = get_service(ServiceName.TUNEMELD)
         if not aggregate_service:
             raise ValueError("TuneMeld service not found in database")
 
-        with transaction.atomic():
-            logger.info("Clearing existing TuneMeld aggregate playlists")
-            PlaylistModel.objects.filter(service_id=aggregate_service.id).delete()
-
-            for genre_id, matches in cross_service_matches.items():
-                genre = get_genre_by_id(genre_id)
-                if not genre:
-                    logger.warning(f"Genre with id {genre_id} not found, skipping")
-                    continue
-
-                sorted_matches = sorted(matches, key=lambda x: x["aggregate_rank"])
+        genres = GenreModel.objects.in_bulk(list(cross_service_matches))
 
-                playlist_count = 0
-                for position, match in enumerate(sorted_matches, 1):
-                    reference_service_track = match["service_tracks"].first()
+        playlist_rows = []
+        ranked_tracks = []
+        for genre_id, matches in cross_service_matches.items():
+            genre = genres.get(genre_id)
+            if not genre:
+                logger.warning(f"Genre with id {genre_id} not found, skipping")
+                continue
 
-                    PlaylistModel.objects.update_or_create(
+            sorted_matches = sorted(matches, key=lambda x: x["aggregate_rank"])
+            for position, match in enumerate(sorted_matches, 1):
+                playlist_rows.append(
+                    PlaylistModel(
                         service_id=aggregate_service.id,
                         genre_id=genre.id,
                         position=position,
-                        defaults={
-                            "isrc": match["isrc"],
-                            "service_track": reference_service_track,
-                        },
+                        isrc=match["isrc"],
+                        service_track_id=match["service_track_id"],
                     )
+                )
+                if match["track_id"]:
+                    ranked_tracks.append(TrackModel(id=match["track_id"], aggregate_rank=int(match["aggregate_rank"])))
 
-                    if reference_service_track and reference_service_track.track:
-                        TrackModel.objects.filter(id=reference_service_track.track.id).update(
-                            aggregate_rank=int(match["aggregate_rank"])
-                        )
-
-                    playlist_count += 1
+            logger.info(f"Created aggregate playlist for {genre.name}: {len(sorted_matches)} tracks")
 
-                logger.info(f"Created aggregate playlist for {genre.name}: {playlist_count} tracks")
-
-    def create_tunemeld_raw_playlist_data(self) -> None:
+        with transaction.atomic():
+            logger.info("Clearing existing TuneMeld aggregate playlists")
+            existing_playlists = PlaylistModel.objects.filter(service_id=aggregate_service.id)
+            if genre_ids is not None:
+                existing_playlists = existing_playlists.filter(genre_id__in=genre_ids)
+            existing_playlists.delete()
+            PlaylistModel.objects.bulk_create(playlist_rows, batch_size=BULK_WRITE_BATCH_SIZE)
+            TrackModel.objects.bulk_update(ranked_tracks, ["aggregate_rank"], batch_size=BULK_WRITE_BATCH_SIZE)
+
+    def create_tunemeld_raw_playlist_data(self, genre_ids: set[int] | None = None) -> None:
         aggregate_service = get_service(ServiceName.TUNEMELD)
         if not aggregate_service:
             raise ValueError("TuneMeld service not found in database")
         tunemeld_config = SERVICE_CONFIGS[ServiceName.TUNEMELD.value]
 
         genres_with_playlists = GenreModel.objects.filter(playlistmodel__service_id=aggregate_service.id).distinct()
+        if genre_ids is not None:
+            genres_with_playlists = genres_with_playlists.filter(id__in=genre_ids)
 
         for genre in genres_with_playlists:
             genre_display_name = GENRE_CONFIGS.get(genre.name, {}).get("display_name", genre.name.title())
@@ -0,0 +1,84 @@
+import hashlib
+from collections.abc import Callable
+
+from core.utils.redis_cache import get_cache_generation, get_cache_generation_updated_at
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from backend.gql.views import CACHEABLE_OPERATIONS, RESPONSE_CACHEABLE_ATTR
+
+# Data that only changes when the ETL swaps the cache generation: browsers revalidate, the edge keeps a copy
+GENERATION_CACHE_CONTROL = "public, max-age=0, s-maxage=300, stale-while-revalidate=86400"
+# EDM events are refreshed hourly from GitHub, independent of the ETL
+EVENTS_CACHE_CONTROL = "public, max-age=0, s-maxage=3600, stale-while-revalidate=3600"
+
+GENERATION_SCOPED_PATHS = frozenset(
+    {"/api/trending-isrcs/", *(f"/api/{operation_name}/" for operation_name in CACHEABLE_OPERATIONS)}
+)
+EVENTS_PATHS = frozenset({"/api/edm-events/", "/edm-events/"})
+
+
+class HttpCacheMiddleware:
+    """Emit ETag/Last-Modified and Cache-Control headers and answer conditional GETs with 304.
+
+    ETL-scoped responses get a strong ETag derived from the cache generation and the full request path,
+    so a matching If-None-Match is answered before the view runs. Other cacheable responses are
+    validated against a hash of their body.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in ("GET", "HEAD"):
+            return self.get_response(request)
+
+        generation_etag = None
+        if "HTTP_IF_NONE_MATCH" in request.META or request.path in GENERATION_SCOPED_PATHS:
+            generation_etag = self._generation_etag(request)
+            if self._is_not_modified(request, generation_etag):
+                return self._not_modified(generation_etag)
+
+        response = self.get_response(request)
+        if response.status_code != 200 or response.streaming:
+            return response
+
+        if getattr(request, RESPONSE_CACHEABLE_ATTR, False) or request.path == "/api/trending-isrcs/":
+            return self._add_generation_headers(response, generation_etag or self._generation_etag(request))
+
+        if request.path in EVENTS_PATHS:
+            response["ETag"] = quote_etag(hashlib.sha256(response.content).hexdigest())
+            response["Cache-Control"] = EVENTS_CACHE_CONTROL
+            return get_conditional_response(request, etag=response["ETag"], response=response)
+
+        return response
+
+    @staticmethod
+    def _generation_etag(request: HttpRequest) -> str:
+        digest = hashlib.sha256(f"{get_cache_generation()}:{request.get_full_path()}".encode()).hexdigest()
+        return quote_etag(f"g{digest[:32]}")
+
+    @staticmethod
+    def _is_not_modified(request: HttpRequest, etag: str) -> bool:
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+        if request.path not in GENERATION_SCOPED_PATHS:
+            return False
+        if_modified_since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+        updated_at = get_cache_generation_updated_at()
+        return if_modified_since is not None and updated_at is not None and int(updated_at) <= if_modified_since
+
+    @staticmethod
+    def _add_generation_headers(response: HttpResponse, etag: str) -> HttpResponse:
+        response["ETag"] = etag
+        response["Cache-Control"] = GENERATION_CACHE_CONTROL
+        updated_at = get_cache_generation_updated_at()
+        if updated_at is not None:
+            response["Last-Modified"] = http_date(updated_at)
+        return response
+
+    def _not_modified(self, etag: str) -> HttpResponse:
+        return self._add_generation_headers(HttpResponseNotModified(), etag)
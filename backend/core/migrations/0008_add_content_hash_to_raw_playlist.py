@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_add_updated_at_to_raw_playlist"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rawplaylistdatamodel",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the raw data as extracted in Step A",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="rawplaylistdatamodel",
+            name="processed_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="content_hash the downstream stages last completed for; differs while a change is pending",
+                max_length=64,
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_add_content_hash_to_raw_playlist"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EtlRunModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("completed", "Completed"), ("failed", "Failed")],
+                        default="running",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "force_refresh",
+                    models.BooleanField(default=False, help_text="Whether RapidAPI caches were bypassed"),
+                ),
+                (
+                    "full_rebuild",
+                    models.BooleanField(default=False, help_text="Whether unchanged playlists were reprocessed"),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "etl_runs",
+                "ordering": ["-id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="etlrunmodel",
+            index=models.Index(fields=["status", "-id"], name="etl_runs_status_c73191_idx"),
+        ),
+        migrations.CreateModel(
+            name="EtlStageCheckpointModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "stage",
+                    models.CharField(help_text="Stage unit name, e.g. extract:spotify:pop", max_length=100),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("completed", "Completed"), ("failed", "Failed")],
+                        default="running",
+                        max_length=16,
+                    ),
+                ),
+                ("result", models.JSONField(blank=True, help_text="JSON returned by the stage", null=True)),
+                ("error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkpoints",
+                        to="core.etlrunmodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "etl_stage_checkpoints",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="etlstagecheckpointmodel",
+            constraint=models.UniqueConstraint(fields=("run", "stage"), name="unique_etl_checkpoint_stage"),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_etl_runs_and_stage_checkpoints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="etlrunmodel",
+            name="pipeline",
+            field=models.CharField(
+                choices=[("playlist_etl", "Playlist ETL"), ("play_count", "Play count ETL")],
+                default="playlist_etl",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="etlrunmodel",
+            name="duration_seconds",
+            field=models.FloatField(blank=True, help_text="Wall-clock time of the last attempt", null=True),
+        ),
+        migrations.AddField(
+            model_name="etlrunmodel",
+            name="db_query_count",
+            field=models.IntegerField(default=0, help_text="Database queries issued by the run"),
+        ),
+        migrations.AddField(
+            model_name="etlrunmodel",
+            name="http_stats",
+            field=models.JSONField(blank=True, default=dict, help_text="Requests, errors and bytes per host"),
+        ),
+        migrations.AddField(
+            model_name="etlrunmodel",
+            name="external_calls",
+            field=models.JSONField(blank=True, default=dict, help_text="Lookup counts per service and outcome"),
+        ),
+        migrations.AddField(
+            model_name="etlstagecheckpointmodel",
+            name="row_count",
+            field=models.IntegerField(
+                blank=True, help_text="Rows the stage produced, when it reports them", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="etlstagecheckpointmodel",
+            name="duration_seconds",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="etlrunmodel",
+            index=models.Index(fields=["pipeline", "-id"], name="etl_runs_pipelin_4a6a87_idx"),
+        ),
+    ]
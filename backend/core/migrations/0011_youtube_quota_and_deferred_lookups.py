@@ -0,0 +1,42 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_etl_run_ledger_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="YouTubeQuotaUsageModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("quota_date", models.DateField(unique=True)),
+                ("units_used", models.IntegerField(default=0)),
+                (
+                    "exhausted",
+                    models.BooleanField(default=False, help_text="Whether the API reported quotaExceeded"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "youtube_quota_usage",
+            },
+        ),
+        migrations.CreateModel(
+            name="DeferredYouTubeLookupModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("isrc", models.CharField(max_length=12, unique=True)),
+                ("track_name", models.CharField(max_length=500)),
+                ("artist_name", models.CharField(max_length=500)),
+                ("deferrals", models.IntegerField(default=0, help_text="Passes this lookup was left unserved")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "deferred_youtube_lookups",
+            },
+        ),
+    ]
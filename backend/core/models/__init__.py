@@ -1,4 +1,10 @@
 # Django models exports - only models with Model suffix
+from core.models.etl import (
+    DeferredYouTubeLookupModel,
+    EtlRunModel,
+    EtlStageCheckpointModel,
+    YouTubeQuotaUsageModel,
+)
 from core.models.genre_service import GenreModel, ServiceModel
 from core.models.play_counts import AggregatePlayCountModel, HistoricalTrackPlayCountModel
 from core.models.playlist import (
@@ -11,6 +17,9 @@ from core.models.track import TrackModel
 
 __all__ = [
     "AggregatePlayCountModel",
+    "DeferredYouTubeLookupModel",
+    "EtlRunModel",
+    "EtlStageCheckpointModel",
     "GenreModel",
     "HistoricalTrackPlayCountModel",
     "PlaylistModel",
@@ -19,4 +28,5 @@ __all__ = [
     "ServiceModel",
     "ServiceTrackModel",
     "TrackModel",
+    "YouTubeQuotaUsageModel",
 ]
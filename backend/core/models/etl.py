@@ -0,0 +1,133 @@
+"""
+ETL bookkeeping models: pipeline runs and their per-stage checkpoints, YouTube quota usage and deferred lookups.
+
+Written by: playlist_etl and play_count as their stages execute
+Used by: playlist_etl --resume, compare_etl_runs, /api/etl-runs/ and the YouTube quota budget
+"""
+
+from typing import ClassVar
+
+from django.db import models
+
+
+class EtlRunModel(models.Model):
+    """
+    One execution of an ETL pipeline, with its cost: duration, DB queries, HTTP traffic per host
+    and external lookups per service and outcome.
+
+    A playlist ETL run that did not complete can be resumed; its completed stage checkpoints are reused.
+    """
+
+    PIPELINE_PLAYLIST_ETL = "playlist_etl"
+    PIPELINE_PLAY_COUNT = "play_count"
+    PIPELINE_CHOICES: ClassVar = [
+        (PIPELINE_PLAYLIST_ETL, "Playlist ETL"),
+        (PIPELINE_PLAY_COUNT, "Play count ETL"),
+    ]
+
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES: ClassVar = [
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    pipeline = models.CharField(max_length=32, choices=PIPELINE_CHOICES, default=PIPELINE_PLAYLIST_ETL)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+    force_refresh = models.BooleanField(default=False, help_text="Whether RapidAPI caches were bypassed")
+    full_rebuild = models.BooleanField(default=False, help_text="Whether unchanged playlists were reprocessed")
+    error = models.TextField(blank=True, default="")
+    duration_seconds = models.FloatField(null=True, blank=True, help_text="Wall-clock time of the last attempt")
+    db_query_count = models.IntegerField(default=0, help_text="Database queries issued by the run")
+    http_stats = models.JSONField(default=dict, blank=True, help_text="Requests, errors and bytes per host")
+    external_calls = models.JSONField(default=dict, blank=True, help_text="Lookup counts per service and outcome")
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "etl_runs"
+        indexes: ClassVar = [
+            models.Index(fields=["status", "-id"]),
+            models.Index(fields=["pipeline", "-id"]),
+        ]
+        ordering: ClassVar = ["-id"]
+
+    def __str__(self) -> str:
+        return f"ETL run {self.id} ({self.status})"
+
+
+class EtlStageCheckpointModel(models.Model):
+    """
+    Outcome of one stage unit within a run, e.g. "normalize:spotify:pop".
+
+    result holds the JSON the stage returned, so dependents can be scheduled from it on resume.
+    """
+
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES: ClassVar = [
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    run = models.ForeignKey(EtlRunModel, on_delete=models.CASCADE, related_name="checkpoints")
+    stage = models.CharField(max_length=100, help_text="Stage unit name, e.g. extract:spotify:pop")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+    result = models.JSONField(null=True, blank=True, help_text="JSON returned by the stage")
+    row_count = models.IntegerField(null=True, blank=True, help_text="Rows the stage produced, when it reports them")
+    duration_seconds = models.FloatField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "etl_stage_checkpoints"
+        constraints: ClassVar = [models.UniqueConstraint(fields=["run", "stage"], name="unique_etl_checkpoint_stage")]
+
+    def __str__(self) -> str:
+        return f"{self.stage} ({self.status}) in run {self.run_id}"
+
+
+class YouTubeQuotaUsageModel(models.Model):
+    """YouTube Data API units spent on one quota day (quota resets at midnight Pacific time)."""
+
+    id = models.BigAutoField(primary_key=True)
+    quota_date = models.DateField(unique=True)
+    units_used = models.IntegerField(default=0)
+    exhausted = models.BooleanField(default=False, help_text="Whether the API reported quotaExceeded")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "youtube_quota_usage"
+
+    def __str__(self) -> str:
+        return f"YouTube quota {self.quota_date}: {self.units_used} units"
+
+
+class DeferredYouTubeLookupModel(models.Model):
+    """
+    A YouTube URL search waiting for quota, one per ISRC.
+
+    c_track queues tracks without a known URL; the next quota-aware pass serves items deferred by earlier runs
+    first, then by value, and removes them once they are resolved or known to have no video.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    isrc = models.CharField(max_length=12, unique=True)
+    track_name = models.CharField(max_length=500)
+    artist_name = models.CharField(max_length=500)
+    deferrals = models.IntegerField(default=0, help_text="Passes this lookup was left unserved")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "deferred_youtube_lookups"
+
+    def __str__(self) -> str:
+        return f"{self.isrc} ({self.deferrals} deferrals)"
@@ -5,6 +5,8 @@ This model stores unprocessed playlist data as received from external APIs.
 The data is then normalized in Phase 3 and hydrated in Phase 4.
 """
 
+import hashlib
+import json
 from typing import Any, ClassVar, TypedDict
 
 from core.models.genre_service import GenreModel, ServiceModel
@@ -38,6 +40,15 @@ class RawPlaylistDataModel(models.Model):
     playlist_cover_description_text = models.TextField(blank=True, help_text="Cover image description")
 
     data = models.JSONField(help_text="Raw JSON data from service API")
+    content_hash = models.CharField(
+        max_length=64, blank=True, default="", help_text="SHA-256 of the raw data as extracted in Step A"
+    )
+    processed_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="content_hash the downstream stages last completed for; differs while a change is pending",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -58,6 +69,16 @@ class RawPlaylistDataModel(models.Model):
     def __str__(self) -> str:
         return f"Raw {self.service.name} {self.genre.name} data"
 
+    @staticmethod
+    def compute_content_hash(data: Any) -> str:
+        """Stable hash of raw playlist data, independent of dict key order."""
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @property
+    def has_pending_changes(self) -> bool:
+        return not self.content_hash or self.content_hash != self.processed_hash
+
 
 class PlaylistModel(models.Model):
     """
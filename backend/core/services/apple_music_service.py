@@ -2,7 +2,6 @@ import time
 from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
-import requests
 from bs4 import BeautifulSoup, Tag
 
 if TYPE_CHECKING:
@@ -10,6 +9,7 @@ if TYPE_CHECKING:
 from core.constants import GENRE_CONFIGS, SERVICE_CONFIGS, ServiceName
 from core.models.playlist import PlaylistData, PlaylistMetadata
 from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.http_client import http_get
 from core.utils.rapid_api_client import fetch_playlist_data
 from core.utils.utils import clean_unicode_text, get_logger
 
@@ -25,7 +25,7 @@ def get_apple_music_album_cover_url(track_url: str) -> str | None:
 
     logger.info(f"Apple Music Album Cover Cache miss for URL: {track_url}")
     try:
-        response = requests.get(track_url, timeout=5)
+        response = http_get(track_url, timeout=5)
         response.raise_for_status()
         doc = BeautifulSoup(response.text, "html.parser")
 
@@ -44,7 +44,7 @@ def get_apple_music_album_cover_url(track_url: str) -> str | None:
 
 def _get_apple_music_cover_url_static(url: str, genre: "GenreName") -> str | None:
     """Get Apple Music playlist cover URL using static HTML extraction"""
-    response = requests.get(url, timeout=5)
+    response = http_get(url, timeout=5)
     response.raise_for_status()
     doc = BeautifulSoup(response.text, "html.parser")
 
@@ -66,7 +66,7 @@ def get_apple_music_playlist(genre: "GenreName", force_refresh: bool = False) ->
 
     tracks_data = fetch_playlist_data(ServiceName.APPLE_MUSIC, genre, force_refresh)
 
-    response = requests.get(url, timeout=5)
+    response = http_get(url, timeout=5)
     response.raise_for_status()
     doc = BeautifulSoup(response.text, "html.parser")
 
@@ -1,6 +1,13 @@
 import os
 
-from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.cloudflare_cache import (
+    CachePrefix,
+    cloudflare_cache_get,
+    cloudflare_cache_set,
+    cloudflare_cache_set_not_found,
+    is_cached_not_found,
+)
+from core.utils.single_flight import SingleFlight
 from core.utils.utils import get_logger
 from django.conf import settings
 
@@ -11,6 +18,8 @@ else:
 
 logger = get_logger(__name__)
 
+_genius_url_lookups = SingleFlight("genius_url")
+
 
 def get_genius_url(track_name: str, artist_name: str, api_key: str | None = None) -> str | None:
     """Get Genius lyrics page URL for a track."""
@@ -24,7 +33,14 @@ def get_genius_url(track_name: str, artist_name: str, api_key: str | None = None
         return None
 
     key_data = f"{track_name}|{artist_name}"
+    return _genius_url_lookups.do(key_data, lambda: _lookup_genius_url(track_name, artist_name, api_key, key_data))
+
+
+def _lookup_genius_url(track_name: str, artist_name: str, api_key: str, key_data: str) -> str | None:
     cached_url = cloudflare_cache_get(CachePrefix.GENIUS_URL, key_data)
+    if is_cached_not_found(cached_url):
+        logger.info(f"No Genius page for {track_name} by {artist_name} (cached)")
+        return None
     if cached_url:
         logger.info(f"Genius URL for {track_name} by {artist_name} retrieved from cache")
         return str(cached_url)
@@ -42,6 +58,7 @@ def get_genius_url(track_name: str, artist_name: str, api_key: str | None = None
             return genius_url
         else:
             logger.info(f"No Genius page found for {track_name} by {artist_name}")
+            cloudflare_cache_set_not_found(CachePrefix.GENIUS_URL, key_data)
             return None
 
     except Exception as e:
@@ -1,5 +1,11 @@
-import requests
-from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.cloudflare_cache import (
+    CachePrefix,
+    cloudflare_cache_get,
+    cloudflare_cache_set,
+    cloudflare_cache_set_not_found,
+    is_cached_not_found,
+)
+from core.utils.http_client import http_get
 from core.utils.utils import get_logger
 
 logger = get_logger(__name__)
@@ -15,10 +21,10 @@ def fetch_reccobeats_track_id(spotify_id: str) -> str | None:
     cache_key = f"track_id:{spotify_id}"
     cached = cloudflare_cache_get(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key)
     if cached is not None:
-        return cached if cached != "NOT_FOUND" else None
+        return None if is_cached_not_found(cached) else cached
 
     try:
-        response = requests.get(
+        response = http_get(
             f"{RECCOBEATS_BASE_URL}/track?ids={spotify_id}",
             headers={"Accept": "application/json"},
             timeout=10,
@@ -31,7 +37,7 @@ def fetch_reccobeats_track_id(spotify_id: str) -> str | None:
             cloudflare_cache_set(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key, reccobeats_id)
             return reccobeats_id
         else:
-            cloudflare_cache_set(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key, "NOT_FOUND")
+            cloudflare_cache_set_not_found(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key)
             logger.info(f"Track not found in ReccoBeats: {spotify_id}")
             return None
 
@@ -52,15 +58,15 @@ def fetch_reccobeats_audio_features(spotify_id: str) -> dict | None:
     cache_key = f"audio_features:{spotify_id}"
     cached = cloudflare_cache_get(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key)
     if cached is not None:
-        return cached if cached != "NOT_FOUND" else None
+        return None if is_cached_not_found(cached) else cached
 
     reccobeats_id = fetch_reccobeats_track_id(spotify_id)
     if not reccobeats_id:
-        cloudflare_cache_set(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key, "NOT_FOUND")
+        cloudflare_cache_set_not_found(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key)
         return None
 
     try:
-        response = requests.get(
+        response = http_get(
             f"{RECCOBEATS_BASE_URL}/track/{reccobeats_id}/audio-features",
             headers={"Accept": "application/json"},
             timeout=10,
@@ -69,7 +75,7 @@ def fetch_reccobeats_audio_features(spotify_id: str) -> dict | None:
         data = response.json()
 
         if not data:
-            cloudflare_cache_set(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key, "NOT_FOUND")
+            cloudflare_cache_set_not_found(CachePrefix.RECCOBEATS_AUDIO_FEATURES, cache_key)
             return None
 
         features = {
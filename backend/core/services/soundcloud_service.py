@@ -1,11 +1,12 @@
 import html
 import re
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import TYPE_CHECKING
 from urllib.parse import quote_plus, urlparse
 
-import requests
 from bs4 import BeautifulSoup, Tag
 
 # ETL-only imports - conditionally imported to avoid Vercel serverless bloat
@@ -22,15 +23,36 @@ if TYPE_CHECKING:
     from core.constants import GenreName
 from core.constants import GENRE_CONFIGS, SERVICE_CONFIGS, ServiceName
 from core.models.playlist import PlaylistData, PlaylistMetadata
-from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.cloudflare_cache import (
+    CachePrefix,
+    cloudflare_cache_get,
+    cloudflare_cache_set,
+    cloudflare_cache_set_not_found,
+    is_cached_not_found,
+)
+from core.utils.http_client import http_get
 from core.utils.rapid_api_client import fetch_playlist_data
+from core.utils.single_flight import SingleFlight
 from core.utils.utils import clean_unicode_text, get_logger
 
 logger = get_logger(__name__)
 
+SOUNDCLOUD_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+# Search results scored per query, how many of the best are verified, and how many pages are fetched at once
+SOUNDCLOUD_SEARCH_RESULTS = 8
+SOUNDCLOUD_VERIFY_TOP_K = 4
+SOUNDCLOUD_VERIFY_CONCURRENCY = 2
+
+_soundcloud_url_lookups = SingleFlight("soundcloud_url")
+
 
 class SoundCloudUrlResult(Enum):
     CACHE_HIT = "cache_hit"
+    CACHE_HIT_NOT_FOUND = "cache_hit_not_found"
     SCRAPE_SUCCESS = "scrape_success"
     SCRAPE_FAILURE_NOT_FOUND = "scrape_failure_not_found"
     SCRAPE_FAILURE_ERROR = "scrape_failure_error"
@@ -46,7 +68,7 @@ def get_soundcloud_playlist(genre: "GenreName", force_refresh: bool = False) ->
     parsed_url = urlparse(url)
     clean_url = f"{parsed_url.netloc}{parsed_url.path}"
 
-    response = requests.get(f"https://{clean_url}")
+    response = http_get(f"https://{clean_url}")
     response.raise_for_status()
     doc = BeautifulSoup(response.text, "html.parser")
 
@@ -114,15 +136,9 @@ def get_soundcloud_playlist(genre: "GenreName", force_refresh: bool = False) ->
 def get_soundcloud_track_view_count(track_url: str) -> int:
     """Get SoundCloud track view count from meta tag."""
     logger.info(f"Accessing SoundCloud URL: {track_url}")
-    user_agent = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/91.0.4472.124 Safari/537.36"
-    )
-
-    response = requests.get(
+    response = http_get(
         track_url,
-        headers={"User-Agent": user_agent},
+        headers={"User-Agent": SOUNDCLOUD_USER_AGENT},
         timeout=10,
     )
     response.raise_for_status()
@@ -148,17 +164,11 @@ def get_soundcloud_track_view_count(track_url: str) -> int:
 
 
 def _verify_soundcloud_track_page(url: str, expected_track_name: str, expected_artist_name: str) -> bool:
-    """Visit the SoundCloud track page to verify it matches our expected track/artist."""
-    try:
-        user_agent = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Safari/537.36"
-        )
-
-        response = requests.get(url, headers={"User-Agent": user_agent}, timeout=10)
-        response.raise_for_status()
+    """Visit the SoundCloud track page to verify it matches our expected track/artist. Fetch failures raise."""
+    response = http_get(url, headers={"User-Agent": SOUNDCLOUD_USER_AGENT}, timeout=10)
+    response.raise_for_status()
 
+    try:
         soup = BeautifulSoup(response.text, "html.parser")
 
         # Get track title from og:title or page title
@@ -181,14 +191,7 @@ def _verify_soundcloud_track_page(url: str, expected_track_name: str, expected_a
         # Must have good track name overlap AND some artist overlap
         track_words = set(_normalize_text(expected_track_name).split())
 
-        # Get first artist (try comma first, then ampersand)
-        first_artist = expected_artist_name
-        if "," in expected_artist_name:
-            first_artist = expected_artist_name.split(",")[0].strip()
-        elif "&" in expected_artist_name:
-            first_artist = expected_artist_name.split("&")[0].strip()
-
-        artist_words = set(_normalize_text(first_artist).split())
+        artist_words = set(_normalize_text(_get_first_artist(expected_artist_name)).split())
 
         track_overlap = len(track_words.intersection(actual_words))
         artist_overlap = len(artist_words.intersection(actual_words))
@@ -234,16 +237,16 @@ def _normalize_text(text: str) -> str:
 def get_soundcloud_url(track_name: str, artist_name: str) -> tuple[str | None, SoundCloudUrlResult]:
     """Find SoundCloud URL for a track by searching SoundCloud."""
     key_data = f"{track_name}|{artist_name}"
+    return _soundcloud_url_lookups.do(key_data, lambda: _lookup_soundcloud_url(track_name, artist_name, key_data))
+
+
+def _lookup_soundcloud_url(track_name: str, artist_name: str, key_data: str) -> tuple[str | None, SoundCloudUrlResult]:
     cached_url = cloudflare_cache_get(CachePrefix.SOUNDCLOUD_URL, key_data)
+    if is_cached_not_found(cached_url):
+        return None, SoundCloudUrlResult.CACHE_HIT_NOT_FOUND
     if cached_url:
         return str(cached_url), SoundCloudUrlResult.CACHE_HIT
 
-    user_agent = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/91.0.4472.124 Safari/537.36"
-    )
-
     # Generate artist variations: full, first artist only
     artist_variations = [artist_name]
 
@@ -259,53 +262,145 @@ def get_soundcloud_url(track_name: str, artist_name: str) -> tuple[str | None, S
         if first_artist_ampersand not in artist_variations:
             artist_variations.append(first_artist_ampersand)
 
-    # Try each artist variation
+    # Try each artist variation, verifying only the best-scored results of each search
+    request_failed = False
+    found_url = None
+    verified_urls: set[str] = set()
+    request_count = 0
     for artist_variant in artist_variations:
         query = f"{artist_variant} {track_name}"
         search_url = f"https://soundcloud.com/search/sounds?q={quote_plus(query)}"
 
         try:
             logger.info(f"Searching SoundCloud: {query}")
-            response = requests.get(search_url, headers={"User-Agent": user_agent}, timeout=10)
+            request_count += 1
+            response = http_get(search_url, headers={"User-Agent": SOUNDCLOUD_USER_AGENT}, timeout=10)
             response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"SoundCloud search failed for {track_name} by {artist_variant}: {e}")
+            request_failed = True
+            continue
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            track_links = soup.find_all("a", href=re.compile(r"^/[^/]+/[^/]+$"))
-
-            # Check each result - take first few candidates and verify by visiting the page
-            for link in track_links[:8]:  # Check first 8 results (skip navigation links)
-                if not isinstance(link, Tag):
-                    continue
+        candidate_urls = [
+            url
+            for url in _rank_soundcloud_search_results(response.text, track_name, artist_name)
+            if url not in verified_urls
+        ][:SOUNDCLOUD_VERIFY_TOP_K]
+        verified_urls.update(candidate_urls)
 
-                href = link.get("href")
-                if href and isinstance(href, str) and not href.startswith(("http", "//")):
-                    full_url = f"https://soundcloud.com{href}"
+        found_url, pages_fetched, fetch_failed = _verify_soundcloud_candidates(candidate_urls, track_name, artist_name)
+        request_count += pages_fetched
+        request_failed = request_failed or fetch_failed
+        if found_url:
+            break
 
-                    # Get the title for basic filtering
-                    title_element = link.find("span") or link
-                    if isinstance(title_element, Tag):
-                        title_text = title_element.get_text(strip=True)
+    logger.info(f"SoundCloud lookup for {track_name} by {artist_name} made {request_count} requests")
 
-                        # Basic filtering: track name should have some overlap
-                        track_words = set(_normalize_text(track_name).split())
-                        title_words = set(_normalize_text(title_text).split())
+    if found_url:
+        logger.info(f"Found SoundCloud URL for {track_name} by {artist_name}: {found_url}")
+        cloudflare_cache_set(CachePrefix.SOUNDCLOUD_URL, key_data, found_url)
+        return found_url, SoundCloudUrlResult.SCRAPE_SUCCESS
 
-                        if len(track_words) == 0:
-                            continue
+    # A failed search or page fetch is retried next run rather than remembered as not found
+    if request_failed:
+        return None, SoundCloudUrlResult.SCRAPE_FAILURE_ERROR
 
-                        track_overlap = len(track_words.intersection(title_words))
-                        track_match_percentage = (track_overlap / len(track_words)) * 100
+    logger.info(f"No SoundCloud track found for {track_name} by {artist_name}")
+    cloudflare_cache_set_not_found(CachePrefix.SOUNDCLOUD_URL, key_data)
+    return None, SoundCloudUrlResult.SCRAPE_FAILURE_NOT_FOUND
 
-                        # Basic 50% track name filter to avoid completely wrong tracks
-                        if track_match_percentage >= 50.0 and _verify_soundcloud_track_page(
-                            full_url, track_name, artist_name
-                        ):
-                            logger.info(f"Found SoundCloud URL for {track_name} by {artist_name}: {full_url}")
-                            cloudflare_cache_set(CachePrefix.SOUNDCLOUD_URL, key_data, full_url)
-                            return full_url, SoundCloudUrlResult.SCRAPE_SUCCESS
 
+def _rank_soundcloud_search_results(search_html: str, track_name: str, artist_name: str) -> list[str]:
+    """
+    Track URLs from a search results page, best match first.
+
+    Results are scored on their title's overlap with the track name, then on artist overlap with the title and the
+    uploader in the URL. Results matching less than half the track name are dropped.
+    """
+    track_words = set(_normalize_text(track_name).split())
+    if not track_words:
+        return []
+    first_artist = _normalize_text(_get_first_artist(artist_name))
+    artist_words = set(first_artist.split())
+    artist_slug = first_artist.replace(" ", "")
+
+    soup = BeautifulSoup(search_html, "html.parser")
+    track_links = soup.find_all("a", href=re.compile(r"^/[^/]+/[^/]+$"))
+
+    scores: dict[str, tuple[float, float]] = {}
+    for link in track_links[:SOUNDCLOUD_SEARCH_RESULTS]:
+        if not isinstance(link, Tag):
+            continue
+
+        href = link.get("href")
+        if not href or not isinstance(href, str) or href.startswith(("http", "//")):
+            continue
+
+        title_element = link.find("span") or link
+        if not isinstance(title_element, Tag):
+            continue
+
+        title_words = set(_normalize_text(title_element.get_text(strip=True)).split())
+        track_match = len(track_words & title_words) / len(track_words) * 100
+        if track_match < 50.0:
+            continue
+
+        # Uploader slugs usually run the artist's name together ("theweeknd")
+        uploader = _normalize_text(href.split("/")[1]).replace(" ", "")
+        if artist_slug and artist_slug in uploader:
+            artist_match = 100.0
+        else:
+            artist_match = len(artist_words & title_words) / len(artist_words) * 100 if artist_words else 0
+        full_url = f"https://soundcloud.com{href}"
+        scores[full_url] = max(scores.get(full_url, (0.0, 0.0)), (track_match, artist_match))
+
+    # sorted is stable, so equally scored results keep SoundCloud's own ordering
+    return sorted(scores, key=lambda url: scores[url], reverse=True)
+
+
+def _verify_soundcloud_candidates(
+    candidate_urls: list[str], track_name: str, artist_name: str
+) -> tuple[str | None, int, bool]:
+    """
+    Verify ranked candidate pages concurrently.
+
+    Returns the best-ranked match, the number of pages fetched and whether any page fetch failed.
+    Once a candidate matches, lower-ranked candidates that have not been fetched yet are skipped.
+    """
+    lock = threading.Lock()
+    matched_ranks: list[int] = []
+    pages_fetched = 0
+    fetch_failed = False
+
+    def verify(rank: int) -> None:
+        nonlocal pages_fetched, fetch_failed
+        with lock:
+            if matched_ranks and min(matched_ranks) < rank:
+                return
+            pages_fetched += 1
+        try:
+            is_match = _verify_soundcloud_track_page(candidate_urls[rank], track_name, artist_name)
         except Exception as e:
-            logger.warning(f"SoundCloud search failed for {track_name} by {artist_variant}: {e}")
+            logger.warning(f"Failed to fetch SoundCloud track page {candidate_urls[rank]}: {e}")
+            with lock:
+                fetch_failed = True
+            return
+        if is_match:
+            with lock:
+                matched_ranks.append(rank)
 
-    logger.info(f"No SoundCloud track found for {track_name} by {artist_name}")
-    return None, SoundCloudUrlResult.SCRAPE_FAILURE_NOT_FOUND
+    if candidate_urls:
+        with ThreadPoolExecutor(max_workers=min(len(candidate_urls), SOUNDCLOUD_VERIFY_CONCURRENCY)) as executor:
+            list(executor.map(verify, range(len(candidate_urls))))
+
+    best_rank = min(matched_ranks, default=None)
+    return (candidate_urls[best_rank] if best_rank is not None else None), pages_fetched, fetch_failed
+
+
+def _get_first_artist(artist_name: str) -> str:
+    """First artist of a credit (split on comma first, then ampersand)."""
+    if "," in artist_name:
+        return artist_name.split(",")[0].strip()
+    if "&" in artist_name:
+        return artist_name.split("&")[0].strip()
+    return artist_name
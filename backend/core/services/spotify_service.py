@@ -1,10 +1,11 @@
-import builtins
+import base64
 import contextlib
+import json
 import os
 import re
-import time
+from collections.abc import Iterator
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -13,12 +14,6 @@ from django.conf import settings
 from spotipy import Spotify
 from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyClientCredentials
-
-if settings.ETL_DEPENDENCIES_AVAILABLE:
-    from selenium.webdriver.common.by import By
-else:
-    By = None  # type: ignore
-
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 if TYPE_CHECKING:
@@ -29,21 +24,36 @@ from core.utils.cloudflare_cache import (
     CachePrefix,
     cloudflare_cache_get,
     cloudflare_cache_set,
+    cloudflare_cache_set_not_found,
     generate_spotify_cache_key_data,
+    is_cached_not_found,
 )
-from core.utils.utils import clean_unicode_text, get_logger
+from core.utils.http_client import http_get
+from core.utils.single_flight import SingleFlight
+from core.utils.utils import clean_unicode_text, get_logger, process_in_parallel
 
 # ETL utilities - import conditionally
 if settings.ETL_DEPENDENCIES_AVAILABLE:
     from core.utils.spotdl_client import fetch_spotify_playlist_with_spotdl
-    from core.utils.webdriver import get_cached_webdriver
+    from core.utils.webdriver import get_webdriver_pool
 else:
     fetch_spotify_playlist_with_spotdl = None  # type: ignore
-    get_cached_webdriver = None  # type: ignore
+    get_webdriver_pool = None  # type: ignore
 
 logger = get_logger(__name__)
 
 SPOTIFY_VIEW_COUNT_SELECTOR = '[data-testid="playcount"]'
+# How long a track page may take to render its play count
+SPOTIFY_VIEW_COUNT_WAIT_SECONDS = 15
+# Scripts the track page embeds its state in: base64 JSON (initialState) or plain JSON (__NEXT_DATA__)
+SPOTIFY_STATE_SCRIPT_IDS = ("initialState", "__NEXT_DATA__")
+# Blocked or rate-limited page requests, which a browser session can often still load
+SPOTIFY_WEBDRIVER_FALLBACK_STATUS_CODES = (403, 429)
+SPOTIFY_PAGE_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+_spotify_isrc_lookups = SingleFlight("spotify_isrc")
 
 
 @lru_cache(maxsize=4)
@@ -63,7 +73,18 @@ def get_spotify_isrc(
     client_secret = client_secret or os.getenv("SPOTIFY_CLIENT_SECRET")
 
     key_data = f"{track_name}|{artist_name}"
+    return _spotify_isrc_lookups.do(
+        key_data, lambda: _lookup_spotify_isrc(track_name, artist_name, client_id, client_secret, key_data)
+    )
+
+
+def _lookup_spotify_isrc(
+    track_name: str, artist_name: str, client_id: str | None, client_secret: str | None, key_data: str
+) -> str | None:
     isrc = cloudflare_cache_get(CachePrefix.SPOTIFY_ISRC, key_data)
+    if is_cached_not_found(isrc):
+        logger.info(f"No Spotify track for {track_name} by {artist_name} (cached)")
+        return None
     if isrc:
         return str(isrc)
 
@@ -78,14 +99,24 @@ def get_spotify_isrc(
         f"track:{track_name.lower()} artist:{artist_name}",
     ]
 
+    search_failed = False
     for query in queries:
-        isrc = _search_spotify_for_isrc(spotify_client, query)
+        try:
+            isrc = _search_spotify_for_isrc(spotify_client, query)
+        except Exception as e:
+            logger.info(f"Error searching Spotify with query '{query}': {e}")
+            search_failed = True
+            continue
+
         if isrc:
             logger.info(f"Found ISRC for {track_name} by {artist_name}: {isrc}")
             cloudflare_cache_set(CachePrefix.SPOTIFY_ISRC, key_data, isrc)
             return isrc
 
     logger.info(f"No track found on Spotify for {track_name} by {artist_name}")
+    # A failed search is retried next run rather than remembered as not found
+    if not search_failed:
+        cloudflare_cache_set_not_found(CachePrefix.SPOTIFY_ISRC, key_data)
     return None
 
 
@@ -102,16 +133,13 @@ def _clean_track_name(track_name: str) -> str:
 
 
 def _search_spotify_for_isrc(spotify_client: Spotify, query: str) -> str | None:
-    try:
-        results = spotify_client.search(q=query, type="track", limit=1)
-        tracks = results["tracks"]["items"]
-        if tracks:
-            isrc_value = tracks[0]["external_ids"].get("isrc")
-            return str(isrc_value) if isrc_value is not None else None
-        return None
-    except Exception as e:
-        logger.info(f"Error searching Spotify with query '{query}': {e}")
-        return None
+    """ISRC of the top search result, None when the search finds nothing. Search errors propagate."""
+    results = spotify_client.search(q=query, type="track", limit=1)
+    tracks = results["tracks"]["items"]
+    if tracks:
+        isrc_value = tracks[0]["external_ids"].get("isrc")
+        return str(isrc_value) if isrc_value is not None else None
+    return None
 
 
 @retry(
@@ -243,7 +271,7 @@ def get_spotify_playlist(genre: "GenreName", force_refresh: bool = False) -> Pla
 
     tracks_data = fetch_spotify_playlist_with_spotdl(url)
 
-    response = requests.get(url)
+    response = http_get(url)
     response.raise_for_status()
 
     metadata = _extract_spotify_metadata_from_html(url, response.text)
@@ -258,74 +286,126 @@ def get_spotify_playlist(genre: "GenreName", force_refresh: bool = False) -> Pla
     return playlist_data
 
 
-@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3), reraise=True)
-def get_spotify_track_view_count(track_url: str) -> int:
-    """Get Spotify track view count using webdriver if available, otherwise return 0."""
-    if settings.ETL_DEPENDENCIES_AVAILABLE and get_cached_webdriver is not None:
+def get_spotify_track_view_count_with_http(track_url: str) -> int | None:
+    """
+    Get Spotify track view count from the state JSON embedded in the track page, without a browser.
+
+    Returns None when the page has no parseable play count; request failures raise.
+    """
+    response = http_get(track_url, headers={"User-Agent": SPOTIFY_PAGE_USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+    response.raise_for_status()
+    return parse_spotify_play_count_from_html(response.text, extract_spotify_track_id_from_url(track_url))
+
+
+def parse_spotify_play_count_from_html(page_html: str, track_id: str) -> int | None:
+    """Play count from a track page's state script: base64 JSON in initialState, or JSON in __NEXT_DATA__."""
+    soup = BeautifulSoup(page_html, "html.parser")
+    for script_id in SPOTIFY_STATE_SCRIPT_IDS:
+        script = soup.find("script", id=script_id)
+        if not isinstance(script, Tag) or not script.string:
+            continue
+
+        state = _decode_spotify_state(script.string)
+        if state is None:
+            continue
+
+        # Related tracks carry their own play counts, so only an entity with the page's track uri counts
+        play_count = dict(_find_play_counts(state)).get(f"spotify:track:{track_id}")
+        if play_count is not None:
+            return play_count
+    return None
+
+
+def _decode_spotify_state(script_text: str) -> Any:
+    script_text = script_text.strip()
+    with contextlib.suppress(ValueError):
+        return json.loads(script_text)
+    with contextlib.suppress(ValueError):
+        return json.loads(base64.b64decode(script_text, validate=True))
+    return None
+
+
+def _find_play_counts(node: Any) -> Iterator[tuple[str | None, int]]:
+    """(entity uri, play count) for every object in the state that carries a "playcount"."""
+    if isinstance(node, dict):
+        play_count = node.get("playcount")
+        if isinstance(play_count, int) or (isinstance(play_count, str) and play_count.isdigit()):
+            yield node.get("uri"), int(play_count)
+        for value in node.values():
+            yield from _find_play_counts(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _find_play_counts(value)
+
+
+def get_spotify_track_view_counts(track_urls: list[str]) -> dict[str, int]:
+    """
+    Play counts for many Spotify tracks, keyed by URL.
+
+    Pages are fetched in parallel over HTTP; only pages whose state could not be parsed, or that were
+    blocked or rate limited, are scraped with the pooled browsers. Failures are logged and omitted.
+    """
+    view_counts: dict[str, int] = {}
+    unparsed_urls = []
+    for track_url, view_count, exc in process_in_parallel(
+        items=list(dict.fromkeys(track_urls)), process_func=get_spotify_track_view_count_with_http, log_progress=False
+    ):
+        if (
+            isinstance(exc, requests.HTTPError)
+            and exc.response is not None
+            and exc.response.status_code in SPOTIFY_WEBDRIVER_FALLBACK_STATUS_CODES
+        ):
+            logger.warning(f"HTTP extraction got {exc.response.status_code} for {track_url}, trying webdriver")
+            unparsed_urls.append(track_url)
+        elif exc:
+            logger.warning(f"HTTP extraction failed for {track_url}: {exc}")
+        elif view_count is None:
+            unparsed_urls.append(track_url)
+        else:
+            view_counts[track_url] = view_count
+
+    logger.info(
+        f"Parsed {len(view_counts)} Spotify play counts over HTTP, {len(unparsed_urls)} pages left for webdriver"
+    )
+    if unparsed_urls:
+        try:
+            view_counts.update(get_spotify_track_view_counts_with_webdriver(unparsed_urls))
+        except Exception as e:
+            logger.error(f"Webdriver extraction failed for {len(unparsed_urls)} Spotify tracks: {e}")
+    return view_counts
+
+
+def get_spotify_track_view_counts_with_webdriver(track_urls: list[str]) -> dict[str, int]:
+    """
+    Play counts for many Spotify tracks, keyed by URL, scraped in parallel across the pooled browsers' tabs.
+
+    Pages that fail to render a play count are logged and omitted. Returns {} without webdriver support.
+    """
+    if not settings.ETL_DEPENDENCIES_AVAILABLE or get_webdriver_pool is None:
+        logger.info(f"Webdriver not available for Spotify extraction of {len(track_urls)} tracks")
+        return {}
+
+    texts = get_webdriver_pool().scrape_texts(track_urls, SPOTIFY_VIEW_COUNT_SELECTOR, SPOTIFY_VIEW_COUNT_WAIT_SECONDS)
+    view_counts = {}
+    for track_url, view_count_text in texts.items():
         try:
-            return get_spotify_track_view_count_with_webdriver(track_url)
+            if isinstance(view_count_text, Exception):
+                raise view_count_text
+            view_counts[track_url] = _parse_spotify_play_count(view_count_text)
         except Exception as e:
             logger.warning(f"Webdriver extraction failed for {track_url}: {e}")
-            return 0
-    else:
-        # In serverless environment or webdriver not available
-        logger.info(f"Webdriver not available for Spotify extraction: {track_url}")
-        return 0
 
+    logger.info(f"Retrieved {len(view_counts)} of {len(texts)} Spotify play counts with webdriver")
+    return view_counts
 
-def get_spotify_track_view_count_with_webdriver(track_url: str) -> int:
-    """Get Spotify track view count using webdriver. Raises exception if failed."""
-    webdriver = get_cached_webdriver()
 
-    try:
-        driver = webdriver.get_driver()
-        logger.info(f"Accessing Spotify URL: {track_url}")
-        driver.get(track_url)
-
-        # Wait for dynamic content to load
-        time.sleep(5)
-
-        # Try multiple selectors as backup
-        selectors = [
-            '[data-testid="playcount"]',
-            'span[data-testid="playcount"]',
-            '[data-testid="playcount"] span',
-        ]
-
-        view_count_element = None
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    view_count_element = elements[0]
-                    logger.info(f"Found element with selector: {selector}")
-                    break
-            except Exception:
-                continue
-
-        if not view_count_element:
-            raise ValueError("No playcount element found on Spotify page")
-
-        view_count_text = view_count_element.text.strip()
-        logger.info(f"Found Spotify play count text: '{view_count_text}' for {track_url}")
-
-        if not view_count_text:
-            raise ValueError("Empty playcount text on Spotify page")
-
-        # Remove commas and convert to int
-        clean_text = view_count_text.replace(",", "")
-        if not clean_text.isdigit():
-            raise ValueError(f"Invalid playcount format: {view_count_text}")
-
-        view_count = int(clean_text)
-        logger.info(f"Successfully retrieved Spotify play count: {view_count}")
-        return view_count
-
-    except Exception as e:
-        # Try to restart driver on critical failures
-        with contextlib.suppress(builtins.BaseException):
-            webdriver.close_driver()
-        raise e
+def _parse_spotify_play_count(view_count_text: str) -> int:
+    """Play count from the rendered text, e.g. "1,234,567"."""
+    # Remove commas and convert to int
+    clean_text = view_count_text.strip().replace(",", "")
+    if not clean_text.isdigit():
+        raise ValueError(f"Invalid playcount format: {view_count_text}")
+    return int(clean_text)
 
 
 def extract_spotify_track_id_from_url(spotify_url: str) -> str:
@@ -2,16 +2,37 @@ import os
 from enum import Enum
 from urllib.parse import quote_plus
 
-import requests
-from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.cloudflare_cache import (
+    CachePrefix,
+    cloudflare_cache_get,
+    cloudflare_cache_get_many,
+    cloudflare_cache_set,
+    cloudflare_cache_set_many,
+    cloudflare_cache_set_not_found,
+    is_cached_not_found,
+)
+from core.utils.http_client import http_get
+from core.utils.single_flight import SingleFlight
 from core.utils.utils import get_logger
+from core.utils.youtube_quota import (
+    YOUTUBE_SEARCH_UNITS,
+    YOUTUBE_VIDEOS_LIST_UNITS,
+    mark_youtube_quota_exhausted,
+    record_youtube_quota_usage,
+)
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = get_logger(__name__)
 
+# videos?part=statistics accepts up to 50 comma-separated IDs per request
+YOUTUBE_VIDEOS_BATCH_SIZE = 50
+
+_youtube_url_lookups = SingleFlight("youtube_url")
+
 
 class YouTubeUrlResult(Enum):
     CACHE_HIT = "cache_hit"
+    CACHE_HIT_NOT_FOUND = "cache_hit_not_found"
     API_SUCCESS = "api_success"
     API_FAILURE_QUOTA = "api_failure_quota"
     API_FAILURE_NOT_FOUND = "api_failure_not_found"
@@ -26,7 +47,15 @@ def get_youtube_url(
         raise ValueError("YouTube API key not provided.")
 
     key_data = f"{track_name}|{artist_name}"
+    return _youtube_url_lookups.do(key_data, lambda: _lookup_youtube_url(track_name, artist_name, api_key, key_data))
+
+
+def _lookup_youtube_url(
+    track_name: str, artist_name: str, api_key: str, key_data: str
+) -> tuple[str | None, YouTubeUrlResult]:
     youtube_url = cloudflare_cache_get(CachePrefix.YOUTUBE_URL, key_data)
+    if is_cached_not_found(youtube_url):
+        return None, YouTubeUrlResult.CACHE_HIT_NOT_FOUND
     if youtube_url:
         return str(youtube_url), YouTubeUrlResult.CACHE_HIT
 
@@ -35,7 +64,12 @@ def get_youtube_url(
         f"https://www.googleapis.com/youtube/v3/search?part=snippet&q={quote_plus(query)}&type=video&key={api_key}"
     )
 
-    response = requests.get(youtube_search_url)
+    response = http_get(youtube_search_url)
+    if response.status_code == 403 and "quotaExceeded" in response.text:
+        mark_youtube_quota_exhausted()
+    else:
+        record_youtube_quota_usage(YOUTUBE_SEARCH_UNITS)
+
     if response.status_code == 200:
         data = response.json()
         if data.get("items"):
@@ -67,6 +101,7 @@ def get_youtube_url(
                     )
 
         logger.info(f"No video found for {track_name} by {artist_name}")
+        cloudflare_cache_set_not_found(CachePrefix.YOUTUBE_URL, key_data)
         return None, YouTubeUrlResult.API_FAILURE_NOT_FOUND
     else:
         logger.info(f"Error fetching YouTube URL: {response.status_code}, {response.text}")
@@ -76,37 +111,88 @@ def get_youtube_url(
         return None, YouTubeUrlResult.API_FAILURE_ERROR
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=4, max=10),
-    stop=stop_after_attempt(3),
-    reraise=True,
-)
+def get_youtube_video_id(youtube_url: str) -> str:
+    return youtube_url.split("v=")[-1]
+
+
 def get_youtube_track_view_count(youtube_url: str, api_key: str | None = None) -> int:
-    """Get YouTube track view count. Returns 0 if API key missing or extraction fails."""
+    """Get YouTube track view count. Returns 0 if API key missing; raises if the video has no statistics."""
     api_key = api_key or os.getenv("GOOGLE_API_KEY")
     if not api_key:
         logger.warning(f"YouTube API key not provided for: {youtube_url}")
         return 0
 
-    video_id = youtube_url.split("v=")[-1]
+    view_counts = get_youtube_track_view_counts([youtube_url], api_key)
+    if youtube_url not in view_counts:
+        raise ValueError("No video data found in YouTube API response")
+    return view_counts[youtube_url]
 
-    cached_count = cloudflare_cache_get(CachePrefix.YOUTUBE_VIEW_COUNT, video_id)
-    if cached_count:
-        logger.info(f"Video ID {video_id} play count from cache: {cached_count}")
-        return int(cached_count)
 
-    youtube_api_url = f"https://www.googleapis.com/youtube/v3/videos?part=statistics&id={video_id}&key={api_key}"
+def get_youtube_track_view_counts(youtube_urls: list[str], api_key: str | None = None) -> dict[str, int]:
+    """
+    View counts for many YouTube URLs, keyed by URL, with one statistics request per 50 uncached videos.
 
-    response = requests.get(youtube_api_url)
-    response.raise_for_status()
+    Counts are read from and written to the cache in bulk. Videos the API returns no statistics for are omitted,
+    as are the videos of a batch that keeps failing after retries; the other batches are still returned.
+    """
+    api_key = api_key or os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        logger.warning(f"YouTube API key not provided for {len(youtube_urls)} videos")
+        return {}
+
+    video_ids = list(dict.fromkeys(get_youtube_video_id(youtube_url) for youtube_url in youtube_urls))
+    cached_counts, uncached_video_ids = cloudflare_cache_get_many(CachePrefix.YOUTUBE_VIEW_COUNT, video_ids)
+    view_counts = {video_id: int(count) for video_id, count in cached_counts.items()}
+
+    fetched_counts: dict[str, str] = {}
+    request_count = 0
+    failed_video_count = 0
+    for start in range(0, len(uncached_video_ids), YOUTUBE_VIDEOS_BATCH_SIZE):
+        batch = uncached_video_ids[start : start + YOUTUBE_VIDEOS_BATCH_SIZE]
+        request_count += 1
+        try:
+            fetched_counts.update(_fetch_youtube_view_counts_batch(batch, api_key))
+        except Exception as e:
+            # Not the message itself: requests errors carry the request URL, API key included
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            logger.warning(
+                f"YouTube statistics request failed for {len(batch)} videos: {type(e).__name__} ({status_code})"
+            )
+            failed_video_count += len(batch)
+
+    cloudflare_cache_set_many(CachePrefix.YOUTUBE_VIEW_COUNT, fetched_counts)
+    view_counts.update((video_id, int(count)) for video_id, count in fetched_counts.items())
+    logger.info(
+        f"YouTube view counts: {len(cached_counts)} cached, {len(fetched_counts)} fetched in "
+        f"{request_count} requests, {failed_video_count} in failed requests, "
+        f"{len(uncached_video_ids) - len(fetched_counts) - failed_video_count} without statistics"
+    )
 
-    data = response.json()
-    if data["items"]:
-        view_count = data["items"][0]["statistics"]["viewCount"]
-        logger.info(f"Video ID {video_id} has {view_count} views.")
+    return {
+        youtube_url: view_counts[get_youtube_video_id(youtube_url)]
+        for youtube_url in youtube_urls
+        if get_youtube_video_id(youtube_url) in view_counts
+    }
 
-        cloudflare_cache_set(CachePrefix.YOUTUBE_VIEW_COUNT, video_id, view_count)
 
-        return int(view_count)
-    else:
-        raise ValueError("No video data found in YouTube API response")
+@retry(
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+def _fetch_youtube_view_counts_batch(video_ids: list[str], api_key: str) -> dict[str, str]:
+    """Raw viewCount per video ID for up to 50 IDs in one videos?part=statistics request."""
+    youtube_api_url = (
+        f"https://www.googleapis.com/youtube/v3/videos?part=statistics&id={','.join(video_ids)}"
+        f"&maxResults={YOUTUBE_VIDEOS_BATCH_SIZE}&key={api_key}"
+    )
+
+    response = http_get(youtube_api_url)
+    record_youtube_quota_usage(YOUTUBE_VIDEOS_LIST_UNITS)
+    response.raise_for_status()
+
+    return {
+        item["id"]: item["statistics"]["viewCount"]
+        for item in response.json().get("items", [])
+        if "viewCount" in item.get("statistics", {})
+    }
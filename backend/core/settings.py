@@ -51,8 +51,22 @@ CF_ACCOUNT_ID = os.getenv("CF_ACCOUNT_ID", "")
 CF_NAMESPACE_ID = os.getenv("CF_NAMESPACE_ID", "")
 CF_API_TOKEN = os.getenv("CF_API_TOKEN", "")
 
+# Optional SQLite file used as a persistent local tier in front of Cloudflare KV (ETL re-runs, CI)
+CF_LOCAL_CACHE_PATH = os.getenv("CF_LOCAL_CACHE_PATH", "")
+# Serve the Cloudflare cache helpers from the local tier only, never calling KV (offline runs and tests)
+CF_LOCAL_CACHE_OFFLINE = os.getenv("CF_LOCAL_CACHE_OFFLINE", "").lower() == "true"
+
 MAX_WORKERS: Final = 4
 
+# Selenium browser pool for scraped play counts: browsers, tabs per browser, and when to recycle a browser
+WEBDRIVER_POOL_SIZE = int(os.getenv("WEBDRIVER_POOL_SIZE", "2"))
+WEBDRIVER_TABS_PER_BROWSER = int(os.getenv("WEBDRIVER_TABS_PER_BROWSER", "4"))
+WEBDRIVER_MAX_PAGES_PER_BROWSER = int(os.getenv("WEBDRIVER_MAX_PAGES_PER_BROWSER", "200"))
+WEBDRIVER_MAX_MEMORY_MB = int(os.getenv("WEBDRIVER_MAX_MEMORY_MB", "1024"))
+
+# YouTube Data API units available per day (quota resets at midnight Pacific time)
+YOUTUBE_DAILY_QUOTA_UNITS = int(os.getenv("YOUTUBE_DAILY_QUOTA_UNITS", "10000"))
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 PROD_API_BASE_URL = "https://api.tunemeld.com"
@@ -116,6 +130,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "core.middleware.HttpCacheMiddleware",
 ]
 
 
@@ -2,6 +2,7 @@ from core.api import (
     cache_api,
     debug_cache_api,
     debug_migrations_api,
+    etl_runs_api,
     events_api,
     health_api,
     redis_debug_api,
@@ -9,9 +10,9 @@ from core.api import (
 )
 from django.urls import path
 from django.views.decorators.csrf import csrf_exempt
-from strawberry.django.views import GraphQLView
 
 from backend.gql.schema import schema
+from backend.gql.views import CachedGraphQLView
 
 # API-only endpoints - frontend served by Cloudflare Pages
 urlpatterns = [
@@ -39,73 +40,73 @@ urlpatterns = [
     ),
     path(
         "api/gql/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide="graphiql")),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide="graphiql")),
         name="graphql",
     ),
     path(
         "gql/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide="graphiql")),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide="graphiql")),
         name="graphql_legacy",
     ),
     # Custom GraphQL endpoint names for better Network tab debugging
     path(
         "api/GetAvailableGenres/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_available_genres",
     ),
     path(
         "api/GetPlaylistMetadata/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_playlist_metadata",
     ),
     path(
         "api/GetPlaylist/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_playlist",
     ),
     path(
         "api/GetPlaylistRanks/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_playlist_ranks",
     ),
     path(
         "api/GetPlayCounts/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_play_counts",
     ),
     path(
         "api/GetServiceConfigs/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_service_configs",
     ),
     path(
         "api/GetIframeConfigs/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_iframe_configs",
     ),
     path(
         "api/GenerateIframeUrl/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_generate_iframe_url",
     ),
     path(
         "api/GetRankButtonLabels/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_rank_button_labels",
     ),
     path(
         "api/GetMiscButtonLabels/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_misc_button_labels",
     ),
     path(
         "api/GetStaticConfig/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_static_config",
     ),
     path(
         "api/GetSimilarTracks/",
-        csrf_exempt(GraphQLView.as_view(schema=schema, graphql_ide=None)),
+        csrf_exempt(CachedGraphQLView.as_view(schema=schema, graphql_ide=None)),
         name="graphql_similar_tracks",
     ),
     path(
@@ -138,4 +139,9 @@ urlpatterns = [
         trending_isrcs_api.get_trending_isrcs,
         name="trending_isrcs",
     ),
+    path(
+        "api/etl-runs/",
+        etl_runs_api.list_etl_runs,
+        name="etl_runs",
+    ),
 ]
@@ -3,6 +3,8 @@ import hashlib
 import json
 import os
 import re
+import sqlite3
+import threading
 import time
 from enum import Enum
 from typing import Any
@@ -18,6 +20,8 @@ from django.core.cache.backends.base import BaseCache
 logger = get_logger(__name__)
 
 # API caching TTL configuration
+THIRTY_DAYS_TTL = 30 * 24 * 60 * 60
+FOURTEEN_DAYS_TTL = 14 * 24 * 60 * 60
 SEVEN_DAYS_TTL = 7 * 24 * 60 * 60
 TWENTY_FOUR_HOURS_TTL = 24 * 60 * 60
 NO_EXPIRATION_TTL = None
@@ -37,6 +41,17 @@ CLOUDFLARE_CACHE_TTL_MAP = {
     "reccobeats_audio_features": NO_EXPIRATION_TTL,
 }
 
+# Lookups that found nothing are cached as a NOT_FOUND marker carrying its own expiry, so they are retried
+# once it passes even where the backend keeps entries forever
+NOT_FOUND = "NOT_FOUND"
+NEGATIVE_CACHE_TTL_MAP = {
+    "youtube_url": FOURTEEN_DAYS_TTL,
+    "spotify_isrc": THIRTY_DAYS_TTL,
+    "soundcloud_url": FOURTEEN_DAYS_TTL,
+    "genius_url": THIRTY_DAYS_TTL,
+    "reccobeats_audio_features": THIRTY_DAYS_TTL,
+}
+
 
 class CachePrefix(str, Enum):
     RAPIDAPI_APPLE_MUSIC = "rapidapi_apple_music"
@@ -55,6 +70,9 @@ class CachePrefix(str, Enum):
 
 class CloudflareKVCache(BaseCache):
     BASE_URL_TEMPLATE = "https://api.cloudflare.com/client/v4/accounts/{}/storage/kv/namespaces/{}/values/"
+    # KV bulk REST API limits: 100 keys per bulk read, 10,000 pairs per bulk write
+    BULK_GET_BATCH_SIZE = 100
+    BULK_WRITE_BATCH_SIZE = 10_000
     _session: requests.Session | None = None
 
     def __init__(self, server, params):
@@ -148,10 +166,9 @@ class CloudflareKVCache(BaseCache):
 
         try:
             url = self.BASE_URL + sanitized_key
-            serialized_value = json.dumps(value)
             if CloudflareKVCache._session is None:
                 return False
-            response = CloudflareKVCache._session.put(url, json={"value": serialized_value})
+            response = CloudflareKVCache._session.put(url, data=self._encode_value(value))
             response.raise_for_status()
             result = response.json()
             return result.get("success", False)
@@ -159,6 +176,64 @@ class CloudflareKVCache(BaseCache):
             logger.warning(f"Cache timeout or error setting key {key}: {e}")
             return False
 
+    def get_many(self, keys: list[str], version: int | None = None) -> dict[str, Any]:  # type: ignore[override]
+        """Fetch many keys with the KV bulk read API, 100 keys per request. Missing keys are omitted."""
+        if settings.ENVIRONMENT == DEV and os.getenv("ENABLE_CACHE_IN_DEV", "").lower() != "true":
+            return {}
+
+        if not self.BASE_URL or CloudflareKVCache._session is None or not keys:
+            return {}
+
+        sanitized_to_key = {self._validate_key(self.make_key(key, version=version)): key for key in keys}
+        sanitized_keys = list(sanitized_to_key)
+        found: dict[str, Any] = {}
+
+        for start in range(0, len(sanitized_keys), self.BULK_GET_BATCH_SIZE):
+            batch = sanitized_keys[start : start + self.BULK_GET_BATCH_SIZE]
+            try:
+                response = CloudflareKVCache._session.post(self._bulk_url("get"), json={"keys": batch, "type": "text"})
+                response.raise_for_status()
+                values = (response.json().get("result") or {}).get("values") or {}
+            except Exception as e:
+                logger.warning(f"Cache timeout or error for bulk get of {len(batch)} keys: {e}")
+                continue
+
+            for sanitized_key, stored_value in values.items():
+                value = self._decode_stored_value(stored_value)
+                if value is not None and sanitized_key in sanitized_to_key:
+                    found[sanitized_to_key[sanitized_key]] = value
+
+        return found
+
+    def set_many(  # type: ignore[override]
+        self, data: dict[str, Any], timeout: int | None = None, version: int | None = None
+    ) -> list[str]:
+        """Store many keys with the KV bulk write API. Returns the keys that failed to store."""
+        if settings.ENVIRONMENT == DEV and os.getenv("ENABLE_CACHE_IN_DEV", "").lower() != "true":
+            return []
+
+        if not self.BASE_URL or CloudflareKVCache._session is None:
+            return list(data)
+
+        entries = [
+            (key, {"key": self._validate_key(self.make_key(key, version=version)), "value": self._encode_value(value)})
+            for key, value in data.items()
+        ]
+        failed: list[str] = []
+
+        for start in range(0, len(entries), self.BULK_WRITE_BATCH_SIZE):
+            batch = entries[start : start + self.BULK_WRITE_BATCH_SIZE]
+            try:
+                response = CloudflareKVCache._session.put(self._bulk_url(), json=[payload for _key, payload in batch])
+                response.raise_for_status()
+                if not response.json().get("success", False):
+                    raise ValueError(response.text[:200])
+            except Exception as e:
+                logger.warning(f"Cache timeout or error for bulk set of {len(batch)} keys: {e}")
+                failed.extend(key for key, _payload in batch)
+
+        return failed
+
     def put(self, key, value):
         return self.set(key, value)
 
@@ -171,28 +246,160 @@ class CloudflareKVCache(BaseCache):
     def has_key(self, key: str, version: int | None = None) -> bool:
         return self.get(key, version=version) is not None
 
+    def _bulk_url(self, operation: str | None = None) -> str:
+        bulk_url = self.BASE_URL.removesuffix("values/") + "bulk"
+        return f"{bulk_url}/{operation}" if operation else bulk_url
+
+    @staticmethod
+    def _encode_value(value: Any) -> str:
+        """Stored body written by set(): a JSON object wrapping the JSON-encoded value."""
+        return json.dumps({"value": json.dumps(value)})
+
+    @staticmethod
+    def _decode_stored_value(stored_value: str | None) -> Any:
+        if not stored_value:
+            return None
+        try:
+            value = json.loads(stored_value).get("value")
+            return json.loads(value) if value else None
+        except (ValueError, AttributeError):
+            return None
+
     def _validate_key(self, key: str) -> str:
         sanitized_key = re.sub(r"[^a-zA-Z0-9\-_]", "_", key)
         return sanitized_key[:512] if len(sanitized_key) > 512 else sanitized_key
 
 
+class LocalKVStore:
+    """Persistent SQLite (WAL) key-value tier in front of Cloudflare KV.
+
+    Entries expire by the TTL they were written with (None never expires). Values are stored as JSON text.
+    """
+
+    SQLITE_MAX_VARIABLES = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS kv_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+
+    def get(self, key: str) -> Any:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Return unexpired entries for the given keys. Missing keys are omitted."""
+        now = time.time()
+        found: dict[str, Any] = {}
+        with self._lock:
+            for start in range(0, len(keys), self.SQLITE_MAX_VARIABLES):
+                batch = keys[start : start + self.SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM kv_cache WHERE key IN ({placeholders}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    [*batch, now],
+                ).fetchall()
+                found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, values: dict[str, Any], ttl: int | None = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        rows = [(key, json.dumps(value), expires_at) for key, value in values.items()]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO kv_cache (key, value, expires_at) VALUES (?, ?, ?)", rows
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM kv_cache WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM kv_cache WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+
+_local_kv_store: LocalKVStore | None = None
+_local_kv_store_lock = threading.Lock()
+
+
+def get_local_kv_store() -> LocalKVStore | None:
+    """Local tier configured by CF_LOCAL_CACHE_PATH; an in-memory store when running offline without a path."""
+    global _local_kv_store
+
+    path = settings.CF_LOCAL_CACHE_PATH or (":memory:" if settings.CF_LOCAL_CACHE_OFFLINE else "")
+    if not path:
+        return None
+
+    with _local_kv_store_lock:
+        if _local_kv_store is None or _local_kv_store.path != path:
+            try:
+                _local_kv_store = LocalKVStore(path)
+                purged = _local_kv_store.purge_expired()
+                logger.info(f"Local KV cache opened at {path} ({purged} expired entries purged)")
+            except sqlite3.Error as e:
+                logger.warning(f"Local KV cache unavailable at {path}: {e}")
+                return None
+        return _local_kv_store
+
+
+def _get_prefix_ttl(prefix: CachePrefix) -> int | None:
+    return CLOUDFLARE_CACHE_TTL_MAP.get(prefix.value, SEVEN_DAYS_TTL)
+
+
+def _get_negative_ttl(prefix: CachePrefix) -> int:
+    return NEGATIVE_CACHE_TTL_MAP.get(prefix.value, SEVEN_DAYS_TTL)
+
+
+def is_cached_not_found(value: Any) -> bool:
+    """Whether a cached value records a lookup that found nothing (the legacy bare NOT_FOUND string included)."""
+    return value == NOT_FOUND or (isinstance(value, dict) and NOT_FOUND in value)
+
+
+def _is_expired_not_found(value: Any) -> bool:
+    return isinstance(value, dict) and NOT_FOUND in value and value[NOT_FOUND] <= time.time()
+
+
 def _generate_cache_key(prefix: CachePrefix, key_data: str) -> str:
     full_key = f"{prefix.value}:{key_data}"
     return hashlib.md5(full_key.encode()).hexdigest()
 
 
 def cloudflare_cache_get(prefix: CachePrefix, key_data: str) -> Any:
-    """Get data from Cloudflare KV cache."""
+    """Get data from the local tier, falling back to Cloudflare KV."""
     start_time = time.time()
     cache_key = _generate_cache_key(prefix, key_data)
+    local_store = get_local_kv_store()
 
     try:
+        if local_store is not None:
+            data = local_store.get(cache_key)
+            if data is not None and not _is_expired_not_found(data):
+                logger.info(f"Cache HIT (local): {prefix.value}:{key_data} ({time.time() - start_time:.3f}s)")
+                return data
+            if settings.CF_LOCAL_CACHE_OFFLINE:
+                logger.info(f"Cache MISS (local): {prefix.value}:{key_data}")
+                return None
+
         cloudflare_cache = cache  # This is the 'default' cache in settings
         data = cloudflare_cache.get(cache_key)
         elapsed = time.time() - start_time
+        if _is_expired_not_found(data):
+            data = None
 
         if data is not None:
             logger.info(f"Cache HIT (cloudflare): {prefix.value}:{key_data} ({elapsed:.3f}s)")
+            if local_store is not None:
+                local_store.set(cache_key, data, _get_prefix_ttl(prefix))
         else:
             logger.info(f"Cache MISS (cloudflare): {prefix.value}:{key_data} ({elapsed:.3f}s)")
         return data
@@ -202,26 +409,99 @@ def cloudflare_cache_get(prefix: CachePrefix, key_data: str) -> Any:
 
 
 def cloudflare_cache_set(prefix: CachePrefix, key_data: str, value: Any, ttl: int | None = None) -> None:
-    """Set data in Cloudflare KV cache."""
+    """Set data in the local tier and write through to Cloudflare KV."""
     cache_key = _generate_cache_key(prefix, key_data)
+    local_store = get_local_kv_store()
 
     try:
-        cloudflare_cache = cache
         if ttl is None:
-            ttl = CLOUDFLARE_CACHE_TTL_MAP.get(prefix.value, SEVEN_DAYS_TTL)
-        cloudflare_cache.set(cache_key, value, ttl)
+            ttl = _get_prefix_ttl(prefix)
+        if local_store is not None:
+            local_store.set(cache_key, value, ttl)
+        if not settings.CF_LOCAL_CACHE_OFFLINE:
+            cloudflare_cache = cache
+            cloudflare_cache.set(cache_key, value, ttl)
         logger.info(f"Cached (cloudflare): {prefix.value}:{key_data}")
     except Exception as e:
         logger.warning(f"Failed to cache in Cloudflare: {prefix.value}:{key_data}: {e}")
 
 
+def cloudflare_cache_set_not_found(prefix: CachePrefix, key_data: str) -> None:
+    """Cache that key_data has no result, so lookups skip it until the prefix's negative TTL passes."""
+    ttl = _get_negative_ttl(prefix)
+    cloudflare_cache_set(prefix, key_data, {NOT_FOUND: time.time() + ttl}, ttl=ttl)
+
+
+def cloudflare_cache_get_many(prefix: CachePrefix, key_data_list: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """Get many entries from the local tier, then Cloudflare KV in bulk requests for the rest.
+
+    Returns:
+        (hits, misses): hits maps key_data -> cached data, misses lists key_data not found in the cache.
+    """
+    unique_key_data = list(dict.fromkeys(key_data_list))
+    if not unique_key_data:
+        return {}, []
+
+    start_time = time.time()
+    cache_key_to_key_data = {_generate_cache_key(prefix, key_data): key_data for key_data in unique_key_data}
+    local_store = get_local_kv_store()
+
+    try:
+        cached: dict[str, Any] = {}
+        if local_store is not None:
+            cached = local_store.get_many(list(cache_key_to_key_data))
+
+        remaining = [cache_key for cache_key in cache_key_to_key_data if cache_key not in cached]
+        if remaining and not settings.CF_LOCAL_CACHE_OFFLINE:
+            fetched = {cache_key: data for cache_key, data in cache.get_many(remaining).items() if data is not None}
+            if local_store is not None and fetched:
+                local_store.set_many(fetched, _get_prefix_ttl(prefix))
+            cached.update(fetched)
+    except Exception as e:
+        logger.warning(f"Cloudflare cache error: {prefix.value} bulk get of {len(unique_key_data)} keys: {e}")
+        return {}, unique_key_data
+
+    hits = {
+        key_data: cached[cache_key]
+        for cache_key, key_data in cache_key_to_key_data.items()
+        if cached.get(cache_key) is not None and not _is_expired_not_found(cached[cache_key])
+    }
+    misses = [key_data for key_data in unique_key_data if key_data not in hits]
+    elapsed = time.time() - start_time
+    logger.info(f"Cache bulk get (cloudflare): {prefix.value} {len(hits)} hits, {len(misses)} misses ({elapsed:.3f}s)")
+    return hits, misses
+
+
+def cloudflare_cache_set_many(prefix: CachePrefix, values: dict[str, Any], ttl: int | None = None) -> None:
+    """Set many entries, keyed by key_data, in the local tier and Cloudflare KV with bulk writes."""
+    if not values:
+        return
+
+    local_store = get_local_kv_store()
+
+    try:
+        if ttl is None:
+            ttl = _get_prefix_ttl(prefix)
+        cache_values = {_generate_cache_key(prefix, key_data): value for key_data, value in values.items()}
+        if local_store is not None:
+            local_store.set_many(cache_values, ttl)
+        failed = [] if settings.CF_LOCAL_CACHE_OFFLINE else cache.set_many(cache_values, ttl)
+        logger.info(f"Cached (cloudflare): {prefix.value} {len(values) - len(failed)} of {len(values)} entries")
+    except Exception as e:
+        logger.warning(f"Failed to cache in Cloudflare: {prefix.value} {len(values)} entries: {e}")
+
+
 def cloudflare_cache_delete(prefix: CachePrefix, key_data: str) -> bool:
-    """Delete a specific key from Cloudflare KV cache."""
+    """Delete a specific key from the local tier and Cloudflare KV cache."""
     cache_key = _generate_cache_key(prefix, key_data)
+    local_store = get_local_kv_store()
 
     try:
-        cloudflare_cache = cache
-        cloudflare_cache.delete(cache_key)
+        if local_store is not None:
+            local_store.delete(cache_key)
+        if not settings.CF_LOCAL_CACHE_OFFLINE:
+            cloudflare_cache = cache
+            cloudflare_cache.delete(cache_key)
         logger.info(f"Deleted (cloudflare): {prefix.value}:{key_data}")
         return True
     except Exception as e:
@@ -0,0 +1,96 @@
+import threading
+from collections import defaultdict
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from core.settings import MAX_WORKERS
+from core.utils.utils import get_logger
+
+logger = get_logger(__name__)
+
+# (connect, read) seconds applied to every request that does not pass its own timeout
+DEFAULT_TIMEOUT = (5, 30)
+
+# Keep-alive connections kept per host; enough for every ETL worker thread plus API traffic
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = max(MAX_WORKERS * 4, 16)
+
+# Maximum in-flight requests per host, so parallel ETL stages cannot burst a single upstream
+DEFAULT_HOST_CONCURRENCY = 8
+HOST_CONCURRENCY_LIMITS = {
+    "soundcloud.com": 4,
+    "music.apple.com": 4,
+    "open.spotify.com": 4,
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_stats_lock = threading.Lock()
+_stats: defaultdict[str, dict[str, int]] = defaultdict(lambda: {"requests": 0, "errors": 0, "bytes": 0})
+
+
+def get_http_session() -> requests.Session:
+    """Process-wide session whose connection pools are reused by every external service module."""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _get_host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _session_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(HOST_CONCURRENCY_LIMITS.get(host, DEFAULT_HOST_CONCURRENCY))
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """GET through the shared pooled session with a default timeout and a per-host concurrency limit.
+
+    Accepts the same keyword arguments as requests.get and raises the same requests exceptions.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    host = urlparse(url).hostname or ""
+
+    with _get_host_semaphore(host):
+        try:
+            response = get_http_session().get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            _record_request(host, 0, failed=True)
+            raise
+
+    _record_request(host, len(response.content), failed=response.status_code >= 400)
+    return response
+
+
+def _record_request(host: str, num_bytes: int, failed: bool) -> None:
+    with _stats_lock:
+        host_stats = _stats[host]
+        host_stats["requests"] += 1
+        host_stats["bytes"] += num_bytes
+        if failed:
+            host_stats["errors"] += 1
+
+
+def get_http_stats() -> dict[str, dict[str, int]]:
+    """Request, error and response byte counts per host since the process started or the last reset."""
+    with _stats_lock:
+        return {host: dict(host_stats) for host, host_stats in _stats.items()}
+
+
+def reset_http_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
@@ -4,6 +4,7 @@ from typing import Any, cast
 import requests
 from core.constants import GENRE_CONFIGS, SERVICE_CONFIGS, GenreName, ServiceName
 from core.utils.cloudflare_cache import CachePrefix, cloudflare_cache_get, cloudflare_cache_set
+from core.utils.http_client import http_get
 from core.utils.utils import get_logger
 
 logger = get_logger(__name__)
@@ -62,7 +63,7 @@ def _make_rapidapi_request(url: str, host: str) -> JSON:
         logger.info(f"Making RapidAPI request to {host}")
 
         try:
-            response = requests.get(url, headers=headers, timeout=60)
+            response = http_get(url, headers=headers, timeout=60)
             response.raise_for_status()
             logger.info(f"RapidAPI request successful - Status: {response.status_code}")
             return cast("JSON", response.json())
@@ -1,6 +1,11 @@
 import hashlib
 import json
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from enum import Enum
 from typing import Any
 
@@ -13,6 +18,29 @@ logger = get_logger(__name__)
 SEVEN_DAYS_TTL = 7 * 24 * 60 * 60
 NO_EXPIRATION_TTL = None
 
+# In-process L1 cache settings
+L1_CACHE_MAX_ENTRIES = 512
+L1_CACHE_TTL = 10 * 60
+
+# Versioned namespaces: readers follow the generation pointer, re-read at most once per interval
+CACHE_GENERATION_KEY = "cache_generation"
+CACHE_GENERATION_UPDATED_AT_KEY = "cache_generation_updated_at"
+GENERATION_CHECK_INTERVAL = 30
+COPY_GENERATION_BATCH_SIZE = 500
+
+# Stale-while-revalidate: entries are recomputed after the soft TTL but served stale until the hard TTL
+DEFAULT_SOFT_TTL = 60 * 60
+RECOMPUTE_LOCK_TIMEOUT = 60
+RECOMPUTE_WAIT_TIMEOUT = 10
+RECOMPUTE_POLL_INTERVAL = 0.05
+# Deletes KEYS[1] only if it still holds this caller's token, atomically on the Redis server
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class CachePrefix(str, Enum):
     """Redis cache key prefixes for different data types."""
@@ -26,13 +54,311 @@ class CachePrefix(str, Enum):
     GQL_IFRAME_URL = "gql_iframe_url"
     GQL_BUTTON_LABELS = "gql_button_labels"
     GQL_TRACK = "gql_track"
+    GQL_RESPONSE = "gql_response"
+    GQL_PERSISTED_QUERY = "gql_persisted_query"
     TRENDING_ISRCS = "trending_isrcs"
 
 
-def _generate_cache_key(prefix: CachePrefix, key_data: str) -> str:
-    """Generate deterministic Redis key while preserving the prefix for clears."""
+# Prefixes whose data only changes when the ETL runs, served from process memory before Redis
+L1_CACHED_PREFIXES = frozenset(
+    {
+        CachePrefix.GQL_PLAYLIST_METADATA,
+        CachePrefix.GQL_GENRES,
+        CachePrefix.GQL_SERVICE_CONFIGS,
+        CachePrefix.GQL_IFRAME_CONFIGS,
+        CachePrefix.GQL_BUTTON_LABELS,
+    }
+)
+
+
+# Prefixes served from a generation namespace that clear_and_warm_cache swaps atomically
+VERSIONED_PREFIXES = frozenset(
+    {
+        CachePrefix.GQL_PLAYLIST,
+        CachePrefix.GQL_PLAYLIST_METADATA,
+        CachePrefix.GQL_GENRES,
+        CachePrefix.GQL_SERVICE_CONFIGS,
+        CachePrefix.GQL_IFRAME_CONFIGS,
+        CachePrefix.GQL_IFRAME_URL,
+        CachePrefix.GQL_BUTTON_LABELS,
+        CachePrefix.GQL_TRACK,
+        CachePrefix.GQL_RESPONSE,
+        CachePrefix.TRENDING_ISRCS,
+    }
+)
+
+
+class LocalLRUCache:
+    """Bounded, TTL-aware in-process LRU cache.
+
+    Values are stored as JSON strings so every hit returns a fresh object that callers may mutate.
+    Keys embed the cache generation, and all entries are dropped when the generation pointer moves.
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, cache_key: str) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[cache_key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, cache_key: str, json_value: str, ttl: int | None = None) -> None:
+        expires_at = time.monotonic() + min(ttl or self.ttl, self.ttl)
+        with self._lock:
+            self._entries[cache_key] = (expires_at, json_value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self, key_prefix: str | None = None) -> None:
+        with self._lock:
+            if key_prefix is None:
+                self._entries.clear()
+                self.invalidations += 1
+                return
+            for cache_key in [key for key in self._entries if key.startswith(key_prefix)]:
+                del self._entries[cache_key]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+local_cache = LocalLRUCache(L1_CACHE_MAX_ENTRIES, L1_CACHE_TTL)
+
+_generation_lock = threading.Lock()
+_generation = 0
+_generation_updated_at: float | None = None
+_generation_checked_at: float | None = None
+_pinned_generation: int | None = None
+
+
+def _read_cache_generation() -> tuple[int, float | None] | None:
+    """Read the shared generation pointer and its swap time from Redis. Returns None if Redis is unavailable."""
+    try:
+        values = caches["redis"].get_many([CACHE_GENERATION_KEY, CACHE_GENERATION_UPDATED_AT_KEY])
+        generation = values.get(CACHE_GENERATION_KEY)
+        updated_at = values.get(CACHE_GENERATION_UPDATED_AT_KEY)
+        return (
+            int(generation) if generation is not None else 0,
+            float(updated_at) if updated_at is not None else None,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read cache generation: {e}")
+        return None
+
+
+def get_cache_generation(refresh: bool = False) -> int:
+    """Generation namespace used for versioned prefixes in this process.
+
+    A pinned generation (set while warming) wins; otherwise the Redis pointer is re-read
+    at most once per GENERATION_CHECK_INTERVAL, dropping L1 entries when it moves.
+    """
+    global _generation, _generation_updated_at, _generation_checked_at
+
+    if _pinned_generation is not None:
+        return _pinned_generation
+
+    now = time.monotonic()
+    with _generation_lock:
+        recently_checked = (
+            _generation_checked_at is not None and now - _generation_checked_at < GENERATION_CHECK_INTERVAL
+        )
+        if recently_checked and not refresh:
+            return _generation
+        _generation_checked_at = now
+
+        pointer = _read_cache_generation()
+        if pointer is None:
+            return _generation
+
+        generation, _generation_updated_at = pointer
+        if generation != _generation:
+            logger.info(f"Cache generation moved: {_generation} -> {generation}")
+            _generation = generation
+            local_cache.clear()
+        return _generation
+
+
+def get_cache_generation_updated_at() -> float | None:
+    """Unix time the current generation was swapped in, if known."""
+    get_cache_generation()
+    return _generation_updated_at
+
+
+@contextmanager
+def pinned_cache_generation(generation: int) -> Iterator[None]:
+    """Read and write versioned prefixes in the given generation for this process (used to warm N+1)."""
+    global _pinned_generation
+
+    previous = _pinned_generation
+    _pinned_generation = generation
+    try:
+        yield
+    finally:
+        _pinned_generation = previous
+
+
+def redis_cache_swap_generation(generation: int) -> bool:
+    """Atomically point every reader at a warmed generation. Older generations expire by TTL."""
+    try:
+        caches["redis"].set_many(
+            {CACHE_GENERATION_KEY: generation, CACHE_GENERATION_UPDATED_AT_KEY: int(time.time())}, NO_EXPIRATION_TTL
+        )
+        get_cache_generation(refresh=True)
+        logger.info(f"Swapped cache generation to {generation}")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to swap cache generation to {generation}: {e}")
+        return False
+
+
+def redis_cache_copy_generation(
+    source_generation: int,
+    target_generation: int,
+    prefixes: list[CachePrefix],
+    exclude: dict[CachePrefix, set[str]] | None = None,
+) -> int:
+    """Carry entries of versioned prefixes over to another generation, keeping their remaining TTL.
+
+    Used by incremental warms: unaffected entries are copied instead of recomputed, while the key_data
+    listed in exclude are left for the warm to rebuild. Entries are found through each generation's key
+    index rather than a keyspace SCAN. Returns the number of copied entries, or 0 when the backend does
+    not expose a raw Redis client (everything is then rebuilt on demand).
+    """
+    exclude = exclude or {}
+    redis_cache = caches["redis"]
+    client = getattr(redis_cache, "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        logger.warning("Redis backend has no raw client; skipping generation copy")
+        return 0
+
+    copied = 0
+    try:
+        raw_client = client.get_client(write=True)
+        for prefix in prefixes:
+            excluded_key_data = exclude.get(prefix, set())
+            source_index_key = redis_cache.make_key(_generation_index_key(prefix, source_generation))
+            key_data_list = sorted(
+                key_data
+                for key_data in (member.decode() for member in raw_client.smembers(source_index_key))
+                if key_data not in excluded_key_data
+            )
+
+            for start in range(0, len(key_data_list), COPY_GENERATION_BATCH_SIZE):
+                batch = key_data_list[start : start + COPY_GENERATION_BATCH_SIZE]
+
+                # Soft-TTL markers follow the entry they belong to; recompute locks stay behind
+                key_pairs = []
+                for key_data in batch:
+                    source_key = _generate_cache_key(prefix, key_data, source_generation)
+                    target_key = _generate_cache_key(prefix, key_data, target_generation)
+                    key_pairs.append((key_data, redis_cache.make_key(source_key), redis_cache.make_key(target_key)))
+                    key_pairs.append(
+                        (None, redis_cache.make_key(f"{source_key}:fresh"), redis_cache.make_key(f"{target_key}:fresh"))
+                    )
+
+                pipeline = raw_client.pipeline(transaction=False)
+                for _, source_key, _ in key_pairs:
+                    pipeline.get(source_key)
+                    pipeline.pttl(source_key)
+                values = pipeline.execute()
+
+                copied_key_data = []
+                pipeline = raw_client.pipeline(transaction=False)
+                for (key_data, _, target_key), value, ttl_ms in zip(key_pairs, values[::2], values[1::2], strict=True):
+                    if value is None:
+                        continue
+                    pipeline.set(target_key, value, px=ttl_ms if ttl_ms > 0 else None)
+                    if key_data is not None:
+                        copied_key_data.append(key_data)
+                _index_generation_keys(prefix, copied_key_data, target_generation, pipeline)
+                pipeline.execute()
+                copied += len(copied_key_data)
+
+        logger.info(f"Copied {copied} cache entries from generation {source_generation} to {target_generation}")
+        return copied
+    except Exception as e:
+        logger.warning(f"Failed to copy cache generation {source_generation} -> {target_generation}: {e}")
+        return copied
+
+
+def _generation_index_key(prefix: CachePrefix, generation: int) -> str:
+    return f"{prefix.value}:v{generation}:keys"
+
+
+def _index_generation_keys(
+    prefix: CachePrefix, key_data_list: list[str], generation: int | None = None, pipeline: Any = None
+) -> None:
+    """Record key_data written to a versioned prefix in its generation's key index (a Redis SET).
+
+    redis_cache_copy_generation reads the index instead of scanning the keyspace. Commands are queued on
+    the given raw pipeline, or sent in one round trip of their own. Backends without a raw client skip it.
+    """
+    if prefix not in VERSIONED_PREFIXES or not key_data_list:
+        return
+
+    redis_cache = caches["redis"]
+    client = getattr(redis_cache, "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        return
+
+    if generation is None:
+        generation = get_cache_generation()
+    index_key = redis_cache.make_key(_generation_index_key(prefix, generation))
+    try:
+        target = pipeline if pipeline is not None else client.get_client(write=True).pipeline(transaction=False)
+        target.sadd(index_key, *key_data_list)
+        # Refreshed on every write, so the index expires along with the generation's entries
+        target.expire(index_key, SEVEN_DAYS_TTL)
+        if pipeline is None:
+            target.execute()
+    except Exception as e:
+        logger.warning(f"Failed to index {prefix.value} keys for generation {generation}: {e}")
+
+
+def get_local_cache_stats() -> dict[str, Any]:
+    """Hit/miss statistics for the in-process L1 cache."""
+    return {**local_cache.stats(), "generation": get_cache_generation()}
+
+
+def _generate_cache_key(prefix: CachePrefix, key_data: str, generation: int | None = None) -> str:
+    """Generate deterministic Redis key while preserving the prefix for clears.
+
+    Versioned prefixes embed the generation (the current one unless given): prefix:v<generation>:<md5>.
+    """
     full_key = f"{prefix.value}:{key_data}"
     hashed_suffix = hashlib.md5(full_key.encode()).hexdigest()
+    if prefix in VERSIONED_PREFIXES:
+        if generation is None:
+            generation = get_cache_generation()
+        return f"{prefix.value}:v{generation}:{hashed_suffix}"
     return f"{prefix.value}:{hashed_suffix}"
 
 
@@ -41,6 +367,12 @@ def redis_cache_get(prefix: CachePrefix, key_data: str) -> Any:
 
     start_time = time.time()
     cache_key = _generate_cache_key(prefix, key_data)
+    use_local_cache = prefix in L1_CACHED_PREFIXES
+
+    if use_local_cache:
+        local_json_data = local_cache.get(cache_key)
+        if local_json_data is not None:
+            return json.loads(local_json_data)
 
     try:
         redis_cache = caches["redis"]
@@ -49,6 +381,8 @@ def redis_cache_get(prefix: CachePrefix, key_data: str) -> Any:
 
         if json_data is not None:
             logger.info(f"Cache HIT (redis): {prefix.value}:{key_data} ({elapsed:.3f}s)")
+            if use_local_cache and isinstance(json_data, str):
+                local_cache.set(cache_key, json_data)
             # Parse JSON string back to Python dict
             return json.loads(json_data) if isinstance(json_data, str) else json_data
         else:
@@ -73,15 +407,252 @@ def redis_cache_set(prefix: CachePrefix, key_data: str, value: Any, ttl: int | N
             ttl = SEVEN_DAYS_TTL  # Default TTL
 
         redis_cache.set(cache_key, json_value, ttl)
+        _index_generation_keys(prefix, [key_data])
+        if prefix in L1_CACHED_PREFIXES and value is not None:
+            local_cache.set(cache_key, json_value, ttl)
         logger.info(f"Cached (redis): {prefix.value}:{key_data} (TTL: {ttl}s)")
     except Exception as e:
         logger.warning(f"Failed to cache in Redis: {prefix.value}:{key_data}: {e}")
 
 
+def redis_cache_get_raw(prefix: CachePrefix, key_data: str) -> str | None:
+    """Get a pre-serialized string from Redis cache without JSON parsing."""
+
+    start_time = time.time()
+    cache_key = _generate_cache_key(prefix, key_data)
+
+    try:
+        raw_value = caches["redis"].get(cache_key)
+        elapsed = time.time() - start_time
+        hit = "HIT" if raw_value is not None else "MISS"
+        logger.info(f"Cache {hit} (redis): {prefix.value}:{key_data} ({elapsed:.3f}s)")
+        return raw_value if isinstance(raw_value, str) else None
+    except Exception as e:
+        logger.warning(f"Redis cache error: {prefix.value}:{key_data}: {e}")
+        return None
+
+
+def redis_cache_set_raw(prefix: CachePrefix, key_data: str, raw_value: str, ttl: int | None = None) -> None:
+    """Store a pre-serialized string in Redis cache as-is."""
+
+    cache_key = _generate_cache_key(prefix, key_data)
+
+    try:
+        if ttl is None:
+            ttl = SEVEN_DAYS_TTL  # Default TTL
+
+        caches["redis"].set(cache_key, raw_value, ttl)
+        _index_generation_keys(prefix, [key_data])
+        logger.info(f"Cached (redis): {prefix.value}:{key_data} ({len(raw_value)} bytes, TTL: {ttl}s)")
+    except Exception as e:
+        logger.warning(f"Failed to cache in Redis: {prefix.value}:{key_data}: {e}")
+
+
+def redis_cache_get_many(prefix: CachePrefix, key_data_list: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """Get many JSON entries from Redis with a single MGET.
+
+    Returns:
+        (hits, misses): hits maps key_data -> parsed data, misses lists key_data not found in Redis.
+        On a Redis error every key is reported as a miss.
+    """
+
+    unique_key_data = list(dict.fromkeys(key_data_list))
+    if not unique_key_data:
+        return {}, []
+
+    start_time = time.time()
+    cache_key_to_key_data = {_generate_cache_key(prefix, key_data): key_data for key_data in unique_key_data}
+
+    try:
+        redis_cache = caches["redis"]
+        raw_values = redis_cache.get_many(list(cache_key_to_key_data))
+        elapsed = time.time() - start_time
+    except Exception as e:
+        logger.warning(f"Redis cache error: {prefix.value} MGET of {len(unique_key_data)} keys: {e}")
+        return {}, unique_key_data
+
+    hits: dict[str, Any] = {}
+    for cache_key, json_data in raw_values.items():
+        key_data = cache_key_to_key_data[cache_key]
+        try:
+            hits[key_data] = json.loads(json_data) if isinstance(json_data, str) else json_data
+        except ValueError as e:
+            logger.warning(f"Redis cache error: {prefix.value}:{key_data}: {e}")
+
+    misses = [key_data for key_data in unique_key_data if key_data not in hits]
+    logger.info(f"Cache MGET (redis): {prefix.value} {len(hits)} hits, {len(misses)} misses ({elapsed:.3f}s)")
+    return hits, misses
+
+
+def redis_cache_set_many(
+    prefix: CachePrefix,
+    values: dict[str, Any],
+    ttl: int | None = None,
+    ttls: dict[str, int] | None = None,
+) -> None:
+    """Store many JSON-serializable entries, keyed by key_data, in one pipelined Redis round trip.
+
+    Args:
+        prefix: Cache prefix shared by all entries
+        values: key_data -> value to cache
+        ttl: Default TTL for every entry (SEVEN_DAYS_TTL when None)
+        ttls: Optional per-key_data TTL overrides
+    """
+
+    if not values:
+        return
+
+    if ttl is None:
+        ttl = SEVEN_DAYS_TTL  # Default TTL
+    ttls = ttls or {}
+
+    try:
+        redis_cache = caches["redis"]
+        entries = [
+            (_generate_cache_key(prefix, key_data), json.dumps(value, default=str), ttls.get(key_data, ttl))
+            for key_data, value in values.items()
+        ]
+
+        client = getattr(redis_cache, "client", None)
+        if client is not None and hasattr(client, "get_client"):
+            # django-redis: queue every SET EX on one pipeline so each key keeps its own TTL
+            pipeline = client.get_client(write=True).pipeline()
+            for cache_key, json_value, entry_ttl in entries:
+                client.set(cache_key, json_value, entry_ttl, client=pipeline)
+            _index_generation_keys(prefix, list(values), pipeline=pipeline)
+            pipeline.execute()
+        else:
+            ttl_groups: dict[int, dict[str, str]] = {}
+            for cache_key, json_value, entry_ttl in entries:
+                ttl_groups.setdefault(entry_ttl, {})[cache_key] = json_value
+            for entry_ttl, group in ttl_groups.items():
+                redis_cache.set_many(group, entry_ttl)
+
+        logger.info(f"Cached (redis): {prefix.value} {len(entries)} entries (default TTL: {ttl}s)")
+    except Exception as e:
+        logger.warning(f"Failed to cache in Redis: {prefix.value} {len(values)} entries: {e}")
+
+
+def redis_cache_get_or_compute(
+    prefix: CachePrefix,
+    key_data: str,
+    compute_fn: Callable[[], Any],
+    ttl: int | None = None,
+    soft_ttl: int = DEFAULT_SOFT_TTL,
+) -> Any:
+    """Get JSON data from Redis, recomputing it with single-flight locking when missing or past its soft TTL.
+
+    The value is stored under the regular key with the hard TTL, next to a freshness marker that expires
+    after soft_ttl. Once the marker is gone, one caller takes a Redis lock and recomputes while every
+    other caller is served the stale value. With no value at all, other callers wait for the lock holder
+    to publish it, and compute it themselves only if that takes longer than RECOMPUTE_WAIT_TIMEOUT.
+    """
+
+    if ttl is None:
+        ttl = SEVEN_DAYS_TTL  # Default TTL
+
+    cache_key = _generate_cache_key(prefix, key_data)
+    fresh_key = f"{cache_key}:fresh"
+    lock_key = f"{cache_key}:lock"
+
+    try:
+        redis_cache = caches["redis"]
+        entries = redis_cache.get_many([cache_key, fresh_key])
+    except Exception as e:
+        logger.warning(f"Redis cache error: {prefix.value}:{key_data}: {e}")
+        return compute_fn()
+
+    value = _parse_cached_json(prefix, key_data, entries.get(cache_key))
+    if value is not None and fresh_key in entries:
+        logger.info(f"Cache HIT (redis): {prefix.value}:{key_data}")
+        return value
+
+    lock_token = uuid.uuid4().hex
+    if not _acquire_recompute_lock(lock_key, lock_token):
+        if value is not None:
+            logger.info(f"Cache STALE (redis): {prefix.value}:{key_data} (recompute in progress)")
+            return value
+
+        value = _wait_for_recompute(prefix, key_data, cache_key)
+        if value is not None:
+            return value
+        logger.warning(f"Timed out waiting for recompute of {prefix.value}:{key_data}, computing locally")
+        return compute_fn()
+
+    try:
+        logger.info(
+            f"Cache {'STALE' if value is not None else 'MISS'} (redis): {prefix.value}:{key_data} (recomputing)"
+        )
+        value = compute_fn()
+        if value is not None:
+            json_value = json.dumps(value, default=str)
+            redis_cache.set(cache_key, json_value, ttl)
+            redis_cache.set(fresh_key, 1, min(soft_ttl, ttl))
+            _index_generation_keys(prefix, [key_data])
+            logger.info(f"Cached (redis): {prefix.value}:{key_data} (TTL: {ttl}s, soft TTL: {soft_ttl}s)")
+        return value
+    finally:
+        _release_recompute_lock(lock_key, lock_token)
+
+
+def _parse_cached_json(prefix: CachePrefix, key_data: str, json_data: Any) -> Any:
+    if not isinstance(json_data, str):
+        return json_data
+    try:
+        return json.loads(json_data)
+    except ValueError as e:
+        logger.warning(f"Redis cache error: {prefix.value}:{key_data}: {e}")
+        return None
+
+
+def _acquire_recompute_lock(lock_key: str, lock_token: str) -> bool:
+    """SET NX EX the lock key. If Redis is unavailable every caller is allowed to recompute."""
+    try:
+        return bool(caches["redis"].add(lock_key, lock_token, RECOMPUTE_LOCK_TIMEOUT))
+    except Exception as e:
+        logger.warning(f"Failed to acquire recompute lock {lock_key}: {e}")
+        return True
+
+
+def _release_recompute_lock(lock_key: str, lock_token: str) -> None:
+    """Delete the lock only if this caller still holds it (it may have expired and been re-acquired).
+
+    The check and delete run as one Lua script on the raw client. Backends without one leave the lock
+    to expire by its TTL.
+    """
+    redis_cache = caches["redis"]
+    client = getattr(redis_cache, "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        return
+
+    try:
+        raw_client = client.get_client(write=True)
+        raw_client.eval(RELEASE_LOCK_SCRIPT, 1, redis_cache.make_key(lock_key), client.encode(lock_token))
+    except Exception as e:
+        logger.warning(f"Failed to release recompute lock {lock_key}: {e}")
+
+
+def _wait_for_recompute(prefix: CachePrefix, key_data: str, cache_key: str) -> Any:
+    """Poll for the value the lock holder is computing. Returns None on timeout."""
+    deadline = time.monotonic() + RECOMPUTE_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(RECOMPUTE_POLL_INTERVAL)
+        try:
+            json_data = caches["redis"].get(cache_key)
+        except Exception as e:
+            logger.warning(f"Redis cache error: {prefix.value}:{key_data}: {e}")
+            return None
+        if json_data is not None:
+            logger.info(f"Cache HIT (redis): {prefix.value}:{key_data} (after waiting for recompute)")
+            return _parse_cached_json(prefix, key_data, json_data)
+    return None
+
+
 def redis_cache_clear(prefix: CachePrefix) -> int:
     """Clear Redis cache entries for the provided prefix only."""
 
     pattern = f"{prefix.value}:*"
+    local_cache.clear(f"{prefix.value}:")
 
     try:
         redis_cache = caches["redis"]
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from core.models.etl import EtlRunModel, EtlStageCheckpointModel
+from core.utils.http_client import get_http_stats, reset_http_stats
+from core.utils.utils import get_logger
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+logger = get_logger(__name__)
+
+_counters_lock = threading.Lock()
+_external_calls: Counter[tuple[str, str]] = Counter()
+_db_query_count = 0
+
+
+def record_external_call(service: str, outcome: str) -> None:
+    """Count one external lookup by service and outcome, e.g. ("youtube", "cache_hit")."""
+    with _counters_lock:
+        _external_calls[(service, outcome)] += 1
+
+
+def get_external_call_stats() -> dict[str, dict[str, int]]:
+    with _counters_lock:
+        stats: dict[str, dict[str, int]] = {}
+        for (service, outcome), count in sorted(_external_calls.items()):
+            stats.setdefault(service, {})[outcome] = count
+        return stats
+
+
+def _count_query(execute, sql, params, many, context):
+    global _db_query_count
+    with _counters_lock:
+        _db_query_count += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter(sender: Any, connection: Any, **kwargs: Any) -> None:
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+def get_db_query_count() -> int:
+    with _counters_lock:
+        return _db_query_count
+
+
+def start_run_accounting() -> None:
+    """Reset external call, HTTP and DB query counters and count queries on every connection from now on.
+
+    Worker threads open their own connections, which connection_created instruments as they appear.
+    """
+    global _db_query_count
+    with _counters_lock:
+        _external_calls.clear()
+        _db_query_count = 0
+    reset_http_stats()
+
+    connection_created.connect(_install_query_counter, dispatch_uid="run_ledger_query_counter")
+    for connection in connections.all():
+        _install_query_counter(None, connection)
+
+
+def collect_run_accounting() -> dict[str, Any]:
+    """Counters accumulated since start_run_accounting, in the shape stored on EtlRunModel."""
+    return {
+        "external_calls": get_external_call_stats(),
+        "http_stats": get_http_stats(),
+        "db_query_count": get_db_query_count(),
+    }
+
+
+@contextmanager
+def record_stage(run: EtlRunModel, stage: str) -> Iterator[dict[str, Any]]:
+    """Checkpoint a sequential stage of run, with its duration and an optional row count.
+
+    The yielded dict may be given a "rows" entry; it is stored as the checkpoint result.
+    """
+    checkpoint, _created = EtlStageCheckpointModel.objects.update_or_create(
+        run=run,
+        stage=stage,
+        defaults={"status": EtlStageCheckpointModel.STATUS_RUNNING, "error": "", "finished_at": None},
+    )
+    result: dict[str, Any] = {}
+    start_time = time.monotonic()
+    try:
+        yield result
+    except Exception as e:
+        checkpoint.status = EtlStageCheckpointModel.STATUS_FAILED
+        checkpoint.error = str(e)
+        raise
+    else:
+        checkpoint.status = EtlStageCheckpointModel.STATUS_COMPLETED
+        checkpoint.result = result
+        checkpoint.row_count = result.get("rows")
+    finally:
+        checkpoint.duration_seconds = time.monotonic() - start_time
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save()
+        logger.info(f"Stage {stage} {checkpoint.status} in {checkpoint.duration_seconds:.1f}s")
+
+
+def finish_run(run: EtlRunModel, start_time: float, error: Exception | None = None) -> None:
+    """Close run as completed or failed, storing its duration and the counters collected since it started."""
+    accounting = collect_run_accounting()
+    run.status = EtlRunModel.STATUS_FAILED if error else EtlRunModel.STATUS_COMPLETED
+    run.error = str(error) if error else ""
+    run.duration_seconds = time.monotonic() - start_time
+    run.finished_at = timezone.now()
+    run.external_calls = accounting["external_calls"]
+    run.http_stats = accounting["http_stats"]
+    run.db_query_count = accounting["db_query_count"]
+    run.save()
+
+    total_requests = sum(host_stats["requests"] for host_stats in run.http_stats.values())
+    logger.info(
+        f"{run.pipeline} run {run.id} {run.status} in {run.duration_seconds:.1f}s: "
+        f"{run.db_query_count} DB queries, {total_requests} HTTP requests"
+    )
@@ -0,0 +1,47 @@
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+from core.utils.utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one.
+
+    The first caller runs the function; callers arriving while it is in flight wait for and share its result
+    (or exception). Nothing is remembered once the call finishes, caching stays with the caller.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            logger.debug(f"{self.name}: sharing in-flight lookup for {key}")
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
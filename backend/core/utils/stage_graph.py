@@ -0,0 +1,128 @@
+import concurrent.futures
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from core.settings import MAX_WORKERS
+from core.utils.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One unit of work in a stage graph.
+
+    run receives the results of every stage completed so far (its dependencies are guaranteed to be
+    among them) and returns a JSON-serializable result that is checkpointed and handed to dependents.
+    """
+
+    name: str
+    run: Callable[[Mapping[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+class StageGraphError(Exception):
+    """Raised after the graph drained when some stages failed; their dependents never ran."""
+
+    def __init__(self, failures: dict[str, Exception], skipped: list[str]):
+        self.failures = failures
+        self.skipped = skipped
+        failure_summary = "; ".join(f"{name}: {exc}" for name, exc in failures.items())
+        super().__init__(f"{len(failures)} stage(s) failed, {len(skipped)} skipped: {failure_summary}")
+
+
+def _validate_stage_graph(stages: list[Stage]) -> None:
+    names = [stage.name for stage in stages]
+    if len(names) != len(set(names)):
+        raise ValueError("Stage names must be unique")
+
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        unknown = [dependency for dependency in stage.depends_on if dependency not in by_name]
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on unknown stage(s): {unknown}")
+
+    # Kahn's algorithm: every stage must become ready at some point, otherwise there is a cycle
+    remaining = {stage.name: len(stage.depends_on) for stage in stages}
+    ready = [name for name, count in remaining.items() if count == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for stage in stages:
+            if name in stage.depends_on:
+                remaining[stage.name] -= 1
+                if remaining[stage.name] == 0:
+                    ready.append(stage.name)
+    if visited != len(stages):
+        raise ValueError("Stage graph contains a cycle")
+
+
+def run_stage_graph(
+    stages: list[Stage],
+    completed: Mapping[str, Any] | None = None,
+    on_start: Callable[[str], None] | None = None,
+    on_complete: Callable[[str, Any], None] | None = None,
+    on_failure: Callable[[str, Exception], None] | None = None,
+    max_workers: int = MAX_WORKERS,
+) -> dict[str, Any]:
+    """Run stages as soon as their dependencies finish, with independent branches in parallel.
+
+    Stages listed in completed (e.g. loaded from checkpoints) are not run again and their stored results
+    are used instead. A failing stage does not stop unrelated branches; its dependents are skipped and a
+    StageGraphError is raised once everything runnable has finished. Returns the result of every stage.
+    """
+    _validate_stage_graph(stages)
+
+    results: dict[str, Any] = dict(completed or {})
+    pending = {stage.name: stage for stage in stages if stage.name not in results}
+    failures: dict[str, Exception] = {}
+    if len(pending) < len(stages):
+        logger.info(f"Resuming stage graph: {len(stages) - len(pending)}/{len(stages)} stages already completed")
+
+    def is_blocked(stage: Stage) -> bool:
+        return any(dependency in failures or dependency in blocked for dependency in stage.depends_on)
+
+    blocked: set[str] = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: dict[concurrent.futures.Future, str] = {}
+
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if is_blocked(stage):
+                    blocked.add(name)
+                    del pending[name]
+                elif all(dependency in results for dependency in stage.depends_on):
+                    if on_start:
+                        on_start(name)
+                    running[executor.submit(stage.run, dict(results))] = name
+                    del pending[name]
+
+            if not running:
+                # Anything still pending waits on a blocked stage; the next pass marks it blocked
+                continue
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    logger.error(f"Stage {name} failed: {exc}")
+                    failures[name] = exc
+                    if on_failure:
+                        on_failure(name, exc)
+                    continue
+
+                logger.info(f"Stage {name} completed")
+                if on_complete:
+                    on_complete(name, results[name])
+
+    if failures:
+        skipped = sorted(blocked)
+        if skipped:
+            logger.warning(f"Skipped {len(skipped)} stage(s) downstream of failures: {skipped}")
+        raise StageGraphError(failures, skipped)
+
+    return results
@@ -1,40 +1,75 @@
+import atexit
+import contextlib
+import math
+import queue
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+from core.settings import (
+    WEBDRIVER_MAX_MEMORY_MB,
+    WEBDRIVER_MAX_PAGES_PER_BROWSER,
+    WEBDRIVER_POOL_SIZE,
+    WEBDRIVER_TABS_PER_BROWSER,
+)
 from core.utils.utils import get_logger
 from django.conf import settings
 
 # ETL-only imports - conditionally imported to avoid Vercel serverless bloat
 if settings.ETL_DEPENDENCIES_AVAILABLE:
     from selenium import webdriver
-    from selenium.common.exceptions import NoSuchElementException
+    from selenium.common.exceptions import (
+        JavascriptException,
+        NoSuchElementException,
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException,
+    )
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.by import By
     from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.support.ui import WebDriverWait
     from webdriver_manager.chrome import ChromeDriverManager
 else:
     # Create placeholder classes to prevent NameError
     webdriver = None  # type: ignore
+    JavascriptException = Exception  # type: ignore
     NoSuchElementException = Exception  # type: ignore
+    StaleElementReferenceException = Exception  # type: ignore
+    TimeoutException = Exception  # type: ignore
+    WebDriverException = Exception  # type: ignore
     Options = None  # type: ignore
     Service = None  # type: ignore
     By = None  # type: ignore
     WebDriver = None  # type: ignore
+    WebDriverWait = None  # type: ignore
     ChromeDriverManager = None  # type: ignore
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = get_logger(__name__)
 
+# Set on a tab's document before it navigates away; the next document starts without it
+STALE_PAGE_MARKER = "__webdriverPoolStalePage"
 
-_thread_local = threading.local()
+_webdriver_pool: "WebDriverPool | None" = None
+_webdriver_pool_lock = threading.Lock()
 
 
-def get_cached_webdriver() -> "WebDriverManager":
-    """Get a thread-local WebDriverManager to prevent race conditions."""
-    if not hasattr(_thread_local, "webdriver_manager"):
-        _thread_local.webdriver_manager = WebDriverManager()
-    return _thread_local.webdriver_manager
+def get_webdriver_pool() -> "WebDriverPool":
+    """Process-wide browser pool sized by the WEBDRIVER_* settings, closed at exit."""
+    global _webdriver_pool
+    with _webdriver_pool_lock:
+        if _webdriver_pool is None:
+            _webdriver_pool = WebDriverPool(
+                size=WEBDRIVER_POOL_SIZE,
+                tabs_per_browser=WEBDRIVER_TABS_PER_BROWSER,
+                max_pages_per_browser=WEBDRIVER_MAX_PAGES_PER_BROWSER,
+                max_memory_mb=WEBDRIVER_MAX_MEMORY_MB,
+            )
+            atexit.register(_webdriver_pool.close)
+        return _webdriver_pool
 
 
 class WebDriverManager:
@@ -114,3 +149,176 @@ class WebDriverManager:
             raise
 
         return None
+
+
+class PooledBrowser:
+    """
+    One Chrome with a fixed set of tabs that load pages in parallel.
+
+    The browser is recycled after max_pages page loads, when its tabs' JS heaps exceed max_memory_mb,
+    or when the session breaks.
+    """
+
+    def __init__(self, tabs: int, max_pages: int, max_memory_mb: int) -> None:
+        self.tabs = tabs
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.manager = WebDriverManager()
+        self.handles: list[str] = []
+        self.pages_loaded = 0
+        # Error of the last scrape when it failed even on a fresh browser
+        self.broken_by: Exception | None = None
+
+    def scrape(self, urls: list[str], css_selector: str, timeout: float) -> dict[str, str | Exception]:
+        """Text of the first css_selector match per URL, or the exception that page failed with.
+
+        A round broken by a session or driver start-up error is retried once on a fresh browser.
+        """
+        self.broken_by = None
+        try:
+            results = self._scrape_round(urls, css_selector, timeout)
+        except Exception as e:
+            logger.warning(f"Browser session failed, recycling it and retrying {len(urls)} pages: {e}")
+            self.recycle()
+            try:
+                results = self._scrape_round(urls, css_selector, timeout)
+            except Exception as retry_error:
+                self.recycle()
+                self.broken_by = retry_error
+                return dict.fromkeys(urls, retry_error)
+
+        self._recycle_if_worn()
+        return results
+
+    def _start(self) -> "WebDriver":
+        driver = self.manager.get_driver()
+        if not self.handles:
+            # Explicit waits only; an implicit wait would stall every poll of an absent element
+            driver.implicitly_wait(0)
+            self.handles = [driver.current_window_handle]
+            while len(self.handles) < self.tabs:
+                driver.switch_to.new_window("tab")
+                self.handles.append(driver.current_window_handle)
+        return driver
+
+    def _scrape_round(self, urls: list[str], css_selector: str, timeout: float) -> dict[str, str | Exception]:
+        driver = self._start()
+
+        # Start every tab's navigation before waiting on any, so the pages load concurrently
+        for handle, url in zip(self.handles, urls, strict=False):
+            driver.switch_to.window(handle)
+            driver.execute_script(f"window.{STALE_PAGE_MARKER} = true; window.location.href = arguments[0];", url)
+        self.pages_loaded += len(urls)
+
+        results: dict[str, str | Exception] = {}
+        for handle, url in zip(self.handles, urls, strict=False):
+            driver.switch_to.window(handle)
+            try:
+                # The condition can run mid-navigation, when the script or the matched element is torn down
+                results[url] = WebDriverWait(
+                    driver,
+                    timeout,
+                    poll_frequency=0.2,
+                    ignored_exceptions=(JavascriptException, StaleElementReferenceException),
+                ).until(lambda d: _loaded_element_text(d, css_selector))
+            except TimeoutException:
+                results[url] = TimeoutException(f"{css_selector} not found on {url} within {timeout}s")
+        return results
+
+    def _recycle_if_worn(self) -> None:
+        if self.pages_loaded >= self.max_pages:
+            logger.info(f"Recycling browser after {self.pages_loaded} pages")
+            self.recycle()
+            return
+
+        memory_mb = self.memory_mb()
+        if memory_mb > self.max_memory_mb:
+            logger.info(f"Recycling browser using {memory_mb:.0f}MB of JS heap after {self.pages_loaded} pages")
+            self.recycle()
+
+    def memory_mb(self) -> float:
+        """JS heap in use across the browser's tabs."""
+        driver = self.manager.driver
+        if driver is None:
+            return 0.0
+
+        used_bytes = 0
+        with contextlib.suppress(WebDriverException):
+            for handle in self.handles:
+                driver.switch_to.window(handle)
+                used_bytes += driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0")
+        return used_bytes / 1_000_000
+
+    def recycle(self) -> None:
+        with contextlib.suppress(Exception):
+            self.manager.close_driver()
+        self.manager.driver = None
+        self.handles = []
+        self.pages_loaded = 0
+
+
+def _loaded_element_text(driver: "WebDriver", css_selector: str) -> str | bool:
+    """Wait condition: non-empty text of css_selector on the page the tab navigated to, not the one before it."""
+    if driver.execute_script(f"return window.{STALE_PAGE_MARKER} === true"):
+        return False
+    elements = driver.find_elements(By.CSS_SELECTOR, css_selector)
+    text = elements[0].text.strip() if elements else ""
+    return text or False
+
+
+class WebDriverPool:
+    """
+    A fixed number of browsers shared by scraping jobs.
+
+    A job spreads its URLs over the free browsers, each taking tabs_per_browser URLs at a time,
+    and callers on other threads wait for a browser to come back.
+    """
+
+    def __init__(self, size: int, tabs_per_browser: int, max_pages_per_browser: int, max_memory_mb: int) -> None:
+        self.size = size
+        self.tabs_per_browser = tabs_per_browser
+        self._all_browsers = [
+            PooledBrowser(tabs_per_browser, max_pages_per_browser, max_memory_mb) for _ in range(size)
+        ]
+        self._browsers: queue.Queue[PooledBrowser] = queue.Queue()
+        for browser in self._all_browsers:
+            self._browsers.put(browser)
+
+    def scrape_texts(self, urls: list[str], css_selector: str, timeout: float = 15.0) -> dict[str, str | Exception]:
+        """Text of the first css_selector match on each page, or the exception that page failed with."""
+        pending = deque(dict.fromkeys(urls))
+        pending_lock = threading.Lock()
+        results: dict[str, str | Exception] = {}
+
+        def work() -> Exception | None:
+            browser = self._browsers.get()
+            try:
+                while True:
+                    with pending_lock:
+                        batch = [pending.popleft() for _ in range(min(browser.tabs, len(pending)))]
+                    if not batch:
+                        return None
+                    results.update(browser.scrape(batch, css_selector, timeout))
+                    if browser.broken_by is not None:
+                        # A browser that cannot start leaves the remaining pages to the others
+                        return browser.broken_by
+            finally:
+                self._browsers.put(browser)
+
+        workers = min(self.size, math.ceil(len(pending) / self.tabs_per_browser))
+        if not workers:
+            return results
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = [future.result() for future in [executor.submit(work) for _ in range(workers)]]
+
+        # Pages left over when every browser broke
+        error = next((error for error in errors if error is not None), None)
+        if pending and error is not None:
+            results.update(dict.fromkeys(pending, error))
+        return results
+
+    def close(self) -> None:
+        """Quit every browser; they start again on the next scrape."""
+        for browser in self._all_browsers:
+            browser.recycle()
@@ -0,0 +1,41 @@
+import zoneinfo
+from datetime import date, datetime
+
+from core.models.etl import YouTubeQuotaUsageModel
+from core.settings import YOUTUBE_DAILY_QUOTA_UNITS
+from core.utils.utils import get_logger
+from django.db.models import F
+
+logger = get_logger(__name__)
+
+# Cost per request in YouTube Data API units
+YOUTUBE_SEARCH_UNITS = 100
+YOUTUBE_VIDEOS_LIST_UNITS = 1
+
+YOUTUBE_QUOTA_TIMEZONE = zoneinfo.ZoneInfo("America/Los_Angeles")
+
+
+def get_quota_date() -> date:
+    return datetime.now(YOUTUBE_QUOTA_TIMEZONE).date()
+
+
+def record_youtube_quota_usage(units: int) -> None:
+    """Add units spent by a YouTube Data API request to today's usage."""
+    usage, _created = YouTubeQuotaUsageModel.objects.get_or_create(quota_date=get_quota_date())
+    YouTubeQuotaUsageModel.objects.filter(id=usage.id).update(units_used=F("units_used") + units)
+
+
+def mark_youtube_quota_exhausted() -> None:
+    """The API answered quotaExceeded: no units are left today whatever the local estimate says."""
+    YouTubeQuotaUsageModel.objects.update_or_create(quota_date=get_quota_date(), defaults={"exhausted": True})
+    logger.warning(f"YouTube quota exhausted for {get_quota_date()}")
+
+
+def get_remaining_youtube_quota_units() -> int:
+    """Estimated units left today: the daily quota minus the units recorded so far."""
+    usage = YouTubeQuotaUsageModel.objects.filter(quota_date=get_quota_date()).first()
+    if usage is None:
+        return YOUTUBE_DAILY_QUOTA_UNITS
+    if usage.exhausted:
+        return 0
+    return max(YOUTUBE_DAILY_QUOTA_UNITS - usage.units_used, 0)
@@ -266,8 +266,12 @@ class Track(BaseModel):
         django_track,
         genre: "GenreName | None" = None,
         service: "ServiceName | None" = None,
+        context: "TrackEnrichmentContext | None" = None,
     ) -> Self:
-        """Convert from Django TrackModel with full enrichment."""
+        """Convert from Django TrackModel with full enrichment.
+
+        Pass a preloaded context to build many tracks without per-track queries.
+        """
         # Import inside method to avoid circular dependency
 
         # Base track data from Django model
@@ -291,13 +295,15 @@ class Track(BaseModel):
 
         # Add enrichment if genre/service provided
         if genre and service:
-            enriched_data = cls._enrich_track_data(django_track, genre.value, service.value)
+            enriched_data = cls._enrich_track_data(django_track, genre.value, service.value, context)
             track_data.update(enriched_data)
 
         return cls.from_dict(track_data)
 
     @classmethod
-    def _enrich_track_data(cls, track, genre: str, service: str) -> dict[str, Any]:
+    def _enrich_track_data(
+        cls, track, genre: str, service: str, context: "TrackEnrichmentContext | None" = None
+    ) -> dict[str, Any]:
         """Enrich track with computed fields."""
         from core.constants import ALL_SERVICES, RANKED_SERVICES
 
@@ -306,32 +312,34 @@ class Track(BaseModel):
         # Service sources (must be dicts for from_dict() compatibility)
         for service_name in ALL_SERVICES:
             source_key = f"{_snake_to_camel(service_name.value)}Source"
-            source = cls._build_service_source(track, service_name)
+            source = cls._build_service_source(track, service_name, context)
             enrichment[source_key] = source.to_dict() if source else None
 
         # Service rankings (YouTube has no rank)
         for service_name in RANKED_SERVICES:
             rank_key = f"{_snake_to_camel(service_name.value)}Rank"
-            enrichment[rank_key] = cls._get_service_rank(track, genre, service_name)
+            enrichment[rank_key] = cls._get_service_rank(track, genre, service_name, context)
 
         # Track detail URLs
         for service_name in ALL_SERVICES:
             player = service_name.value
             url_key = f"trackDetailUrl{_snake_to_pascal(player)}"
-            enrichment[url_key] = cls._build_track_detail_url(track, genre, player)
+            enrichment[url_key] = cls._build_track_detail_url(track, genre, player, context)
 
         # Button labels (must be dicts for from_dict() compatibility)
         button_labels = cls._get_button_labels(track, genre, service)
         enrichment["buttonLabels"] = [bl.to_dict() for bl in button_labels]
 
         # Play count data
-        play_count_data = cls._get_play_count_data(track)
+        play_count_data = cls._get_play_count_data(track, context)
         enrichment.update(play_count_data)
 
         return enrichment
 
     @staticmethod
-    def _build_service_source(track, service_name: "ServiceName") -> "ServiceSource | None":
+    def _build_service_source(
+        track, service_name: "ServiceName", context: "TrackEnrichmentContext | None" = None
+    ) -> "ServiceSource | None":
         """Build service source object."""
         from core.api.genre_service_api import get_service
 
@@ -342,7 +350,7 @@ class Track(BaseModel):
             return None
 
         try:
-            service = get_service(service_name)
+            service = context.services.get(service_name.value) if context else get_service(service_name)
             if not service:
                 return None
             return ServiceSource(
@@ -355,11 +363,16 @@ class Track(BaseModel):
             return None
 
     @staticmethod
-    def _get_service_rank(track, genre: str, service_name: ServiceName) -> int | None:
+    def _get_service_rank(
+        track, genre: str, service_name: ServiceName, context: "TrackEnrichmentContext | None" = None
+    ) -> int | None:
         """Get track rank for service/genre."""
         from core.api.genre_service_api import get_track_rank_by_track_object
         from core.constants import GenreName
 
+        if context:
+            return context.ranks.get((track.isrc, service_name.value))
+
         try:
             genre_enum = GenreName(genre)
             return get_track_rank_by_track_object(track, genre_enum, service_name)
@@ -367,23 +380,27 @@ class Track(BaseModel):
             return None
 
     @staticmethod
-    def _build_track_detail_url(track, genre: str, player: str) -> str:
+    def _build_track_detail_url(track, genre: str, player: str, context: "TrackEnrichmentContext | None" = None) -> str:
         """Build track detail URL for player."""
         from core.api.track_api import build_track_query_url
 
+        default_url = f"/?genre={genre}&rank=tunemeld-rank&player={player}&isrc={track.isrc}"
+        if context:
+            return default_url
+
         try:
             url = build_track_query_url(genre, "tunemeld-rank", track.isrc, player)
-            return url if url else f"/?genre={genre}&rank=tunemeld-rank&player={player}&isrc={track.isrc}"
+            return url if url else default_url
         except Exception:
-            return f"/?genre={genre}&rank=tunemeld-rank&player={player}&isrc={track.isrc}"
+            return default_url
 
     @staticmethod
-    def _get_play_count_data(track) -> dict[str, Any]:
+    def _get_play_count_data(track, context: "TrackEnrichmentContext | None" = None) -> dict[str, Any]:
         """Get play count data for track."""
         from core.api.play_count import get_track_play_count
 
         try:
-            play_count_data = get_track_play_count(track.isrc)
+            play_count_data = context.play_counts.get(track.isrc) if context else get_track_play_count(track.isrc)
             if play_count_data:
                 return {
                     "totalCurrentPlayCount": play_count_data.total_current_play_count,
@@ -760,6 +777,15 @@ class ServicePlayCount:
         }
 
 
+@dataclass
+class TrackEnrichmentContext:
+    """Preloaded lookups used to enrich many tracks of one genre without per-track queries."""
+
+    services: dict[str, Service]
+    ranks: dict[tuple[str, str], int]
+    play_counts: dict[str, "TrackPlayCountData"]
+
+
 @dataclass
 class TrackPlayCountData:
     isrc: str
@@ -0,0 +1,75 @@
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import strawberry.types
+from core.api.genre_service_api import get_services_by_names, get_track_ranks_by_keys
+from core.constants import ALL_SERVICES, RANKED_SERVICES
+from domain_types.types import Service
+
+LOADERS_CONTEXT_ATTR = "_track_loaders"
+
+
+class BatchLoader:
+    """Request-scoped synchronous DataLoader.
+
+    Keys queued with enqueue() are fetched together with the next key passed to load(), so sibling
+    fields resolved across many tracks share a single batch call. Results (including misses) are memoized.
+    """
+
+    def __init__(self, batch_load_fn: Callable[[list[Any]], dict[Any, Any]]):
+        self._batch_load_fn = batch_load_fn
+        self._cache: dict[Hashable, Any] = {}
+        self._queue: dict[Hashable, None] = {}
+
+    def enqueue(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            if key not in self._cache:
+                self._queue[key] = None
+
+    def load(self, key: Hashable) -> Any:
+        if key not in self._cache:
+            self._queue[key] = None
+            self._dispatch()
+        return self._cache.get(key)
+
+    def _dispatch(self) -> None:
+        keys = list(self._queue)
+        self._queue.clear()
+        results = self._batch_load_fn(keys)
+        for key in keys:
+            self._cache[key] = results.get(key)
+
+
+@dataclass
+class TrackLoaders:
+    rank: BatchLoader = field(default_factory=lambda: BatchLoader(get_track_ranks_by_keys))
+    service: BatchLoader = field(default_factory=lambda: BatchLoader(get_services_by_names))
+
+    def enqueue_ranks(self, isrcs: Iterable[str], genre: str) -> None:
+        """Queue every ranked service for the given tracks so they resolve in one query."""
+        self.rank.enqueue((isrc, genre, service_name.value) for isrc in isrcs for service_name in RANKED_SERVICES)
+
+    def load_rank(self, isrc: str, genre: str, service_name: str) -> int | None:
+        self.enqueue_ranks([isrc], genre)
+        return self.rank.load((isrc, genre, service_name))
+
+    def load_service(self, service_name: str) -> Service | None:
+        self.service.enqueue(service.value for service in ALL_SERVICES)
+        return self.service.load(service_name)
+
+
+def get_track_loaders(info: strawberry.types.Info) -> TrackLoaders:
+    """Get the TrackLoaders bound to the current request, creating them on first use."""
+    context = info.context
+    if context is None:
+        return TrackLoaders()
+
+    if isinstance(context, dict):
+        return context.setdefault(LOADERS_CONTEXT_ATTR, TrackLoaders())
+
+    loaders = getattr(context, LOADERS_CONTEXT_ATTR, None)
+    if loaders is None:
+        loaders = TrackLoaders()
+        setattr(context, LOADERS_CONTEXT_ATTR, loaders)
+    return loaders
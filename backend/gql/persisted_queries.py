@@ -0,0 +1,76 @@
+import hashlib
+
+from core.constants import GraphQLCacheKey
+from core.utils.redis_cache import (
+    CachePrefix,
+    LocalLRUCache,
+    redis_cache_get_raw,
+    redis_cache_set_raw,
+)
+
+PERSISTED_QUERY_TTL = 30 * 24 * 60 * 60
+PERSISTED_QUERY_LOCAL_MAX_ENTRIES = 256
+
+# Documents are immutable per hash, so the in-process copy only needs to be bounded
+_local_registry = LocalLRUCache(PERSISTED_QUERY_LOCAL_MAX_ENTRIES, PERSISTED_QUERY_TTL)
+
+
+class PersistedQueryError(Exception):
+    """Raised when an automatic persisted query cannot be resolved."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def get_persisted_query(sha256_hash: str) -> str | None:
+    """Look up a persisted document by hash, in process memory first and then Redis."""
+    query = _local_registry.get(sha256_hash)
+    if query is not None:
+        return query
+
+    query = redis_cache_get_raw(CachePrefix.GQL_PERSISTED_QUERY, GraphQLCacheKey.persisted_query(sha256_hash))
+    if query is not None:
+        _local_registry.set(sha256_hash, query)
+    return query
+
+
+def register_persisted_query(query: str) -> str:
+    """Store a document under its sha256 hash and return the hash."""
+    sha256_hash = get_query_hash(query)
+    if _local_registry.get(sha256_hash) is None:
+        redis_cache_set_raw(
+            CachePrefix.GQL_PERSISTED_QUERY, GraphQLCacheKey.persisted_query(sha256_hash), query, PERSISTED_QUERY_TTL
+        )
+        _local_registry.set(sha256_hash, query)
+    return sha256_hash
+
+
+def resolve_persisted_query(query: str | None, extensions: dict | None) -> str | None:
+    """Resolve the document for a request following the Apollo APQ protocol.
+
+    A hash without a query is looked up in the registry; a hash with a query registers it.
+    Requests without the persistedQuery extension are returned unchanged.
+    """
+    persisted_query = (extensions or {}).get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return query
+
+    sha256_hash = persisted_query.get("sha256Hash")
+    if persisted_query.get("version") != 1 or not isinstance(sha256_hash, str):
+        raise PersistedQueryError("Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED")
+
+    if query is None:
+        stored_query = get_persisted_query(sha256_hash)
+        if stored_query is None:
+            raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        return stored_query
+
+    if get_query_hash(query) != sha256_hash:
+        raise PersistedQueryError("provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH")
+    register_persisted_query(query)
+    return query
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 import strawberry
-from core.api.play_count import get_track_play_count
+from core.api.play_count import get_track_play_count, get_tracks_play_counts
 from core.constants import GraphQLCacheKey
 from core.utils.redis_cache import CachePrefix, redis_cache_get, redis_cache_set
 
@@ -41,6 +41,15 @@ class TrackPlayCountType:
     total_current_play_count_abbreviated: str | None = None
     total_weekly_change_percentage_formatted: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrackPlayCountType":
+        """Create TrackPlayCountType from TrackPlayCountData.to_dict() output, fresh or read back from cache."""
+        values = dict(data)
+        for field_name, value in data.items():
+            if field_name.endswith("_updated_at") and isinstance(value, str):
+                values[field_name] = datetime.fromisoformat(value)
+        return cls(**values)
+
 
 @strawberry.type
 class PlayCountQuery:
@@ -52,12 +61,8 @@ class PlayCountQuery:
     @strawberry.field(description="Get play count data for multiple tracks by ISRCs")
     def tracks_play_counts(self, isrcs: list[str]) -> list[TrackPlayCountType]:
         """Get play count data for multiple tracks."""
-        results = []
-        for isrc in isrcs:
-            play_count = PlayCountQuery._get_track_play_count(isrc)
-            if play_count is not None:
-                results.append(play_count)
-        return results
+        play_counts = get_tracks_play_counts(isrcs)
+        return [TrackPlayCountType.from_dict(play_counts[isrc]) for isrc in isrcs if isrc in play_counts]
 
     @staticmethod
     def _get_track_play_count(isrc: str) -> TrackPlayCountType | None:
@@ -67,7 +72,7 @@ class PlayCountQuery:
         cached_data = redis_cache_get(CachePrefix.GQL_PLAY_COUNT, cache_key)
 
         if cached_data:
-            return TrackPlayCountType(**cached_data)
+            return TrackPlayCountType.from_dict(cached_data)
 
         play_count_data = get_track_play_count(isrc)
         if not play_count_data:
@@ -77,4 +82,4 @@ class PlayCountQuery:
 
         redis_cache_set(CachePrefix.GQL_PLAY_COUNT, cache_key, result_data)
 
-        return TrackPlayCountType(**result_data)
+        return TrackPlayCountType.from_dict(result_data)
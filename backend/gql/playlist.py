@@ -13,7 +13,7 @@ from core.api.genre_service_api import (
     get_tunemeld_playlist_updated_at,
 )
 from core.constants import GenreName, GraphQLCacheKey, ServiceName
-from core.utils.redis_cache import CachePrefix, redis_cache_get, redis_cache_set
+from core.utils.redis_cache import CachePrefix, redis_cache_get, redis_cache_get_or_compute, redis_cache_set
 from domain_types.types import Playlist, PlaylistMetadata, RankData
 
 from backend.gql.track import TrackType
@@ -80,54 +80,34 @@ class PlaylistQuery:
         """Get playlist data for any service (including Aggregate) and genre."""
         cache_key_data = GraphQLCacheKey.resolve_playlist(genre, service)
 
-        cached_result = redis_cache_get(CachePrefix.GQL_PLAYLIST, cache_key_data)
+        def build_playlist() -> dict[str, Any]:
+            genre_enum = GenreName(genre)
+            service_enum = ServiceName(service)
 
-        if cached_result is not None:
-            # Reconstruct domain Playlist object from cached data
-            cached_playlist = Playlist.from_dict(cached_result)
-
-            cached_strawberry_tracks = []
-            for track in cached_playlist.tracks:
-                strawberry_track = TrackType.from_domain_track(track)
-                cached_strawberry_tracks.append(strawberry_track)
-
-            return PlaylistType(
-                genre_name=cached_playlist.genre_name,
-                service_name=cached_playlist.service_name,
-                tracks=cached_strawberry_tracks,
-            )
-
-        genre_enum = GenreName(genre)
-        service_enum = ServiceName(service)
-
-        # Get track positions from API layer
-        track_positions = get_playlist_tracks_by_genre_service(genre_enum, service_enum)
-
-        # Batch fetch all tracks with enrichment (service sources, ranks, button labels)
-        isrcs = [isrc for isrc, _position in track_positions]
-        isrc_to_track = get_tracks_by_isrcs(isrcs, genre=genre_enum, service=service_enum)
+            # Get track positions from API layer
+            track_positions = get_playlist_tracks_by_genre_service(genre_enum, service_enum)
 
-        # Preserve playlist order and filter out missing tracks
-        domain_tracks = []
-        for isrc, _position in track_positions:
-            track = isrc_to_track.get(isrc)  # type: ignore[assignment]
-            if track is not None:
-                domain_tracks.append(track)
+            # Batch fetch all tracks with enrichment (service sources, ranks, button labels)
+            isrcs = [isrc for isrc, _position in track_positions]
+            isrc_to_track = get_tracks_by_isrcs(isrcs, genre=genre_enum, service=service_enum)
 
-        domain_playlist = Playlist(genre_name=genre, service_name=service, tracks=domain_tracks)
+            # Preserve playlist order and filter out missing tracks
+            domain_tracks = []
+            for isrc, _position in track_positions:
+                track = isrc_to_track.get(isrc)  # type: ignore[assignment]
+                if track is not None:
+                    domain_tracks.append(track)
 
-        redis_cache_set(CachePrefix.GQL_PLAYLIST, cache_key_data, domain_playlist.to_dict())
+            return Playlist(genre_name=genre, service_name=service, tracks=domain_tracks).to_dict()
 
-        # Convert domain tracks to Strawberry types
-        strawberry_tracks = []
-        for track in domain_tracks:
-            strawberry_track = TrackType.from_domain_track(track)
-            strawberry_tracks.append(strawberry_track)
+        # Concurrent misses share one rebuild; past the soft TTL the stale playlist is served meanwhile
+        playlist_data = redis_cache_get_or_compute(CachePrefix.GQL_PLAYLIST, cache_key_data, build_playlist)
+        domain_playlist = Playlist.from_dict(playlist_data)
 
         return PlaylistType(
-            genre_name=genre,
-            service_name=service,
-            tracks=strawberry_tracks,
+            genre_name=domain_playlist.genre_name,
+            service_name=domain_playlist.service_name,
+            tracks=[TrackType.from_domain_track(track) for track in domain_playlist.tracks],
         )
 
     @strawberry.field
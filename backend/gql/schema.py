@@ -1,4 +1,5 @@
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.schema.config import StrawberryConfig
 
 from backend.gql.genre import GenreQuery
@@ -13,4 +14,14 @@ class Query(TrackQuery, PlaylistQuery, ServiceQuery, GenreQuery, PlayCountQuery)
     pass
 
 
-schema = strawberry.Schema(query=Query, config=StrawberryConfig(auto_camel_case=True))
+# Parsed and validated documents are reused across requests; the frontend sends a small fixed set
+GRAPHQL_DOCUMENT_CACHE_SIZE = 256
+
+schema = strawberry.Schema(
+    query=Query,
+    config=StrawberryConfig(auto_camel_case=True),
+    extensions=[
+        ParserCache(maxsize=GRAPHQL_DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=GRAPHQL_DOCUMENT_CACHE_SIZE),
+    ],
+)
@@ -2,17 +2,14 @@ from datetime import datetime
 
 import strawberry
 import strawberry.types
-from core.api.genre_service_api import (
-    get_service,
-    get_track_by_isrc,
-    get_track_rank_by_track_object,
-)
+from core.api.genre_service_api import get_track_by_isrc, get_track_models_by_isrcs
 from core.api.track_api import build_track_query_url, get_similar_tracks
 from core.constants import GraphQLCacheKey, ServiceName
 from core.utils.redis_cache import CachePrefix, redis_cache_get, redis_cache_set
 from core.utils.utils import truncate_to_words
 
 from backend.gql.button_labels import ButtonLabelType, generate_track_button_labels
+from backend.gql.loaders import get_track_loaders
 from backend.gql.service import ServiceType
 
 
@@ -215,47 +212,31 @@ class TrackType:
         if hasattr(self, "_tunemeld_rank"):
             return self._tunemeld_rank
 
-        genre_name = info.variable_values["genre"]
-        track_domain = get_track_by_isrc(self.isrc)
-        if not track_domain:
-            return None
-        return get_track_rank_by_track_object(track_domain, genre_name, ServiceName.TUNEMELD)
+        return self._load_rank(info, ServiceName.TUNEMELD)
 
     @strawberry.field(description="Position on SoundCloud playlist for current genre")
     def soundcloud_rank(self, info: strawberry.types.Info) -> int | None:
         if hasattr(self, "_soundcloud_rank"):
             return self._soundcloud_rank
 
-        genre_name = info.variable_values["genre"]
-        track_domain = get_track_by_isrc(self.isrc)
-        if not track_domain:
-            return None
-        return get_track_rank_by_track_object(track_domain, genre_name, ServiceName.SOUNDCLOUD)
+        return self._load_rank(info, ServiceName.SOUNDCLOUD)
 
     @strawberry.field(description="Position on Spotify playlist for current genre")
     def spotify_rank(self, info: strawberry.types.Info) -> int | None:
         if hasattr(self, "_spotify_rank"):
             return self._spotify_rank
 
-        genre_name = info.variable_values["genre"]
-        track_domain = get_track_by_isrc(self.isrc)
-        if not track_domain:
-            return None
-        return get_track_rank_by_track_object(track_domain, genre_name, ServiceName.SPOTIFY)
+        return self._load_rank(info, ServiceName.SPOTIFY)
 
     @strawberry.field(description="Position on Apple Music playlist for current genre")
     def apple_music_rank(self, info: strawberry.types.Info) -> int | None:
         if hasattr(self, "_apple_music_rank"):
             return self._apple_music_rank
 
-        genre_name = info.variable_values["genre"]
-        track_domain = get_track_by_isrc(self.isrc)
-        if not track_domain:
-            return None
-        return get_track_rank_by_track_object(track_domain, genre_name, ServiceName.APPLE_MUSIC)
+        return self._load_rank(info, ServiceName.APPLE_MUSIC)
 
     @strawberry.field(description="Spotify service source with metadata")
-    def spotify_source(self) -> ServiceType | None:
+    def spotify_source(self, info: strawberry.types.Info) -> ServiceType | None:
         if hasattr(self, "_spotify_source") and self._spotify_source:
             return ServiceType(
                 name=self._spotify_source["name"],
@@ -264,20 +245,10 @@ class TrackType:
                 icon_url=self._spotify_source["iconUrl"],
             )
 
-        if not self.spotify_url:
-            return None
-        service = get_service(ServiceName.SPOTIFY)
-        if service:
-            return ServiceType(
-                name=ServiceName.SPOTIFY.value,
-                display_name=service.display_name,
-                url=self.spotify_url,
-                icon_url=service.icon_url,
-            )
-        return None
+        return self._load_source(info, ServiceName.SPOTIFY, self.spotify_url)
 
     @strawberry.field(description="Apple Music service source with metadata")
-    def apple_music_source(self) -> ServiceType | None:
+    def apple_music_source(self, info: strawberry.types.Info) -> ServiceType | None:
         if hasattr(self, "_apple_music_source") and self._apple_music_source:
             return ServiceType(
                 name=self._apple_music_source["name"],
@@ -286,20 +257,10 @@ class TrackType:
                 icon_url=self._apple_music_source["iconUrl"],
             )
 
-        if not self.apple_music_url:
-            return None
-        service = get_service(ServiceName.APPLE_MUSIC)
-        if service:
-            return ServiceType(
-                name=ServiceName.APPLE_MUSIC.value,
-                display_name=service.display_name,
-                url=self.apple_music_url,
-                icon_url=service.icon_url,
-            )
-        return None
+        return self._load_source(info, ServiceName.APPLE_MUSIC, self.apple_music_url)
 
     @strawberry.field(description="SoundCloud service source with metadata")
-    def soundcloud_source(self) -> ServiceType | None:
+    def soundcloud_source(self, info: strawberry.types.Info) -> ServiceType | None:
         if hasattr(self, "_soundcloud_source") and self._soundcloud_source:
             return ServiceType(
                 name=self._soundcloud_source["name"],
@@ -308,20 +269,10 @@ class TrackType:
                 icon_url=self._soundcloud_source["iconUrl"],
             )
 
-        if not self.soundcloud_url:
-            return None
-        service = get_service(ServiceName.SOUNDCLOUD)
-        if service:
-            return ServiceType(
-                name=ServiceName.SOUNDCLOUD.value,
-                display_name=service.display_name,
-                url=self.soundcloud_url,
-                icon_url=service.icon_url,
-            )
-        return None
+        return self._load_source(info, ServiceName.SOUNDCLOUD, self.soundcloud_url)
 
     @strawberry.field(description="YouTube service source with metadata")
-    def youtube_source(self) -> ServiceType | None:
+    def youtube_source(self, info: strawberry.types.Info) -> ServiceType | None:
         if hasattr(self, "_youtube_source") and self._youtube_source:
             return ServiceType(
                 name=self._youtube_source["name"],
@@ -330,20 +281,10 @@ class TrackType:
                 icon_url=self._youtube_source["iconUrl"],
             )
 
-        if not self.youtube_url:
-            return None
-        service = get_service(ServiceName.YOUTUBE)
-        if service:
-            return ServiceType(
-                name=ServiceName.YOUTUBE.value,
-                display_name=service.display_name,
-                url=self.youtube_url,
-                icon_url=service.icon_url,
-            )
-        return None
+        return self._load_source(info, ServiceName.YOUTUBE, self.youtube_url)
 
     @strawberry.field(description="Tracks similar to this track based on audio features")
-    def similar_tracks(self, limit: int = 10) -> list["TrackType"]:
+    def similar_tracks(self, info: strawberry.types.Info, limit: int = 10) -> list["TrackType"]:
         """
         Get tracks similar to this track based on audio features.
 
@@ -354,19 +295,45 @@ class TrackType:
             List of similar tracks, ranked by similarity
         """
         similar_tracks_data = get_similar_tracks(isrc=self.isrc, limit=limit)
+        similar_isrcs = [str(track_data["isrc"]) for track_data in similar_tracks_data]
+        isrc_to_model = get_track_models_by_isrcs(similar_isrcs)
 
         results: list[TrackType] = []
-        for track_data in similar_tracks_data:
-            similar_isrc = str(track_data["isrc"])
+        for similar_isrc in similar_isrcs:
+            django_track = isrc_to_model.get(similar_isrc)
+            if django_track:
+                results.append(TrackType.from_django_model(django_track))
 
-            domain_track = get_track_by_isrc(similar_isrc)
-            if domain_track:
-                django_track = domain_track.to_django_model()
-                track_type = TrackType.from_django_model(django_track)
-                results.append(track_type)
+        # Queue rank lookups for every returned track so their rank fields resolve in one batch
+        genre_name = info.variable_values.get("genre")
+        if genre_name:
+            get_track_loaders(info).enqueue_ranks([track.isrc for track in results], genre_name)
 
         return results
 
+    def _load_rank(self, info: strawberry.types.Info, service_name: ServiceName) -> int | None:
+        """Resolve a playlist position through the request-scoped rank loader."""
+        genre_name = info.variable_values.get("genre")
+        if not genre_name:
+            return None
+        return get_track_loaders(info).load_rank(self.isrc, genre_name, service_name.value)
+
+    def _load_source(
+        self, info: strawberry.types.Info, service_name: ServiceName, url: str | None
+    ) -> ServiceType | None:
+        """Resolve a service source through the request-scoped service loader."""
+        if not url:
+            return None
+        service = get_track_loaders(info).load_service(service_name.value)
+        if service:
+            return ServiceType(
+                name=service_name.value,
+                display_name=service.display_name,
+                url=url,
+                icon_url=service.icon_url,
+            )
+        return None
+
 
 @strawberry.type
 class TrackQuery:
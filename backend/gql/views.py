@@ -0,0 +1,145 @@
+import hashlib
+import json
+import re
+from typing import Any
+
+from core.constants import GraphQLCacheKey
+from core.utils.redis_cache import CachePrefix, redis_cache_get_raw, redis_cache_set_raw
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from strawberry.django.views import GraphQLView
+from strawberry.http import GraphQLRequestData, process_result
+from strawberry.types import ExecutionResult
+
+from backend.gql.persisted_queries import PersistedQueryError, resolve_persisted_query
+
+# Frontend/warming operations whose data only changes when the ETL swaps the cache generation
+CACHEABLE_OPERATIONS = frozenset(
+    {
+        "GetInitialPageData",
+        "GetServicePlaylists",
+        "GetAvailableGenres",
+        "GetPlaylistMetadata",
+        "GetPlaylist",
+        "GetPlaylistRanks",
+        "GetServiceConfigs",
+        "GetIframeConfigs",
+        "GetRankButtonLabels",
+        "GetMiscButtonLabels",
+        "GetStaticConfig",
+    }
+)
+
+OPERATION_NAME_PATTERN = re.compile(r"^\s*query\s+(\w+)")
+
+RESOLVED_QUERY_ATTR = "_graphql_resolved_query"
+RESPONSE_CACHE_KEY_ATTR = "_graphql_response_cache_key"
+RESPONSE_CACHEABLE_ATTR = "_graphql_response_cacheable"
+
+
+def get_graphql_response_cache_key(
+    query: str, variables: dict[str, Any] | None, operation_name: str | None = None
+) -> str | None:
+    """Response cache key for a cacheable operation, or None if the operation must always execute."""
+    operation_name = operation_name or _get_operation_name(query)
+    if operation_name not in CACHEABLE_OPERATIONS:
+        return None
+
+    document_hash = hashlib.sha256(" ".join(query.split()).encode()).hexdigest()
+    canonical_variables = json.dumps(variables or {}, sort_keys=True, separators=(",", ":"))
+    return GraphQLCacheKey.graphql_response(document_hash, operation_name, canonical_variables)
+
+
+def cache_graphql_result(query: str, variables: dict[str, Any] | None, result: ExecutionResult) -> bool:
+    """Store the exact JSON body the GraphQL view would return for a successful cacheable operation."""
+    cache_key = get_graphql_response_cache_key(query, variables)
+    if cache_key is None or result.errors:
+        return False
+
+    redis_cache_set_raw(CachePrefix.GQL_RESPONSE, cache_key, json.dumps(process_result(result)))
+    return True
+
+
+def _get_operation_name(query: str) -> str | None:
+    match = OPERATION_NAME_PATTERN.match(query)
+    return match.group(1) if match else None
+
+
+class CachedGraphQLView(GraphQLView):
+    """GraphQLView with persisted queries and pre-serialized responses for the frontend's fixed queries.
+
+    Requests may send an Apollo APQ sha256 hash instead of the document, over POST or GET.
+    Cache hits return the stored JSON bytes without parsing, validating or resolving anything.
+    Only cache warming stores responses: misses execute normally, since their documents and variables
+    come from the client and storing them would let any client grow the cache.
+    """
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        request_data = self._get_request_data(request)
+        if request_data is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        try:
+            query = resolve_persisted_query(request_data.get("query"), request_data.get("extensions"))
+        except PersistedQueryError as error:
+            return JsonResponse({"errors": [{"message": str(error), "extensions": {"code": error.code}}]})
+
+        if not isinstance(query, str):
+            return super().dispatch(request, *args, **kwargs)
+        setattr(request, RESOLVED_QUERY_ATTR, query)
+
+        cache_key = get_graphql_response_cache_key(
+            query, request_data.get("variables"), request_data.get("operationName")
+        )
+        if cache_key is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        cached_body = redis_cache_get_raw(CachePrefix.GQL_RESPONSE, cache_key)
+        if cached_body is not None:
+            setattr(request, RESPONSE_CACHEABLE_ATTR, True)
+            return HttpResponse(cached_body, content_type="application/json")
+
+        setattr(request, RESPONSE_CACHE_KEY_ATTR, cache_key)
+        return super().dispatch(request, *args, **kwargs)
+
+    def parse_http_body(self, request: Any) -> Any:
+        request_data = super().parse_http_body(request)
+        resolved_query = getattr(request.request, RESOLVED_QUERY_ATTR, None)
+        if resolved_query is not None and isinstance(request_data, GraphQLRequestData):
+            request_data.query = resolved_query
+        return request_data
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        if "extensions" in request.query_params:
+            return False
+        return super().should_render_graphql_ide(request)
+
+    def process_result(self, request: HttpRequest, result: ExecutionResult) -> Any:
+        if hasattr(request, RESPONSE_CACHE_KEY_ATTR) and not result.errors:
+            setattr(request, RESPONSE_CACHEABLE_ATTR, True)
+        return super().process_result(request, result)
+
+    @staticmethod
+    def _get_request_data(request: HttpRequest) -> dict[str, Any] | None:
+        """Read query, variables, operationName and extensions from a JSON POST body or GET params."""
+        try:
+            if request.method == "POST" and "application/json" in request.content_type:
+                data = json.loads(request.body)
+            elif request.method == "GET" and ("query" in request.GET or "extensions" in request.GET):
+                data = request.GET.dict()
+                for field in ("variables", "extensions"):
+                    if data.get(field):
+                        data[field] = json.loads(data[field])
+            else:
+                return None
+        except ValueError:
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        if not isinstance(data.get("query"), (str, type(None))):
+            return None
+        if not isinstance(data.get("variables"), (dict, type(None))):
+            return None
+        if not isinstance(data.get("extensions"), (dict, type(None))):
+            return None
+        return data
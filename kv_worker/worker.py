@@ -1,9 +1,15 @@
+import asyncio
 import json
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlparse
 
 from js import Response
 
+BATCH_GET_PATH = "/batch/get"
+BATCH_PUT_PATH = "/batch/put"
+MAX_BATCH_SIZE = 500
+
 
 def is_put_request(key: str | None, value: str | None) -> bool:
     return key is not None and value is not None
@@ -54,7 +60,63 @@ async def handle_invalid_request() -> Response:
     )
 
 
+async def read_batch(request: Any, field: str) -> list[Any] | None:
+    """Parse a JSON body of the form {field: [...]}; None if it is malformed or too large."""
+    try:
+        body = json.loads(await request.text())
+    except ValueError:
+        return None
+    items = body.get(field) if isinstance(body, dict) else None
+    if not isinstance(items, list) or len(items) > MAX_BATCH_SIZE:
+        return None
+    return items
+
+
+async def handle_batch_get_request(env: Any, keys: list[Any]) -> Response:
+    if not all(isinstance(key, str) for key in keys):
+        return await handle_invalid_batch_request()
+    stored_values = await asyncio.gather(*(env.tunemeld_cache.get(key) for key in keys))
+    values = dict(zip(keys, stored_values, strict=True))
+    found = sum(value is not None for value in stored_values)
+    return create_response(data={"values": values}, message=f"Retrieved {found} of {len(keys)} keys.")
+
+
+async def handle_batch_put_request(env: Any, entries: list[Any]) -> Response:
+    if not all(
+        isinstance(entry, dict) and isinstance(entry.get("key"), str) and isinstance(entry.get("value"), str)
+        for entry in entries
+    ):
+        return await handle_invalid_batch_request()
+    await asyncio.gather(*(env.tunemeld_cache.put(entry["key"], entry["value"]) for entry in entries))
+    return create_response(
+        data={"keys": [entry["key"] for entry in entries]}, message=f"Stored {len(entries)} key-value pairs."
+    )
+
+
+async def handle_invalid_batch_request() -> Response:
+    return create_response(
+        message=(
+            f"Invalid batch request. POST {BATCH_GET_PATH} with {{'keys': [...]}} or {BATCH_PUT_PATH} with "
+            f"{{'entries': [{{'key': ..., 'value': ...}}]}}, at most {MAX_BATCH_SIZE} items."
+        ),
+        status="error",
+        status_code=400,
+    )
+
+
 async def on_fetch(request: Any, env: Any) -> Response:
+    path = urlparse(request.url).path
+    if request.method == "POST" and path == BATCH_GET_PATH:
+        keys = await read_batch(request, "keys")
+        if keys is None:
+            return await handle_invalid_batch_request()
+        return await handle_batch_get_request(env, keys)
+    if request.method == "POST" and path == BATCH_PUT_PATH:
+        entries = await read_batch(request, "entries")
+        if entries is None:
+            return await handle_invalid_batch_request()
+        return await handle_batch_put_request(env, entries)
+
     key = request.query.get("key")
     value = request.query.get("value")
 
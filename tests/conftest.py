@@ -0,0 +1,30 @@
+import os
+import sys
+from pathlib import Path
+
+import django
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(REPO_ROOT), str(REPO_ROOT / "backend")]
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+os.environ.setdefault("DATABASE_URL", "sqlite://:memory:")
+# Lets CloudflareKVCache start without KV credentials
+os.environ.setdefault("CI", "true")
+django.setup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_database():
+    """Test database created from the current models (migrations assume Postgres), shared by django TestCases."""
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    settings.DATABASES["default"]["TEST"] = {"MIGRATE": False}
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    yield
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
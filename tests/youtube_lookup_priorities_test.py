@@ -0,0 +1,52 @@
+from core.constants import ServiceName
+from core.management.commands.playlist_etl_modules.c_track import Command as TrackCommand
+from core.models import GenreModel, PlaylistModel, ServiceModel, ServiceTrackModel
+from django.test import TestCase
+
+
+class YouTubeLookupPrioritiesTest(TestCase):
+    def setUp(self):
+        self.genre = GenreModel.objects.create(name="pop", display_name="Pop", icon_class="fa-pop")
+        self.services = {
+            service: ServiceModel.objects.create(name=service.value, display_name=service.value)
+            for service in (ServiceName.SPOTIFY, ServiceName.APPLE_MUSIC, ServiceName.SOUNDCLOUD, ServiceName.TUNEMELD)
+        }
+        self.positions: dict[ServiceName, int] = {}
+
+    def add_to_playlist(self, service: ServiceName, isrc: str, service_track: ServiceTrackModel | None = None):
+        position = self.positions[service] = self.positions.get(service, 0) + 1
+        if service_track is None:
+            service_track = ServiceTrackModel.objects.create(
+                service=self.services[service],
+                genre=self.genre,
+                position=position,
+                track_name=isrc,
+                artist_name="Artist",
+                service_url=f"https://example.com/{service.value}/{isrc}",
+                isrc=isrc,
+            )
+        PlaylistModel.objects.create(
+            service=self.services[service],
+            genre=self.genre,
+            position=position,
+            isrc=isrc,
+            service_track=service_track,
+        )
+        return service_track
+
+    def test_tunemeld_aggregate_tracks_come_first(self):
+        for service in (ServiceName.SPOTIFY, ServiceName.APPLE_MUSIC, ServiceName.SOUNDCLOUD):
+            self.add_to_playlist(service, "USAAA0000001")
+        self.add_to_playlist(ServiceName.SPOTIFY, "USAAA0000002")
+        # The aggregate step only writes PlaylistModel rows pointing at another service's ServiceTrack
+        aggregated_track = self.add_to_playlist(ServiceName.APPLE_MUSIC, "USAAA0000003")
+        self.add_to_playlist(ServiceName.TUNEMELD, "USAAA0000003", service_track=aggregated_track)
+
+        isrcs = {"USAAA0000001", "USAAA0000002", "USAAA0000003", "USAAA0000004"}
+        priorities = TrackCommand().get_youtube_lookup_priorities(isrcs)
+
+        self.assertEqual(priorities["USAAA0000003"], (False, -1))
+        self.assertEqual(priorities["USAAA0000001"], (True, -3))
+        self.assertNotIn("USAAA0000004", priorities)
+        ordered = sorted(isrcs, key=lambda isrc: (*priorities.get(isrc, (True, 0)), isrc))
+        self.assertEqual(ordered, ["USAAA0000003", "USAAA0000001", "USAAA0000002", "USAAA0000004"])